@@ -1,3 +1,15 @@
-from algebra.complex_numbers import *
-from .polynomials import *
-from .ring_theory import *
+from utils.lazy import lazy_package
+
+# Submodules are imported on first use of one of their names.
+__getattr__, __dir__, __all__ = lazy_package(__name__, [
+    "complex_numbers",
+    "convolution",
+    "ntt",
+    "evaluation",
+    "poly_division",
+    "polynomials",
+    "poly_gcd",
+    "ring_theory",
+    "roots",
+    "sparse_polynomials",
+])
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 class Complex:
     def __init__(self, real: float = 0.0, imag: float = 0.0):
@@ -43,6 +44,163 @@ class Complex:
     def from_polar(r: float, theta: float):
         return Complex(r * math.cos(theta), r * math.sin(theta))
 
+class ComplexArray:
+    """
+    Array-backed counterpart of Complex.
+
+    Stores many complex values in a single complex128 NumPy buffer so that
+    arithmetic runs as whole-array operations instead of one Python object
+    per value. Operands may be another ComplexArray, a Complex, a Python
+    or NumPy scalar, or any array broadcastable against this one.
+    """
+    def __init__(self, real=0.0, imag=None):
+        """
+        real: array-like of real parts, or a complex array-like when imag is None.
+        imag: optional array-like of imaginary parts.
+
+        A complex128 ndarray passed as `real` is wrapped without copying.
+        """
+        if imag is None:
+            self.values = np.asarray(real, dtype=np.complex128)
+        else:
+            self.values = np.empty(np.broadcast(np.asarray(real), np.asarray(imag)).shape,
+                                   dtype=np.complex128)
+            self.values.real = real
+            self.values.imag = imag
+
+    @property
+    def real(self):
+        return self.values.real
+
+    @property
+    def imag(self):
+        return self.values.imag
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        item = self.values[index]
+        if np.ndim(item) == 0:
+            return Complex(float(item.real), float(item.imag))
+        return ComplexArray(item)
+
+    def __setitem__(self, index, value):
+        self.values[index] = ComplexArray._coerce(value)
+
+    def __repr__(self):
+        return f"ComplexArray({self.values!r})"
+
+    @staticmethod
+    def _coerce(other):
+        if isinstance(other, ComplexArray):
+            return other.values
+        if isinstance(other, Complex):
+            return complex(other.real, other.imag)
+        return other
+
+    def __add__(self, other):
+        return ComplexArray(self.values + ComplexArray._coerce(other))
+
+    def __radd__(self, other):
+        return ComplexArray(ComplexArray._coerce(other) + self.values)
+
+    def __sub__(self, other):
+        return ComplexArray(self.values - ComplexArray._coerce(other))
+
+    def __rsub__(self, other):
+        return ComplexArray(ComplexArray._coerce(other) - self.values)
+
+    def __mul__(self, other):
+        return ComplexArray(self.values * ComplexArray._coerce(other))
+
+    def __rmul__(self, other):
+        return ComplexArray(ComplexArray._coerce(other) * self.values)
+
+    def __truediv__(self, other):
+        other = ComplexArray._coerce(other)
+        if np.any(np.asarray(other) == 0):
+            raise ZeroDivisionError("Cannot divide by zero complex number")
+        return ComplexArray(self.values / other)
+
+    def __rtruediv__(self, other):
+        if np.any(self.values == 0):
+            raise ZeroDivisionError("Cannot divide by zero complex number")
+        return ComplexArray(ComplexArray._coerce(other) / self.values)
+
+    def __neg__(self):
+        return ComplexArray(-self.values)
+
+    def __iadd__(self, other):
+        np.add(self.values, ComplexArray._coerce(other), out=self.values)
+        return self
+
+    def __isub__(self, other):
+        np.subtract(self.values, ComplexArray._coerce(other), out=self.values)
+        return self
+
+    def __imul__(self, other):
+        np.multiply(self.values, ComplexArray._coerce(other), out=self.values)
+        return self
+
+    def __itruediv__(self, other):
+        other = ComplexArray._coerce(other)
+        if np.any(np.asarray(other) == 0):
+            raise ZeroDivisionError("Cannot divide by zero complex number")
+        np.divide(self.values, other, out=self.values)
+        return self
+
+    def __eq__(self, other):
+        return np.array_equal(self.values, ComplexArray._coerce(other))
+
+    def conjugate(self, inplace=False):
+        if inplace:
+            np.conjugate(self.values, out=self.values)
+            return self
+        return ComplexArray(np.conjugate(self.values))
+
+    def modulus(self):
+        return np.abs(self.values)
+
+    def argument(self):
+        return np.angle(self.values)
+
+    def polar(self):
+        return (self.modulus(), self.argument())
+
+    @staticmethod
+    def from_polar(r, theta):
+        r = np.asarray(r, dtype=float)
+        theta = np.asarray(theta, dtype=float)
+        return ComplexArray(r * np.cos(theta), r * np.sin(theta))
+
+    @staticmethod
+    def from_complex_list(values):
+        """
+        Build a ComplexArray from a sequence of Complex (or built-in complex) values.
+        """
+        out = np.empty(len(values), dtype=np.complex128)
+        out.real = [z.real for z in values]
+        out.imag = [z.imag for z in values]
+        return ComplexArray(out)
+
+    def to_complex_list(self):
+        """
+        Convert back to a flat list of Complex instances.
+        """
+        flat = self.values.ravel()
+        return [Complex(re, im) for re, im in zip(flat.real.tolist(), flat.imag.tolist())]
+
+    def to_numpy(self):
+        """
+        Return the underlying complex128 buffer (no copy).
+        """
+        return self.values
+
 # Example usage
 if __name__ == "__main__":
     z1 = Complex(3, 4)
@@ -59,3 +217,8 @@ if __name__ == "__main__":
     print("Argument of z1 (radians):", z1.argument())
     print("Polar form of z1:", z1.polar())
     print("From polar (5, π/2):", Complex.from_polar(5, math.pi/2))
+
+    zs = ComplexArray.from_complex_list([z1, z2])
+    print("Array:", zs)
+    print("Array * z2:", zs * z2)
+    print("Array moduli:", zs.modulus())
@@ -0,0 +1,206 @@
+import numpy as np
+
+# Below this operand length the direct (schoolbook) product is fastest.
+SCHOOLBOOK_THRESHOLD = 64
+# Up to this operand length Karatsuba is used; FFT convolution above it.
+KARATSUBA_THRESHOLD = 1024
+
+_EPS = np.finfo(float).eps
+
+
+def schoolbook_convolve(a, b):
+    """
+    Direct O(n*m) convolution of two coefficient arrays.
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros(0, dtype=np.result_type(a, b, float))
+    return np.convolve(a, b)
+
+
+def karatsuba_convolve(a, b, threshold=SCHOOLBOOK_THRESHOLD):
+    """
+    Karatsuba convolution, O(n^1.585).
+
+    Has the same rounding behaviour as the schoolbook product, so it is the
+    preferred method for medium sizes or when every coefficient matters.
+
+    Args:
+        a, b (array-like): Coefficient arrays.
+        threshold (int): Operand length at which recursion switches to the direct product.
+
+    Returns:
+        ndarray: Coefficients of the product, length len(a) + len(b) - 1.
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    if m == 0:
+        return np.zeros(0, dtype=np.result_type(a, b, float))
+    if m <= threshold:
+        return np.convolve(a, b)
+
+    dtype = np.result_type(a, b, float)
+    result = np.zeros(n + m - 1, dtype=dtype)
+
+    # Unbalanced operands: cut the long one into blocks of the short one's length.
+    if n > 2 * m:
+        for start in range(0, n, m):
+            block = karatsuba_convolve(a[start:start + m], b, threshold)
+            result[start:start + len(block)] += block
+        return result
+
+    b = np.concatenate([b, np.zeros(n - m, dtype=b.dtype)])
+    h = n // 2
+    a0, a1 = a[:h], a[h:]
+    b0, b1 = b[:h], b[h:]
+
+    z0 = karatsuba_convolve(a0, b0, threshold)
+    z2 = karatsuba_convolve(a1, b1, threshold)
+    a_sum = a1.astype(dtype, copy=True)
+    a_sum[:h] += a0
+    b_sum = b1.astype(dtype, copy=True)
+    b_sum[:h] += b0
+    z1 = karatsuba_convolve(a_sum, b_sum, threshold)
+    z1[:len(z0)] -= z0
+    z1[:len(z2)] -= z2
+
+    result[:len(z0)] += z0
+    end = min(h + len(z1), len(result))
+    result[h:end] += z1[:end - h]
+    end = min(2 * h + len(z2), len(result))
+    result[2 * h:end] += z2[:end - 2 * h]
+    return result
+
+
+def fft_error_bound(a, b):
+    """
+    Estimate the worst-case absolute error of FFT convolution of a and b.
+
+    Returns 4 * eps * log2(N) * ||a||_2 * ||b||_2. The textbook bound
+    eps * log2(N) * ||a||_2 * ||b||_2 counts a single transform; the factor 4
+    covers the three transforms (two forward, one inverse) plus the rounding
+    of the pointwise product and of the twiddle factors. The result is an
+    upper bound, typically orders of magnitude above the observed error, so
+    comparing it with 0.5 errs towards the exact method.
+    """
+    size = len(a) + len(b) - 1
+    if size <= 0:
+        return 0.0
+    return 4 * _EPS * max(np.log2(size), 1.0) * np.linalg.norm(a) * np.linalg.norm(b)
+
+
+def fft_convolve(a, b, round_integers=True):
+    """
+    FFT convolution, O(n log n).
+
+    For integer-valued inputs the result is rounded back to exact integers
+    when fft_error_bound guarantees every coefficient is within 0.5 of the
+    true value. When it does not, the product is computed exactly with
+    Karatsuba instead, since rounding could then land on the wrong integer.
+
+    Args:
+        a, b (array-like): Coefficient arrays.
+        round_integers (bool): Keep integer-valued products exact as described
+            above; when False the raw floating-point FFT result is returned.
+
+    Returns:
+        ndarray: Coefficients of the product.
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros(0, dtype=np.result_type(a, b, float))
+    size = len(a) + len(b) - 1
+    nfft = 1 << (size - 1).bit_length()
+
+    is_complex = np.iscomplexobj(a) or np.iscomplexobj(b)
+    integer = round_integers and not is_complex and _is_integer_valued(a) and _is_integer_valued(b)
+    if integer and not (_coefficient_bound(a, b) < 2 ** 52 and fft_error_bound(a, b) < 0.5):
+        return _exact_integer_convolve(a, b)
+
+    if is_complex:
+        fa = np.fft.fft(a, nfft)
+        fa *= np.fft.fft(b, nfft)
+        result = np.fft.ifft(fa, nfft)[:size]
+    else:
+        fa = np.fft.rfft(a, nfft)
+        fa *= np.fft.rfft(b, nfft)
+        result = np.fft.irfft(fa, nfft)[:size]
+    return np.rint(result) if integer else result
+
+
+def convolve(a, b, method="auto"):
+    """
+    Multiply two coefficient arrays, choosing the algorithm by size.
+
+    Args:
+        a, b (array-like): Coefficient arrays.
+        method (str): 'auto', 'schoolbook', 'karatsuba' or 'fft'.
+
+    Returns:
+        ndarray: Coefficients of the product.
+    """
+    if method == "auto":
+        method = choose_method(len(a), len(b))
+    if method == "schoolbook":
+        return schoolbook_convolve(a, b)
+    if method == "karatsuba":
+        return karatsuba_convolve(a, b)
+    if method == "fft":
+        return fft_convolve(a, b)
+    raise ValueError(f"Unknown multiplication method: {method}")
+
+
+def choose_method(n, m):
+    """
+    Pick the multiplication algorithm for operands of length n and m.
+    """
+    shorter = min(n, m)
+    if shorter <= SCHOOLBOOK_THRESHOLD:
+        return "schoolbook"
+    if max(n, m) <= KARATSUBA_THRESHOLD:
+        return "karatsuba"
+    return "fft"
+
+
+def _coefficient_bound(a, b):
+    """
+    Bound on every coefficient (and partial sum) of the product of a and b.
+    """
+    return float(np.abs(a).max()) * float(np.abs(b).max()) * min(len(a), len(b))
+
+
+def _exact_integer_convolve(a, b):
+    """
+    Exact product of integer-valued arrays, as floats.
+
+    Below 2^53 every partial sum of the float Karatsuba product is an exactly
+    representable integer; beyond that the product is formed in Python
+    integers and rounded once at the end.
+    """
+    if _coefficient_bound(a, b) < 2 ** 53:
+        return karatsuba_convolve(a.astype(float), b.astype(float))
+    exact = karatsuba_convolve(np.array([int(v) for v in a.tolist()], dtype=object),
+                               np.array([int(v) for v in b.tolist()], dtype=object))
+    return exact.astype(float)
+
+
+def _is_integer_valued(a):
+    return np.issubdtype(a.dtype, np.integer) or bool(np.all(np.mod(a, 1) == 0))
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    a = rng.integers(-9, 10, 3000).astype(float)
+    b = rng.integers(-9, 10, 2000).astype(float)
+    exact = np.convolve(a, b)
+
+    for method in ["schoolbook", "karatsuba", "fft"]:
+        err = np.abs(convolve(a, b, method) - exact).max()
+        print(f"{method:>10}: max error = {err}")
+    print("auto picks:", choose_method(len(a), len(b)))
@@ -0,0 +1,157 @@
+import numpy as np
+from algebra.convolution import convolve
+from algebra.ntt import convolve_mod
+from algebra.poly_division import poly_divmod
+from algebra.polynomials import ModPolynomial, Polynomial
+from algebra.ring_theory import IntegerModRing
+
+# Below this many points a subtree is finished with Horner's rule.
+MULTIPOINT_LEAF_SIZE = 64
+
+
+def _coefficients(poly):
+    if isinstance(poly, Polynomial):
+        return poly.coefficients
+    return np.asarray(poly, dtype=float)
+
+
+def coefficient_matrix(polys):
+    """
+    Stack polynomials into a 2-D coefficient matrix, highest power first.
+
+    Shorter polynomials are left-padded with zeros so every row has the
+    length of the highest-degree one.
+
+    Args:
+        polys (list): Polynomials or coefficient lists.
+
+    Returns:
+        ndarray: Array of shape (len(polys), max_degree + 1).
+    """
+    rows = [_coefficients(p) for p in polys]
+    width = max((len(r) for r in rows), default=0)
+    dtype = np.result_type(float, *rows) if rows else float
+    matrix = np.zeros((len(rows), max(width, 1)), dtype=dtype)
+    for i, row in enumerate(rows):
+        if len(row):
+            matrix[i, -len(row):] = row
+    return matrix
+
+
+def batch_evaluate(coefficients, x):
+    """
+    Evaluate many polynomials on a shared set of points in one Horner pass.
+
+    Args:
+        coefficients (ndarray or list): 2-D coefficient matrix of shape (k, d + 1),
+            highest power first, or a list of Polynomials.
+        x (float or array-like): Evaluation points.
+
+    Returns:
+        ndarray: Values of shape (k,) + shape(x); row i holds polynomial i.
+    """
+    if not isinstance(coefficients, np.ndarray) or coefficients.dtype == object:
+        coefficients = coefficient_matrix(coefficients)
+    coefficients = np.atleast_2d(coefficients)
+    x = np.asarray(x)
+    extra = (1,) * x.ndim
+    result = np.zeros(coefficients.shape[:1] + x.shape, dtype=np.result_type(coefficients, x, float))
+    for column in coefficients.T:
+        result *= x
+        result += column.reshape(column.shape + extra)
+    return result
+
+
+def _multiplier(modulus):
+    if modulus is None:
+        return convolve
+    return lambda a, b: convolve_mod(a, b, modulus)
+
+
+def subproduct_tree(points, modulus=None):
+    """
+    Build the subproduct tree of prod (x - x_i).
+
+    Node i of level j is the product over points[i * 2^j:(i + 1) * 2^j].
+
+    Args:
+        points (array-like): Evaluation points.
+        modulus (int, optional): Build the tree exactly over Z/nZ instead of in floating point.
+
+    Returns:
+        list: Levels from the leaves up; level[j] is a list of coefficient arrays
+        (highest power first), level[-1][0] being the product over all points.
+    """
+    points = np.asarray(points).ravel()
+    multiply = _multiplier(modulus)
+    if modulus is None:
+        leaves = np.stack([np.ones_like(points), -points], axis=1)
+    else:
+        leaves = np.stack([np.ones_like(points), -points % modulus], axis=1)
+    level = list(leaves)
+    tree = [level]
+    while len(level) > 1:
+        level = [multiply(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                 for i in range(0, len(level), 2)]
+        tree.append(level)
+    return tree
+
+
+def multipoint_evaluate(poly, points, leaf_size=MULTIPOINT_LEAF_SIZE):
+    """
+    Evaluate one polynomial at many points.
+
+    A ModPolynomial is evaluated exactly over its ring with a subproduct
+    tree: the polynomial is reduced modulo the node products from the root
+    down, so a degree-n polynomial at n points costs O(n log^2 n) with the
+    NTT multiply, and blocks of at most `leaf_size` points are finished
+    with Horner's rule.
+
+    Floating-point polynomials are evaluated with vectorized Horner
+    instead. The remainder tree is numerically unstable in floating point:
+    real point sets lose all accuracy, and even roots of unity drift well
+    beyond working precision, so no point set can be routed to it safely
+    without checking every value against Horner anyway.
+
+    Args:
+        poly (Polynomial, ModPolynomial or array-like): Polynomial or coefficients,
+            highest power first.
+        points (array-like): 1-D evaluation points.
+        leaf_size (int): Block size below which Horner is used (exact path).
+
+    Returns:
+        ndarray: Values at each point.
+    """
+    points = np.asarray(points).ravel()
+    if not isinstance(poly, ModPolynomial):
+        return batch_evaluate(_coefficients(poly)[None, :], points)[0]
+
+    modulus = poly.ring.modulus
+    coeffs = poly.coefficients
+    points = points.astype(coeffs.dtype) % modulus
+    if len(points) == 0 or len(coeffs) == 0:
+        return np.zeros(len(points), dtype=coeffs.dtype)
+
+    tree = subproduct_tree(points, modulus)
+    stop = min(max(int(leaf_size), 1).bit_length() - 1, len(tree) - 1)
+    remainders = [coeffs]
+    for level in reversed(tree[stop:-1]):
+        remainders = [poly_divmod(remainders[i // 2], node, modulus)[1]
+                      for i, node in enumerate(level)]
+
+    block = 1 << stop
+    return np.concatenate([ModPolynomial(r, poly.ring).evaluate(points[i * block:(i + 1) * block])
+                           for i, r in enumerate(remainders)])
+
+# Example usage
+if __name__ == "__main__":
+    polys = [Polynomial([1, 0, -2]), Polynomial([1, -1]), Polynomial([3])]
+    x = np.linspace(-1, 1, 5)
+    print("Batch evaluation:\n", batch_evaluate(polys, x))
+
+    rng = np.random.default_rng(0)
+    Zp = IntegerModRing(998244353)
+    q = ModPolynomial(rng.integers(0, Zp.modulus, 2000), Zp)
+    xs = rng.integers(0, Zp.modulus, 2000)
+    print("Exact multipoint over Z/pZ matches Horner?",
+          np.array_equal(multipoint_evaluate(q, xs), q.evaluate(xs)))
@@ -0,0 +1,245 @@
+from functools import lru_cache
+
+import numpy as np
+from sympy import isprime, primitive_root
+
+# NTT-friendly primes p = c * 2^k + 1 below 2^30, with a primitive root of each.
+# Products of two residues stay below 2^60, so everything fits in int64.
+NTT_PRIMES = [
+    (167772161, 3),   # 5 * 2^25 + 1
+    (469762049, 3),   # 7 * 2^26 + 1
+    (754974721, 11),  # 45 * 2^24 + 1
+    (998244353, 3),   # 119 * 2^23 + 1
+]
+
+# Largest modulus handled on the int64 path; residues below it multiply
+# without overflow after one reduction.
+INT64_MODULUS_LIMIT = 2 ** 31
+# Below this operand length a direct product beats the transforms.
+SCHOOLBOOK_MOD_THRESHOLD = 64
+
+
+def _two_adicity(p):
+    return ((p - 1) & -(p - 1)).bit_length() - 1
+
+
+@lru_cache(maxsize=None)
+def _root_of(p):
+    for prime, root in NTT_PRIMES:
+        if prime == p:
+            return root
+    return int(primitive_root(p))
+
+
+@lru_cache(maxsize=256)
+def _is_prime(p):
+    return isprime(p)
+
+
+def is_ntt_prime(p, size=1):
+    """
+    Check whether p supports an NTT of the given length on the int64 path.
+
+    Args:
+        p (int): Candidate modulus.
+        size (int): Required transform length (rounded up to a power of two).
+
+    Returns:
+        bool: True if p is a prime below INT64_MODULUS_LIMIT with 2^k | p - 1 for 2^k >= size.
+    """
+    if p < 3 or p >= INT64_MODULUS_LIMIT or not _is_prime(p):
+        return False
+    return (1 << _two_adicity(p)) >= _next_power_of_two(size)
+
+
+def _next_power_of_two(n):
+    return 1 << max(n - 1, 0).bit_length()
+
+
+@lru_cache(maxsize=64)
+def _bit_reverse(n):
+    bits = n.bit_length() - 1
+    idx = np.arange(n, dtype=np.int64)
+    rev = np.zeros(n, dtype=np.int64)
+    for b in range(bits):
+        rev |= ((idx >> b) & 1) << (bits - 1 - b)
+    return rev
+
+
+@lru_cache(maxsize=64)
+def _twiddles(p, n, inverse):
+    """
+    Powers w^0 .. w^(n/2 - 1) of a primitive n-th root of unity mod p.
+    """
+    w = pow(_root_of(p), (p - 1) // n, p)
+    if inverse:
+        w = pow(w, p - 2, p)
+    half = max(n // 2, 1)
+    table = np.ones(half, dtype=np.int64)
+    filled, step = 1, w
+    while filled < half:
+        count = min(filled, half - filled)
+        table[filled:filled + count] = table[:count] * step % p
+        filled += count
+        step = step * step % p
+    return table
+
+
+def ntt(a, p, inverse=False):
+    """
+    Number-theoretic transform of a length-2^k int64 array modulo p.
+
+    Each butterfly stage is one vectorized NumPy operation, so there are
+    only log2(n) Python-level iterations.
+
+    Args:
+        a (ndarray): Residues in [0, p), length a power of two.
+        p (int): NTT-friendly prime.
+        inverse (bool): Compute the inverse transform (including the 1/n factor).
+
+    Returns:
+        ndarray: Transformed int64 array.
+    """
+    n = len(a)
+    if n & (n - 1):
+        raise ValueError("NTT length must be a power of two")
+    if (p - 1) % n:
+        raise ValueError(f"{p} does not support an NTT of length {n}")
+    a = np.asarray(a, dtype=np.int64)[_bit_reverse(n)]
+    table = _twiddles(p, n, inverse)
+    length = 2
+    while length <= n:
+        half = length // 2
+        w = table[::n // length][:half]
+        blocks = a.reshape(-1, length)
+        u = blocks[:, :half].copy()
+        v = blocks[:, half:] * w % p
+        blocks[:, :half] = u + v
+        blocks[:, half:] = u - v
+        a %= p
+        length *= 2
+    if inverse:
+        a = a * pow(n, p - 2, p) % p
+    return a
+
+
+def ntt_convolve(a, b, p):
+    """
+    Exact convolution of residue arrays modulo an NTT-friendly prime p.
+    """
+    square = a is b
+    a = np.asarray(a, dtype=np.int64) % p
+    b = np.asarray(b, dtype=np.int64) % p
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros(0, dtype=np.int64)
+    size = len(a) + len(b) - 1
+    n = _next_power_of_two(size)
+    fa = ntt(np.concatenate([a, np.zeros(n - len(a), dtype=np.int64)]), p)
+    fb = fa if square else ntt(np.concatenate([b, np.zeros(n - len(b), dtype=np.int64)]), p)
+    return ntt(fa * fb % p, p, inverse=True)[:size]
+
+
+def schoolbook_convolve_mod(a, b, modulus):
+    """
+    Direct convolution modulo `modulus`, one vectorized pass per term of the shorter operand.
+    """
+    a = np.asarray(a, dtype=np.int64) % modulus
+    b = np.asarray(b, dtype=np.int64) % modulus
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) == 0:
+        return np.zeros(0, dtype=np.int64)
+    result = np.zeros(len(a) + len(b) - 1, dtype=np.int64)
+    for i, coef in enumerate(b):
+        window = result[i:i + len(a)]
+        window += a * coef % modulus
+        window %= modulus
+    return result
+
+
+def crt_convolve(a, b, modulus):
+    """
+    Exact convolution modulo an arbitrary modulus below INT64_MODULUS_LIMIT.
+
+    The integer product is computed modulo enough NTT primes to bound every
+    coefficient, then recombined with a vectorized Garner step that reduces
+    straight into the target modulus.
+
+    Args:
+        a, b (array-like): Residues in [0, modulus).
+        modulus (int): Target modulus.
+
+    Returns:
+        ndarray: int64 coefficients of the product modulo `modulus`.
+    """
+    a = np.asarray(a, dtype=np.int64) % modulus
+    b = np.asarray(b, dtype=np.int64) % modulus
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    bound = min(len(a), len(b)) * (modulus - 1) ** 2
+    primes, product = [], 1
+    for p, _ in NTT_PRIMES:
+        primes.append(p)
+        product *= p
+        if product > bound:
+            break
+    else:
+        raise ValueError("Product too large for the available NTT primes")
+
+    residues = [ntt_convolve(a, b, p) for p in primes]
+
+    # Garner: x = c0 + c1*m0 + c2*m0*m1 + ...  with 0 <= ci < mi.
+    digits = []
+    for i, p in enumerate(primes):
+        acc = np.zeros_like(residues[i])
+        weight = 1
+        for j in range(i):
+            acc = (acc + digits[j] * (weight % p)) % p
+            weight *= primes[j]
+        inv = pow(weight % p, p - 2, p)
+        digits.append((residues[i] - acc) % p * inv % p)
+
+    result = np.zeros_like(residues[0])
+    weight = 1
+    for digit, p in zip(digits, primes):
+        result = (result + digit % modulus * (weight % modulus)) % modulus
+        weight *= p
+    return result
+
+
+def convolve_mod(a, b, modulus):
+    """
+    Exact convolution of coefficient arrays modulo `modulus`.
+
+    Short operands use the direct product. Otherwise this is a single NTT
+    when the modulus is an NTT-friendly prime, CRT over
+    several NTT primes for other moduli below INT64_MODULUS_LIMIT, and an
+    object-array product for larger moduli.
+    """
+    size = len(a) + len(b) - 1
+    if modulus >= INT64_MODULUS_LIMIT:
+        a = np.asarray(a, dtype=object) % modulus
+        b = np.asarray(b, dtype=object) % modulus
+        if len(a) == 0 or len(b) == 0:
+            return np.zeros(0, dtype=object)
+        return np.convolve(a, b) % modulus
+    if modulus == 1:
+        return np.zeros(max(size, 0), dtype=np.int64)
+    if min(len(a), len(b)) <= SCHOOLBOOK_MOD_THRESHOLD:
+        return schoolbook_convolve_mod(a, b, modulus)
+    if is_ntt_prime(modulus, size):
+        return ntt_convolve(a, b, modulus)
+    return crt_convolve(a, b, modulus)
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 1000, 50)
+    b = rng.integers(0, 1000, 40)
+    exact = np.convolve(a.astype(object), b.astype(object))
+
+    for m in [998244353, 1000000007, 12]:
+        ok = np.array_equal(convolve_mod(a, b, m), exact % m)
+        print(f"mod {m}: matches exact product? {ok}")
@@ -0,0 +1,131 @@
+import numpy as np
+from algebra.convolution import convolve
+from algebra.ntt import convolve_mod
+
+# Quotients longer than this are computed with a Newton reciprocal
+# instead of term-by-term long division.
+NEWTON_DIVISION_THRESHOLD = 64
+
+
+def _multiplier(modulus):
+    if modulus is None:
+        return convolve
+    return lambda a, b: convolve_mod(a, b, modulus)
+
+
+def series_inverse(h, k, modulus=None):
+    """
+    Power series inverse of h modulo x^k by Newton iteration.
+
+    Each step doubles the number of correct terms, y <- 2y - h*y^2, so the
+    whole inverse costs a constant number of multiplications of size k.
+
+    Args:
+        h (ndarray): Series coefficients, constant term first; h[0] must be invertible.
+        k (int): Number of terms wanted.
+        modulus (int, optional): Work exactly over Z/nZ instead of in floating point.
+
+    Returns:
+        ndarray: First k coefficients of 1/h.
+    """
+    multiply = _multiplier(modulus)
+    if len(h) < k:
+        h = np.concatenate([h, np.zeros(k - len(h), dtype=h.dtype)])
+    if modulus is None:
+        y = np.array([1.0 / h[0]])
+    else:
+        y = np.array([pow(int(h[0]), -1, modulus)], dtype=h.dtype)
+    precision = 1
+    while precision < k:
+        precision = min(2 * precision, k)
+        hy = multiply(h[:precision], y)[:precision]
+        correction = multiply(y, hy)[:precision]
+        y = np.concatenate([y, np.zeros(precision - len(y), dtype=y.dtype)])
+        y = 2 * y - correction
+        if modulus is not None:
+            y %= modulus
+    return y[:k]
+
+
+def _long_divmod_mod(f, g, modulus):
+    inv = pow(int(g[0]), -1, modulus)
+    r = f.copy()
+    k = len(f) - len(g) + 1
+    q = np.zeros(k, dtype=f.dtype)
+    for i in range(k):
+        coef = r[i] * inv % modulus
+        q[i] = coef
+        if coef:
+            window = r[i:i + len(g)]
+            window -= g * coef % modulus
+            window %= modulus
+    return q, r[k:]
+
+
+def poly_divmod(f, g, modulus=None, threshold=NEWTON_DIVISION_THRESHOLD):
+    """
+    Polynomial division with remainder on coefficient arrays.
+
+    Short quotients use long division. Longer ones read the arrays in
+    reverse, rev(q) = rev(f) / rev(g) mod x^(deg f - deg g + 1), and get
+    the reciprocal from `series_inverse`, so the cost is that of a few fast
+    multiplications.
+
+    Args:
+        f, g (array-like): Dividend and divisor, highest power first.
+        modulus (int, optional): Divide exactly over Z/nZ; the leading coefficient
+            of g must then be a unit.
+        threshold (int): Quotient length above which Newton division is used.
+
+    Returns:
+        tuple: (quotient, remainder) coefficient arrays, highest power first.
+    """
+    if modulus is None:
+        f = np.asarray(f, dtype=np.result_type(f, float))
+        g = np.asarray(g, dtype=np.result_type(g, float))
+    else:
+        f = np.asarray(f) % modulus
+        g = np.asarray(g) % modulus
+    if len(g) and not g[0]:
+        nonzero = np.flatnonzero(g)
+        g = g[nonzero[0]:] if len(nonzero) else g[:0]
+    if len(g) == 0:
+        raise ZeroDivisionError("Cannot divide by the zero polynomial")
+    n, m = len(f) - 1, len(g) - 1
+    if n < m:
+        return f[:0], f
+    k = n - m + 1
+
+    if k <= threshold:
+        if modulus is None:
+            return np.polydiv(f, g)
+        return _long_divmod_mod(f, g, modulus)
+
+    multiply = _multiplier(modulus)
+    # A highest-first array read constant-term-first is the reversed polynomial.
+    q = multiply(f[:k], series_inverse(g, k, modulus))[:k]
+    if modulus is not None:
+        q %= modulus
+    r = f[k:] - multiply(q, g)[k:] if m > 0 else f[:0]
+    if modulus is not None:
+        r %= modulus
+    return q, r
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    f = rng.standard_normal(3000)
+    g = rng.standard_normal(1000)
+    g[0] = 50.0  # keep the roots of g inside the unit disk so division is well conditioned
+    q, r = poly_divmod(f, g)
+    q_ref, r_ref = np.polydiv(f, g)
+    print("Quotient error vs np.polydiv:", np.abs(q - q_ref).max())
+    print("Remainder error vs np.polydiv:", np.abs(r - r_ref[-len(r):]).max())
+
+    p = 998244353
+    f = rng.integers(0, p, 3000)
+    g = rng.integers(1, p, 1000)
+    q, r = poly_divmod(f, g, p)
+    check = (convolve_mod(q, g, p)[-len(f):] + np.concatenate([np.zeros(len(f) - len(r), dtype=np.int64), r])) % p
+    print("Exact division over Z/pZ reconstructs f?", np.array_equal(check, f))
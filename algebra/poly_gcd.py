@@ -0,0 +1,383 @@
+from fractions import Fraction
+from math import gcd, lcm
+
+import numpy as np
+from sympy import prevprime
+from algebra.ntt import convolve_mod
+from algebra.poly_division import poly_divmod
+from algebra.polynomials import ModPolynomial, Polynomial
+
+# Below this degree half-GCD recursion gives way to plain Euclidean steps.
+HALF_GCD_THRESHOLD = 64
+# Moduli of the multi-modular rational GCD are primes just below this, so the
+# modular work runs on the int64 path of convolve_mod.
+GCD_PRIME_LIMIT = 2 ** 31
+
+
+# Exact path over Z/pZ: half-GCD on int64 coefficient arrays (highest power first)
+
+def _trim(a):
+    if len(a) == 0 or a[0]:
+        return a
+    nonzero = np.flatnonzero(a)
+    return a[nonzero[0]:] if len(nonzero) else a[:0]
+
+
+def _deg(a):
+    return len(a) - 1
+
+
+def _mul(a, b, p):
+    if len(a) == 0 or len(b) == 0:
+        return a[:0]
+    return _trim(convolve_mod(a, b, p))
+
+
+def _add(a, b, p):
+    return _trim(np.polyadd(a, b) % p) if len(a) and len(b) else (a if len(a) else b)
+
+
+def _identity(dtype):
+    one = np.ones(1, dtype=dtype)
+    zero = np.zeros(0, dtype=dtype)
+    return (one, zero, zero, one)
+
+
+def _mat_mul(M, N, p):
+    return (_add(_mul(M[0], N[0], p), _mul(M[1], N[2], p), p),
+            _add(_mul(M[0], N[1], p), _mul(M[1], N[3], p), p),
+            _add(_mul(M[2], N[0], p), _mul(M[3], N[2], p), p),
+            _add(_mul(M[2], N[1], p), _mul(M[3], N[3], p), p))
+
+
+def _apply(M, a, b, p):
+    return (_add(_mul(M[0], a, p), _mul(M[1], b, p), p),
+            _add(_mul(M[2], a, p), _mul(M[3], b, p), p))
+
+
+def _sub(a, b, p):
+    if len(b) == 0:
+        return a
+    return _trim(np.polysub(a, b) % p) if len(a) else _trim(-b % p)
+
+
+def _euclid_step(a, b, M, p):
+    """
+    One division step a = q*b + r: returns (b, r) and [[0, 1], [1, -q]] @ M.
+
+    Pass M=None when only the remainder sequence is needed.
+    """
+    q, r = poly_divmod(a, b, p)
+    if M is None:
+        return (b, _trim(r)), None
+    q = _trim(q)
+    M = (M[2], M[3], _sub(M[0], _mul(q, M[2], p), p), _sub(M[1], _mul(q, M[3], p), p))
+    return (b, _trim(r)), M
+
+
+def half_gcd(a, b, p):
+    """
+    Half-GCD matrix of (a, b) over Z/pZ.
+
+    Returns a 2x2 polynomial matrix M (as a tuple m00, m01, m10, m11) such
+    that M @ (a, b) is a pair of consecutive Euclidean remainders (c, d)
+    with deg c >= ceil(deg a / 2) > deg d. Recursing on the top halves of
+    the inputs gives O(M(n) log n) work instead of the O(n^2) of Euclid.
+
+    Args:
+        a, b (ndarray): Trimmed int64 coefficients, highest power first, deg a > deg b.
+        p (int): Prime modulus.
+
+    Returns:
+        tuple: Matrix entries (m00, m01, m10, m11).
+    """
+    m = (_deg(a) + 1) // 2
+    M = _identity(a.dtype)
+    if _deg(b) < m:
+        return M
+
+    if _deg(a) < HALF_GCD_THRESHOLD:
+        while _deg(b) >= m:
+            (a, b), M = _euclid_step(a, b, M, p)
+        return M
+
+    R = half_gcd(a[:len(a) - m], b[:len(b) - m], p)
+    a, b = _apply(R, a, b, p)
+    if _deg(b) < m:
+        return R
+
+    (a, b), R = _euclid_step(a, b, R, p)
+    k = 2 * m - _deg(a)
+    S = half_gcd(a[:len(a) - k], b[:max(len(b) - k, 0)], p)
+    return _mat_mul(S, R, p)
+
+
+def _gcd_matrix(a, b, M, p):
+    while len(b):
+        if _deg(a) >= HALF_GCD_THRESHOLD:
+            H = half_gcd(a, b, p)
+            a, b = _apply(H, a, b, p)
+            M = _mat_mul(H, M, p)
+            if len(b) == 0:
+                break
+        (a, b), M = _euclid_step(a, b, M, p)
+    return M, a
+
+
+def _mod_xgcd(a, b):
+    ring = a.ring
+    p = ring.modulus
+    f, g = a.coefficients, b.coefficients
+    swapped = _deg(f) < _deg(g)
+    if swapped:
+        f, g = g, f
+    if len(f) == 0:
+        zero = ModPolynomial([], ring)
+        return zero, zero, zero
+    M = _identity(f.dtype)
+    if _deg(f) == _deg(g):
+        # Make deg f > deg g with one division step.
+        (f, g), M = _euclid_step(f, g, M, p)
+    M, d = _gcd_matrix(f, g, M, p)
+    inv = pow(int(d[0]), -1, p)
+    s, t = M[0] * inv % p, M[1] * inv % p
+    if swapped:
+        s, t = t, s
+    return ModPolynomial(d * inv % p, ring), ModPolynomial(s, ring), ModPolynomial(t, ring)
+
+
+# Floating-point path: Euclid with tolerance-based remainder trimming
+
+def _float_xgcd(f, g, tol):
+    swapped = len(f) < len(g)
+    if swapped:
+        f, g = g, f
+    scale = max(np.abs(f).max(initial=0.0), 1.0)
+    s0, t0 = np.array([1.0]), np.array([0.0])
+    s1, t1 = np.array([0.0]), np.array([1.0])
+    while len(g):
+        q, r = poly_divmod(f, g)
+        # Treat remainder coefficients at noise level as exact zeros.
+        keep = np.flatnonzero(np.abs(r) > tol * scale)
+        r = r[keep[0]:] if len(keep) else r[:0]
+        s0, s1 = s1, np.polysub(s0, np.polymul(q, s1))
+        t0, t1 = t1, np.polysub(t0, np.polymul(q, t1))
+        f, g = g, r
+        if len(g):
+            # Keep the remainders monic so their size does not drift.
+            lead = g[0]
+            g, s1, t1 = g / lead, s1 / lead, t1 / lead
+    if len(f) == 0:
+        return f, f, f
+    lead = f[0]
+    s0, t0 = s0 / lead, t0 / lead
+    if swapped:
+        s0, t0 = t0, s0
+    return f / lead, s0, t0
+
+
+# Exact rational path: Euclid on lists of Fractions (highest power first)
+
+def _fraction_trim(a):
+    i = 0
+    while i < len(a) and a[i] == 0:
+        i += 1
+    return a[i:]
+
+
+def _fraction_sub(a, b):
+    n = max(len(a), len(b))
+    a = [Fraction(0)] * (n - len(a)) + a
+    b = [Fraction(0)] * (n - len(b)) + b
+    return _fraction_trim([x - y for x, y in zip(a, b)])
+
+
+def _fraction_mul(a, b):
+    if not a or not b:
+        return []
+    out = [Fraction(0)] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return _fraction_trim(out)
+
+
+def _fraction_divmod(f, g):
+    r = list(f)
+    k = len(f) - len(g) + 1
+    if k <= 0:
+        return [], r
+    q = []
+    for i in range(k):
+        coef = r[i] / g[0]
+        q.append(coef)
+        if coef:
+            for j in range(1, len(g)):
+                r[i + j] -= coef * g[j]
+    return _fraction_trim(q), _fraction_trim(r[k:])
+
+
+def _rational_xgcd(f, g):
+    s0, t0, s1, t1 = [Fraction(1)], [], [], [Fraction(1)]
+    while g:
+        q, r = _fraction_divmod(f, g)
+        f, g = g, r
+        s0, s1 = s1, _fraction_sub(s0, _fraction_mul(q, s1))
+        t0, t1 = t1, _fraction_sub(t0, _fraction_mul(q, t1))
+    if not f:
+        return [], [], []
+    lead = f[0]
+    return [c / lead for c in f], [c / lead for c in s0], [c / lead for c in t0]
+
+
+# Multi-modular rational path: GCDs modulo word-sized primes, combined by CRT
+
+def _primitive(coeffs):
+    """
+    Integer coefficients of a rational polynomial, scaled to content 1.
+    """
+    scale = lcm(*(c.denominator for c in coeffs))
+    ints = [int(c * scale) for c in coeffs]
+    content = gcd(*ints)
+    return [c // content for c in ints]
+
+
+def _mod_gcd(f, g, p):
+    ring_f = ModPolynomial([c % p for c in f], p)
+    return poly_gcd(ring_f, ModPolynomial([c % p for c in g], p)).coefficients
+
+
+def _divides(h, f):
+    return not _fraction_divmod([Fraction(c) for c in f], [Fraction(c) for c in h])[1]
+
+
+def _modular_gcd(f, g):
+    """
+    Monic GCD of two non-zero rational polynomials.
+
+    Euclid over the rationals suffers coefficient explosion, so the GCD is
+    computed modulo word-sized primes with the fast half-GCD, scaled by
+    gcd(lc f, lc g) so every image has the same normalization, and the
+    images are combined by CRT until the result divides both inputs.
+    Primes whose image has too high a degree are unlucky and skipped.
+    """
+    f, g = _primitive(f), _primitive(g)
+    gamma = gcd(f[0], g[0])
+    limit = 2 * gamma * max(max(abs(c) for c in f), max(abs(c) for c in g))
+    p = GCD_PRIME_LIMIT
+    image, modulus, previous = None, 1, None
+    while True:
+        p = prevprime(p)
+        if gamma % p == 0:
+            continue
+        h = _mod_gcd(f, g, p)
+        if len(h) == 1:
+            return [Fraction(1)]
+        h = [int(c) * gamma % p for c in h]
+        if image is None or len(h) < len(image):
+            image, modulus, previous = h, p, None
+            continue
+        if len(h) > len(image):
+            continue
+        inverse = pow(modulus, -1, p)
+        image = [a + modulus * ((b - a) * inverse % p) for a, b in zip(image, h)]
+        modulus *= p
+        candidate = [c - modulus if c > modulus // 2 else c for c in image]
+        # Test only once the CRT image stops changing or has enough bits for
+        # Mignotte-size coefficients; a failed test just means more primes.
+        if candidate == previous or modulus > limit ** 2:
+            if _divides(candidate, f) and _divides(candidate, g):
+                return [Fraction(c, candidate[0]) for c in candidate]
+        previous = candidate
+
+
+# Public API
+
+def poly_xgcd(a, b, tol=1e-10):
+    """
+    Extended GCD of two polynomials: returns (g, s, t) with s*a + t*b = g, g monic.
+
+    The path depends on the input type:
+      - ModPolynomial: exact over Z/pZ (p prime), half-GCD above HALF_GCD_THRESHOLD.
+      - Polynomial: floating-point Euclid; remainder coefficients below
+        tol * max|coefficient| are treated as zero.
+      - Lists of ints or Fractions (highest power first): exact over the
+        rationals. The cofactors come from plain Euclid on Fractions, which
+        is quadratic with growing coefficients; poly_gcd uses a much faster
+        multi-modular algorithm when only the GCD is needed.
+
+    Args:
+        a, b: Polynomials of the same kind.
+        tol (float): Relative zero threshold for the floating-point path.
+
+    Returns:
+        tuple: (g, s, t) of the same kind as the inputs.
+    """
+    if isinstance(a, ModPolynomial):
+        a._check_ring(b)
+        return _mod_xgcd(a, b)
+    if isinstance(a, Polynomial):
+        g, s, t = _float_xgcd(a.coefficients, b.coefficients, tol)
+        return Polynomial(g), Polynomial(s), Polynomial(t)
+    f = _fraction_trim([Fraction(c) for c in a])
+    g = _fraction_trim([Fraction(c) for c in b])
+    return _rational_xgcd(f, g)
+
+
+def poly_gcd(a, b, tol=1e-10):
+    """
+    Monic greatest common divisor of two polynomials.
+
+    See `poly_xgcd` for how the input type selects the exact or floating-point
+    path. Rational input (lists of ints or Fractions) is handled by a
+    multi-modular GCD: half-GCD modulo word-sized primes, recombined by CRT
+    and verified by trial division.
+    """
+    if isinstance(a, ModPolynomial):
+        a._check_ring(b)
+        p = a.ring.modulus
+        f, g = a.coefficients, b.coefficients
+        if _deg(f) < _deg(g):
+            f, g = g, f
+        if len(f) == 0:
+            return ModPolynomial([], a.ring)
+        if _deg(f) == _deg(g):
+            (f, g), _ = _euclid_step(f, g, None, p)
+        while len(g):
+            if _deg(f) >= HALF_GCD_THRESHOLD:
+                f, g = _apply(half_gcd(f, g, p), f, g, p)
+                if len(g) == 0:
+                    break
+            (f, g), _ = _euclid_step(f, g, None, p)
+        return ModPolynomial(f * pow(int(f[0]), -1, p) % p, a.ring)
+    if isinstance(a, Polynomial):
+        return poly_xgcd(a, b, tol)[0]
+    f = _fraction_trim([Fraction(c) for c in a])
+    g = _fraction_trim([Fraction(c) for c in b])
+    if not f or not g:
+        h = f or g
+        return [c / h[0] for c in h]
+    return _modular_gcd(f, g)
+
+
+# Example usage
+if __name__ == "__main__":
+    from algebra.ring_theory import IntegerModRing
+
+    p1 = Polynomial([1, 0, -1])      # x^2 - 1
+    p2 = Polynomial([1, -3, 2])      # x^2 - 3x + 2
+    g, s, t = poly_xgcd(p1, p2)
+    print("gcd(x^2 - 1, x^2 - 3x + 2):", g)
+    print("Bezout check:", s.multiply(p1).add(t.multiply(p2)))
+
+    print("Rational gcd:", poly_gcd([2, 0, -2], [3, -9, 6]))
+
+    Zp = IntegerModRing(998244353)
+    rng = np.random.default_rng(0)
+    common = ModPolynomial(rng.integers(0, Zp.modulus, 300), Zp)
+    a = common.multiply(ModPolynomial(rng.integers(0, Zp.modulus, 500), Zp))
+    b = common.multiply(ModPolynomial(rng.integers(0, Zp.modulus, 400), Zp))
+    g, s, t = poly_xgcd(a, b)
+    print("Half-GCD degree over Z/pZ:", g.degree(), "(expected 299)")
+    print("Bezout holds over Z/pZ?", s.multiply(a).add(t.multiply(b)) == g)
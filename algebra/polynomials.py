@@ -1,4 +1,13 @@
 import numpy as np
+from algebra.convolution import convolve
+from algebra.ntt import convolve_mod, INT64_MODULUS_LIMIT
+from algebra.poly_division import poly_divmod
+from algebra.ring_theory import IntegerModRing
+from algebra.roots import batch_roots
+
+def _dense(poly):
+    # SparsePolynomial (which imports this module) converts itself.
+    return poly.to_dense() if hasattr(poly, "to_dense") else poly
 
 class Polynomial:
     def __init__(self, coefficients):
@@ -11,11 +20,9 @@ class Polynomial:
     def __str__(self):
         terms = []
         degree = len(self.coefficients) - 1
-        for i, coef in enumerate(self.coefficients):
-            power = degree - i
-            if coef == 0:
-                continue
-            elif power == 0:
+        for i in np.flatnonzero(self.coefficients):
+            coef, power = self.coefficients[i], degree - i
+            if power == 0:
                 terms.append(f"{coef:.2f}")
             elif power == 1:
                 terms.append(f"{coef:.2f}x")
@@ -26,6 +33,16 @@ class Polynomial:
     def evaluate(self, x):
         return np.polyval(self.coefficients, x)
 
+    def roots(self, method="aberth"):
+        """
+        Complex roots via simultaneous (Aberth or Durand-Kerner) iteration,
+        falling back to the companion matrix if the iteration does not settle.
+        """
+        if len(self.coefficients) < 2:
+            return np.zeros(0, dtype=complex)
+        roots, _, _ = batch_roots(self.coefficients[None, :], method)
+        return roots[0]
+
     def derivative(self):
         deriv_coeffs = np.polyder(self.coefficients)
         return Polynomial(deriv_coeffs)
@@ -36,19 +53,147 @@ class Polynomial:
         return Polynomial(integ_coeffs)
 
     def add(self, other):
-        return Polynomial(np.polyadd(self.coefficients, other.coefficients))
+        return Polynomial(np.polyadd(self.coefficients, _dense(other).coefficients))
 
     def subtract(self, other):
-        return Polynomial(np.polysub(self.coefficients, other.coefficients))
+        return Polynomial(np.polysub(self.coefficients, _dense(other).coefficients))
 
-    def multiply(self, other):
-        return Polynomial(np.polymul(self.coefficients, other.coefficients))
+    def multiply(self, other, method="auto"):
+        """
+        method: 'auto' (size-based), 'schoolbook', 'karatsuba' or 'fft'.
+        `other` may also be a SparsePolynomial, as for add, subtract and divide.
+        """
+        return Polynomial(convolve(self.coefficients, _dense(other).coefficients, method))
+
+    def power(self, k, method="auto"):
+        """
+        Raise the polynomial to a non-negative integer power by repeated squaring.
+        """
+        if k < 0 or int(k) != k:
+            raise ValueError("Exponent must be a non-negative integer")
+        result = Polynomial([1])
+        base = self
+        k = int(k)
+        while k:
+            if k & 1:
+                result = result.multiply(base, method)
+            k >>= 1
+            if k:
+                base = base.multiply(base, method)
+        return result
 
     def divide(self, other):
-        quotient, remainder = np.polydiv(self.coefficients, other.coefficients)
+        """
+        Long division for short quotients, Newton reciprocal division for long ones.
+        """
+        quotient, remainder = poly_divmod(self.coefficients, _dense(other).coefficients)
         return Polynomial(quotient), Polynomial(remainder)
 
 
+class ModPolynomial:
+    def __init__(self, coefficients, ring):
+        """
+        coefficients: list or numpy array of integer coefficients, highest power first.
+        ring: IntegerModRing the coefficients live in.
+
+        Coefficients are stored reduced modulo ring.modulus as int64 (or as
+        Python ints in an object array for moduli of 2^31 and above).
+        """
+        if not isinstance(ring, IntegerModRing):
+            ring = IntegerModRing(ring)
+        self.ring = ring
+        dtype = np.int64 if ring.modulus < INT64_MODULUS_LIMIT else object
+        coeffs = np.array(coefficients, dtype=dtype).ravel()
+        if dtype is np.int64:
+            coeffs %= ring.modulus
+        else:
+            coeffs = coeffs % ring.modulus
+        self.coefficients = np.trim_zeros(coeffs, 'f')
+
+    def _check_ring(self, other):
+        if self.ring != other.ring:
+            raise ValueError("Polynomials must have coefficients in the same ring")
+
+    def degree(self):
+        return len(self.coefficients) - 1
+
+    def __str__(self):
+        terms = []
+        degree = self.degree()
+        for i in np.flatnonzero(self.coefficients):
+            coef, power = self.coefficients[i], degree - i
+            if power == 0:
+                terms.append(f"{coef}")
+            elif power == 1:
+                terms.append(f"{coef}x")
+            else:
+                terms.append(f"{coef}x^{power}")
+        return (" + ".join(terms) or "0") + f" over {self.ring.name}"
+
+    def __eq__(self, other):
+        return (isinstance(other, ModPolynomial) and self.ring == other.ring
+                and np.array_equal(self.coefficients, other.coefficients))
+
+    def evaluate(self, x):
+        """
+        Evaluate at a point or an array of points by Horner's rule modulo n.
+        """
+        n = self.ring.modulus
+        x = np.asarray(x, dtype=self.coefficients.dtype) % n
+        result = np.zeros_like(x)
+        for coef in self.coefficients:
+            result = (result * x + coef) % n
+        return result
+
+    def derivative(self):
+        degree = self.degree()
+        if degree <= 0:
+            return ModPolynomial([], self.ring)
+        powers = np.arange(degree, 0, -1, dtype=self.coefficients.dtype) % self.ring.modulus
+        return ModPolynomial(self.coefficients[:-1] * powers, self.ring)
+
+    def add(self, other):
+        self._check_ring(other)
+        return ModPolynomial(np.polyadd(self.coefficients, other.coefficients), self.ring)
+
+    def subtract(self, other):
+        self._check_ring(other)
+        return ModPolynomial(np.polysub(self.coefficients, other.coefficients), self.ring)
+
+    def multiply(self, other):
+        """
+        Exact product via NTT (NTT-friendly prime modulus) or multi-prime CRT.
+        """
+        self._check_ring(other)
+        return ModPolynomial(convolve_mod(self.coefficients, other.coefficients,
+                                          self.ring.modulus), self.ring)
+
+    def divide(self, other):
+        """
+        Exact division with remainder; the divisor's leading coefficient must be a unit.
+        """
+        self._check_ring(other)
+        quotient, remainder = poly_divmod(self.coefficients, other.coefficients, self.ring.modulus)
+        return ModPolynomial(quotient, self.ring), ModPolynomial(remainder, self.ring)
+
+    def power(self, k):
+        """
+        Raise the polynomial to a non-negative integer power by repeated squaring.
+        """
+        if k < 0 or int(k) != k:
+            raise ValueError("Exponent must be a non-negative integer")
+        result = ModPolynomial([1], self.ring)
+        base = self
+        k = int(k)
+        while k:
+            if k & 1:
+                result = result.multiply(base)
+            k >>= 1
+            if k:
+                base = base.multiply(base)
+        return result
+
+
 # Example usage
 if __name__ == "__main__":
     p1 = Polynomial([1, 0, -2])  # x^2 - 2
@@ -59,8 +204,16 @@ if __name__ == "__main__":
     print("P1 + P2:", p1.add(p2))
     print("P1 - P2:", p1.subtract(p2))
     print("P1 * P2:", p1.multiply(p2))
+    print("P2^3:", p2.power(3))
     q, r = p1.divide(p2)
     print("P1 / P2:", q, "Remainder:", r)
     print("P1 evaluated at x=2:", p1.evaluate(2))
+    print("P1 roots:", p1.roots())
     print("P1 derivative:", p1.derivative())
-    print("P1 integral:", p1.integrate())
\ No newline at end of file
+    print("P1 integral:", p1.integrate())
+
+    Z7 = IntegerModRing(7)
+    m1 = ModPolynomial([1, 0, -2], Z7)
+    m2 = ModPolynomial([1, -1], Z7)
+    print("M1 * M2 over Z/7Z:", m1.multiply(m2))
+    print("M2^7 over Z/7Z:", m2.power(7))
\ No newline at end of file
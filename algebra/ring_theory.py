@@ -1,3 +1,22 @@
+from functools import cached_property, lru_cache
+from itertools import combinations
+from math import gcd
+
+import numpy as np
+from sympy import factorint, primitive_root
+
+# Residues below this multiply directly in int64 (products stay under 2^62).
+DIRECT_REDUCTION_LIMIT = 2 ** 31
+# Largest modulus kept in int64 arrays; Barrett reduction covers the range above
+# DIRECT_REDUCTION_LIMIT, and larger moduli fall back to object arrays.
+INT64_ARRAY_LIMIT = 2 ** 62
+
+# Largest modulus for which whole-ring tables (units, inverses, ...) are built.
+STRUCTURE_TABLE_LIMIT = 10 ** 8
+
+_LOW32 = np.uint64(0xFFFFFFFF)
+
+
 class RingElement:
     def __init__(self, value, ring):
         self.value = value
@@ -25,6 +44,21 @@ class RingElement:
     def __repr__(self):
         return f"{self.value} in {self.ring.name}"
 
+    def is_unit(self):
+        return self.ring.is_unit(self.value)
+
+    def inverse(self):
+        return RingElement(self.ring.inverse(self.value), self.ring)
+
+    def is_zero_divisor(self):
+        return self.ring.structure.is_zero_divisor(self.value)
+
+    def is_nilpotent(self):
+        return self.ring.structure.is_nilpotent(self.value)
+
+    def is_idempotent(self):
+        return self.ring.mul(self.value, self.value) == self.value % self.ring.modulus
+
 
 class IntegerModRing:
     def __init__(self, modulus):
@@ -42,6 +76,31 @@ class IntegerModRing:
     def neg(self, a):
         return (-a) % self.modulus
 
+    def array(self, values):
+        """
+        Wrap many residues of this ring in a ZnArray.
+        """
+        return ZnArray(values, self)
+
+    @property
+    def structure(self):
+        """
+        Lazily built structure data, shared by every ring (and element) with this modulus.
+        """
+        return ring_structure(self.modulus)
+
+    def is_field(self):
+        return self.structure.is_field
+
+    def is_integral_domain(self):
+        return self.structure.is_integral_domain
+
+    def is_unit(self, a):
+        return self.structure.is_unit(a)
+
+    def inverse(self, a):
+        return self.structure.inverse(a)
+
     def __eq__(self, other):
         return isinstance(other, IntegerModRing) and self.modulus == other.modulus
 
@@ -49,6 +108,368 @@ class IntegerModRing:
         return self.name
 
 
+def _mul_wide(a, b):
+    """
+    Full 128-bit product of uint64 arrays, returned as (high, low) words.
+    """
+    a0, a1 = a & _LOW32, a >> np.uint64(32)
+    b0, b1 = b & _LOW32, b >> np.uint64(32)
+    p00, p01, p10, p11 = a0 * b0, a0 * b1, a1 * b0, a1 * b1
+    mid = (p00 >> np.uint64(32)) + (p01 & _LOW32) + (p10 & _LOW32)
+    high = p11 + (p01 >> np.uint64(32)) + (p10 >> np.uint64(32)) + (mid >> np.uint64(32))
+    return high, a * b
+
+
+@lru_cache(maxsize=64)
+def _barrett_constants(modulus):
+    bits = modulus.bit_length()
+    return bits, (1 << (2 * bits)) // modulus
+
+
+def _barrett_mulmod(a, b, modulus):
+    """
+    a * b mod n for int64 residues and 2^31 <= n < 2^62, without overflow.
+
+    The 128-bit product is formed from 32-bit halves and reduced with a
+    Barrett quotient estimate q = ((T >> (k - 1)) * mu) >> (k + 1), where
+    k = bit_length(n) and mu = floor(4^k / n); the estimate is at most two
+    below the true quotient.
+    """
+    k, mu = _barrett_constants(modulus)
+    a = np.asarray(a).astype(np.uint64)
+    b = np.asarray(b).astype(np.uint64)
+    high, low = _mul_wide(a, b)
+    q1 = (high << np.uint64(65 - k)) | (low >> np.uint64(k - 1))
+    q_high, q_low = _mul_wide(q1, np.uint64(mu))
+    q3 = (q_high << np.uint64(63 - k)) | (q_low >> np.uint64(k + 1))
+    n = np.uint64(modulus)
+    r = low - q3 * n
+    for _ in range(2):
+        r = np.where(r >= n, r - n, r)
+    return r.astype(np.int64)
+
+
+class ZnArray:
+    """
+    Array of elements of one IntegerModRing, operated on as a whole.
+
+    Residues are stored as int64. Moduli below 2^31 multiply directly,
+    moduli up to 2^62 use overflow-safe Barrett reduction, and larger moduli
+    fall back to object arrays of Python ints. The ring is checked once per
+    operation rather than once per element.
+    """
+    def __init__(self, values, ring):
+        self.ring = ring
+        n = ring.modulus
+        if n < INT64_ARRAY_LIMIT:
+            values = np.asarray(values)
+            if values.dtype == object:
+                values = np.asarray(values % n, dtype=np.int64)
+            self.values = values.astype(np.int64) % n
+        else:
+            self.values = np.asarray(values, dtype=object) % n
+
+    @staticmethod
+    def from_elements(elements):
+        """
+        Build a ZnArray from a non-empty list of RingElements of one ring.
+        """
+        ring = elements[0].ring
+        if any(e.ring != ring for e in elements):
+            raise ValueError("Elements must belong to the same ring")
+        return ZnArray([e.value for e in elements], ring)
+
+    def to_elements(self):
+        return [RingElement(int(v), self.ring) for v in self.values.ravel()]
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __getitem__(self, index):
+        item = self.values[index]
+        if np.ndim(item) == 0:
+            return RingElement(int(item), self.ring)
+        return self._wrap(item)
+
+    def __repr__(self):
+        return f"{self.values.tolist()} in {self.ring.name}"
+
+    def __eq__(self, other):
+        return (isinstance(other, ZnArray) and self.ring == other.ring
+                and np.array_equal(self.values, other.values))
+
+    def _wrap(self, values):
+        out = ZnArray.__new__(ZnArray)
+        out.ring = self.ring
+        out.values = values
+        return out
+
+    def _coerce(self, other):
+        if isinstance(other, ZnArray):
+            if self.ring != other.ring:
+                raise ValueError("Elements must belong to the same ring")
+            return other.values
+        if isinstance(other, RingElement):
+            if self.ring != other.ring:
+                raise ValueError("Elements must belong to the same ring")
+            other = other.value
+        return ZnArray(other, self.ring).values
+
+    def _add(self, a, b):
+        n = self.ring.modulus
+        if a.dtype == object or b.dtype == object:
+            return (a + b) % n
+        r = a + b - n
+        r += (r >> 63) & n
+        return r
+
+    def _mul(self, a, b):
+        n = self.ring.modulus
+        if a.dtype == object or b.dtype == object:
+            return a * b % n
+        if n < DIRECT_REDUCTION_LIMIT:
+            return a * b % n
+        return _barrett_mulmod(a, b, n)
+
+    def __add__(self, other):
+        return self._wrap(self._add(self.values, self._coerce(other)))
+
+    __radd__ = __add__
+
+    def __mul__(self, other):
+        return self._wrap(self._mul(self.values, self._coerce(other)))
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        a = self.values
+        if a.dtype == object:
+            return self._wrap(-a % self.ring.modulus)
+        return self._wrap(np.where(a == 0, 0, self.ring.modulus - a))
+
+    def __sub__(self, other):
+        return self + (-self._wrap(self._coerce(other)))
+
+    def __rsub__(self, other):
+        return self._wrap(self._coerce(other)) - self
+
+    def __pow__(self, k):
+        """
+        Elementwise power by square-and-multiply with a non-negative integer exponent.
+        """
+        if k < 0 or int(k) != k:
+            raise ValueError("Exponent must be a non-negative integer")
+        k = int(k)
+        result = np.ones_like(self.values) % self.ring.modulus
+        base = self.values
+        while k:
+            if k & 1:
+                result = self._mul(result, base)
+            k >>= 1
+            if k:
+                base = self._mul(base, base)
+        return self._wrap(result)
+
+    def _reduce(self, values, op, identity):
+        values = values.ravel()
+        if len(values) == 0:
+            return RingElement(identity % self.ring.modulus, self.ring)
+        # Pairwise tree reduction keeps every intermediate a reduced residue.
+        while len(values) > 1:
+            if len(values) % 2:
+                values = np.concatenate([values, np.full(1, identity, dtype=values.dtype)])
+            values = op(values[0::2], values[1::2])
+        return RingElement(int(values[0]), self.ring)
+
+    def sum(self):
+        return self._reduce(self.values, self._add, 0)
+
+    def prod(self):
+        return self._reduce(self.values, self._mul, 1)
+
+    def dot(self, other):
+        return self._reduce(self._mul(self.values, self._coerce(other)), self._add, 0)
+
+
+class RingStructure:
+    """
+    Structure data of Z/nZ, each piece computed on first use and then kept.
+
+    Everything derived from the factorization of n (unit-group order,
+    idempotents, generators, field/domain checks) is cheap for any n.
+    Whole-ring tables (units, inverses, zero divisors, nilpotents) are
+    built with sieves and vectorized exponentiation in near-linear time,
+    and only for n up to STRUCTURE_TABLE_LIMIT.
+    """
+    def __init__(self, modulus):
+        self.modulus = modulus
+
+    @cached_property
+    def factorization(self):
+        """
+        Prime factorization of n as {prime: exponent}.
+        """
+        return {int(p): int(e) for p, e in factorint(self.modulus).items()}
+
+    @cached_property
+    def radical(self):
+        r = 1
+        for p in self.factorization:
+            r *= p
+        return r
+
+    @cached_property
+    def is_field(self):
+        return len(self.factorization) == 1 and next(iter(self.factorization.values())) == 1
+
+    @property
+    def is_integral_domain(self):
+        # A finite integral domain is a field.
+        return self.is_field
+
+    @cached_property
+    def unit_group_order(self):
+        """
+        Euler's totient of n.
+        """
+        phi = 1
+        for p, e in self.factorization.items():
+            phi *= (p - 1) * p ** (e - 1)
+        return phi
+
+    @cached_property
+    def primitive_idempotents(self):
+        """
+        The idempotent e_q with e_q = 1 mod q and 0 mod the other prime powers q of n.
+        """
+        n = self.modulus
+        result = []
+        for p, e in self.factorization.items():
+            q = p ** e
+            rest = n // q
+            result.append(rest * pow(rest, -1, q) % n)
+        return result
+
+    @cached_property
+    def idempotents(self):
+        """
+        All 2^k idempotents, as sums of subsets of the primitive idempotents.
+        """
+        n = self.modulus
+        base = self.primitive_idempotents
+        values = {sum(subset) % n for size in range(len(base) + 1) for subset in combinations(base, size)}
+        return sorted(values)
+
+    @cached_property
+    def is_unit_group_cyclic(self):
+        n = self.modulus
+        odd = {p: e for p, e in self.factorization.items() if p != 2}
+        twos = self.factorization.get(2, 0)
+        return n in (1, 2, 4) or (len(odd) == 1 and twos <= 1)
+
+    @cached_property
+    def unit_group_generators(self):
+        """
+        Generators of the unit group: one primitive root when the group is
+        cyclic, otherwise generators of each prime-power component lifted to
+        Z/nZ with the primitive idempotents.
+        """
+        n = self.modulus
+        if n <= 2:
+            return [1] if n == 2 else []
+        if self.is_unit_group_cyclic:
+            return [int(primitive_root(n))]
+        generators = []
+        for (p, e), idem in zip(self.factorization.items(), self.primitive_idempotents):
+            q = p ** e
+            if p == 2:
+                local = [] if e == 1 else ([q - 1] if e == 2 else [q - 1, 5])
+            else:
+                local = [int(primitive_root(q))]
+            generators.extend((1 + (g - 1) * idem) % n for g in local)
+        return generators
+
+    def is_unit(self, a):
+        return gcd(a, self.modulus) == 1
+
+    def is_nilpotent(self, a):
+        return a % self.radical == 0
+
+    def is_zero_divisor(self, a):
+        a = a % self.modulus
+        return a != 0 and not self.is_unit(a)
+
+    def inverse(self, a):
+        a %= self.modulus
+        if "inverse_table" in self.__dict__ and self.modulus > 1:
+            # Reuse the table once something has built it.
+            inv = int(self.inverse_table[a])
+            if inv == 0:
+                raise ValueError(f"{a} is not a unit in ℤ/{self.modulus}ℤ")
+            return inv
+        try:
+            return pow(a, -1, self.modulus)
+        except ValueError:
+            raise ValueError(f"{a} is not a unit in ℤ/{self.modulus}ℤ") from None
+
+    def _check_table_size(self):
+        if self.modulus > STRUCTURE_TABLE_LIMIT:
+            raise ValueError(f"Modulus too large for whole-ring tables (limit {STRUCTURE_TABLE_LIMIT})")
+
+    @cached_property
+    def unit_mask(self):
+        """
+        Boolean table over 0..n-1, True at the units (sieved by the prime divisors of n).
+        """
+        self._check_table_size()
+        mask = np.ones(self.modulus, dtype=bool)
+        for p in self.factorization:
+            mask[::p] = False
+        if self.modulus == 1:
+            mask[0] = True
+        return mask
+
+    @cached_property
+    def units(self):
+        return np.flatnonzero(self.unit_mask)
+
+    @cached_property
+    def inverse_table(self):
+        """
+        inverse_table[a] is the inverse of a for units and 0 elsewhere.
+
+        All inverses come from one vectorized exponentiation u^(phi(n) - 1).
+        """
+        table = np.zeros(self.modulus, dtype=np.int64)
+        units = self.units
+        exponent = max(self.unit_group_order - 1, 0)
+        table[units] = (ZnArray(units, IntegerModRing(self.modulus)) ** exponent).values
+        return table
+
+    @cached_property
+    def zero_divisors(self):
+        mask = ~self.unit_mask
+        mask[0] = False
+        return np.flatnonzero(mask)
+
+    @cached_property
+    def nilpotents(self):
+        self._check_table_size()
+        return np.arange(0, self.modulus, self.radical)
+
+
+@lru_cache(maxsize=128)
+def ring_structure(modulus):
+    """
+    Shared RingStructure for a modulus; repeated calls return the same object.
+    """
+    return RingStructure(modulus)
+
+
 # Example usage:
 if __name__ == "__main__":
     Z5 = IntegerModRing(5)
@@ -59,3 +480,18 @@ if __name__ == "__main__":
     print("a * b =", a * b)        # 1 in ℤ/5ℤ
     print("-a =", -a)              # 3 in ℤ/5ℤ
     print("a - b =", a - b)        # 4 in ℤ/5ℤ
+
+    xs = Z5.array([1, 2, 3, 4])
+    print("xs * 3 =", xs * 3)        # [3, 1, 4, 2] in ℤ/5ℤ
+    print("sum(xs) =", xs.sum())     # 0 in ℤ/5ℤ
+    print("prod(xs) =", xs.prod())   # 4 in ℤ/5ℤ
+
+    Z12 = IntegerModRing(12)
+    print("ℤ/12ℤ is a field?", Z12.is_field())
+    print("Units:", Z12.structure.units)
+    print("Zero divisors:", Z12.structure.zero_divisors)
+    print("Idempotents:", Z12.structure.idempotents)
+    print("Nilpotents:", Z12.structure.nilpotents)
+    print("Unit group order and generators:",
+          Z12.structure.unit_group_order, Z12.structure.unit_group_generators)
+    print("Inverse of 5:", RingElement(5, Z12).inverse())
@@ -0,0 +1,198 @@
+import heapq
+
+import numpy as np
+from algebra.polynomials import Polynomial
+
+# Sparse results denser than this are handed back as dense Polynomials,
+# and dense polynomials sparser than it are worth converting.
+DENSITY_THRESHOLD = 0.1
+
+
+class SparsePolynomial:
+    def __init__(self, terms=None):
+        """
+        terms: dict mapping exponent -> coefficient,
+        e.g., {1000000: 1, 0: 1} represents x^1000000 + 1
+        """
+        self.terms = {}
+        for power, coef in (terms or {}).items():
+            if power < 0 or int(power) != power:
+                raise ValueError("Exponents must be non-negative integers")
+            if coef != 0:
+                self.terms[int(power)] = float(coef)
+
+    @staticmethod
+    def from_dense(poly):
+        """
+        Build a SparsePolynomial from a Polynomial (or a coefficient list, highest power first).
+        """
+        coeffs = poly.coefficients if isinstance(poly, Polynomial) else np.asarray(poly, dtype=float)
+        degree = len(coeffs) - 1
+        nonzero = np.flatnonzero(coeffs)
+        return SparsePolynomial(dict(zip((degree - nonzero).tolist(), coeffs[nonzero].tolist())))
+
+    def to_dense(self):
+        """
+        Convert to a dense Polynomial.
+        """
+        if not self.terms:
+            return Polynomial([])
+        degree = self.degree()
+        coeffs = np.zeros(degree + 1)
+        powers = np.fromiter(self.terms.keys(), dtype=np.int64, count=len(self.terms))
+        coeffs[degree - powers] = np.fromiter(self.terms.values(), dtype=float, count=len(self.terms))
+        return Polynomial(coeffs)
+
+    def degree(self):
+        return max(self.terms) if self.terms else -1
+
+    def density(self):
+        """
+        Fraction of the degree + 1 coefficient slots that are non-zero.
+        """
+        return len(self.terms) / (self.degree() + 1) if self.terms else 0.0
+
+    def _sorted_terms(self):
+        return sorted(self.terms.items(), reverse=True)
+
+    def __str__(self):
+        terms = []
+        for power, coef in self._sorted_terms():
+            if power == 0:
+                terms.append(f"{coef:.2f}")
+            elif power == 1:
+                terms.append(f"{coef:.2f}x")
+            else:
+                terms.append(f"{coef:.2f}x^{power}")
+        return " + ".join(terms).replace('+ -', '- ')
+
+    def __eq__(self, other):
+        return isinstance(other, SparsePolynomial) and self.terms == other.terms
+
+    def evaluate(self, x):
+        x = np.asarray(x, dtype=float)
+        if not self.terms:
+            return np.zeros_like(x)
+        powers = np.fromiter(self.terms.keys(), dtype=float, count=len(self.terms))
+        coeffs = np.fromiter(self.terms.values(), dtype=float, count=len(self.terms))
+        return np.power(x[..., None], powers) @ coeffs
+
+    def derivative(self):
+        return SparsePolynomial({p - 1: c * p for p, c in self.terms.items() if p > 0})
+
+    def integrate(self, constant=0):
+        terms = {p + 1: c / (p + 1) for p, c in self.terms.items()}
+        terms[0] = constant
+        return SparsePolynomial(terms)
+
+    def add(self, other):
+        other = _as_sparse(other)
+        terms = dict(self.terms)
+        for power, coef in other.terms.items():
+            terms[power] = terms.get(power, 0.0) + coef
+        return auto_polynomial(SparsePolynomial(terms))
+
+    def subtract(self, other):
+        other = _as_sparse(other)
+        terms = dict(self.terms)
+        for power, coef in other.terms.items():
+            terms[power] = terms.get(power, 0.0) - coef
+        return auto_polynomial(SparsePolynomial(terms))
+
+    def multiply(self, other):
+        """
+        Heap-based (Johnson) sparse product.
+
+        Products are generated in decreasing exponent order from a heap
+        holding one cursor per term of the shorter operand, so equal
+        exponents are merged as they come out and memory stays O(#terms).
+        """
+        other = _as_sparse(other)
+        f, g = self._sorted_terms(), other._sorted_terms()
+        if len(f) > len(g):
+            f, g = g, f
+        if not f:
+            return SparsePolynomial()
+
+        heap = [(-(fp + g[0][0]), i, 0) for i, (fp, _) in enumerate(f)]
+        heapq.heapify(heap)
+        terms = {}
+        while heap:
+            neg_power, i, j = heapq.heappop(heap)
+            power = -neg_power
+            terms[power] = terms.get(power, 0.0) + f[i][1] * g[j][1]
+            if j + 1 < len(g):
+                heapq.heappush(heap, (-(f[i][0] + g[j + 1][0]), i, j + 1))
+        return auto_polynomial(SparsePolynomial(terms))
+
+    def divide(self, other):
+        """
+        Sparse long division; returns (quotient, remainder).
+        """
+        other = _as_sparse(other)
+        if not other.terms:
+            raise ZeroDivisionError("Cannot divide by the zero polynomial")
+        lead_power = other.degree()
+        lead_coef = other.terms[lead_power]
+        rest = [(p, c) for p, c in other.terms.items() if p != lead_power]
+
+        remainder = dict(self.terms)
+        quotient = {}
+        while remainder:
+            power = max(remainder)
+            if power < lead_power:
+                break
+            factor = remainder.pop(power) / lead_coef
+            shift = power - lead_power
+            quotient[shift] = factor
+            for p, c in rest:
+                value = remainder.get(p + shift, 0.0) - factor * c
+                if value == 0:
+                    remainder.pop(p + shift, None)
+                else:
+                    remainder[p + shift] = value
+        return (auto_polynomial(SparsePolynomial(quotient)),
+                auto_polynomial(SparsePolynomial(remainder)))
+
+
+def _as_sparse(poly):
+    if isinstance(poly, SparsePolynomial):
+        return poly
+    return SparsePolynomial.from_dense(poly)
+
+
+def auto_polynomial(poly, threshold=DENSITY_THRESHOLD):
+    """
+    Return `poly` in whichever representation suits its density.
+
+    Args:
+        poly (Polynomial or SparsePolynomial): Input polynomial.
+        threshold (float): Density above which the dense form is used.
+
+    Returns:
+        Polynomial or SparsePolynomial.
+    """
+    if isinstance(poly, SparsePolynomial):
+        if poly.terms and poly.density() > threshold:
+            return poly.to_dense()
+        return poly
+    nonzero = np.count_nonzero(poly.coefficients)
+    if len(poly.coefficients) and nonzero / len(poly.coefficients) <= threshold:
+        return SparsePolynomial.from_dense(poly)
+    return poly
+
+
+# Example usage
+if __name__ == "__main__":
+    p1 = SparsePolynomial({1000000: 1, 0: 1})   # x^1000000 + 1
+    p2 = SparsePolynomial({500000: 2, 3: -1})   # 2x^500000 - x^3
+
+    print("P1:", p1)
+    print("P2:", p2)
+    print("P1 + P2:", p1.add(p2))
+    print("P1 * P2:", p1.multiply(p2))
+    q, r = p1.divide(SparsePolynomial({500000: 1, 0: 1}))
+    print("P1 / (x^500000 + 1):", q, "Remainder:", r)
+    print("P1 evaluated at x=1:", p1.evaluate(1))
+    print("P2 derivative:", p2.derivative())
+    print("Dense x^2 - 2 stays dense:", type(auto_polynomial(Polynomial([1, 0, -2]))).__name__)
@@ -1,3 +1,14 @@
-from .differentiation import *
-from .integration import *
-from .limits import *
+from utils.lazy import lazy_package
+
+# Submodules are imported on first use of one of their names.
+__getattr__, __dir__, __all__ = lazy_package(__name__, [
+    "cache",
+    "differentiation",
+    "integration",
+    "limits",
+    "numeric",
+    "quadrature",
+    "executor",
+    "autodiff",
+    "multivariate",
+])
@@ -0,0 +1,434 @@
+import math
+
+import numpy as np
+from sympy import (Abs, Add, Mul, Pow, Symbol, acos, asin, atan, cos, cosh, exp, log,
+                   sin, sinh, tan, tanh)
+
+from calculus.cache import as_expression, as_symbols
+
+# SymPy function classes and the method name both AD number types implement.
+_FUNCTIONS = {
+    sin: "sin", cos: "cos", tan: "tan", exp: "exp", log: "log",
+    asin: "asin", acos: "acos", atan: "atan",
+    sinh: "sinh", cosh: "cosh", tanh: "tanh", Abs: "abs",
+}
+
+
+# Forward mode: truncated Taylor series ("jets"), dual numbers generalized to any order
+
+class Jet:
+    """
+    Truncated Taylor expansion of a quantity around a batch of points.
+
+    coefficients[k] holds f^(k)(x) / k! for every point, so a Jet of order 1
+    is a dual number a + b*eps. Arithmetic and elementary functions follow
+    the standard Taylor-coefficient recurrences, vectorized over the points,
+    which gives exact higher derivatives without symbolic differentiation.
+    """
+    def __init__(self, coefficients):
+        self.coefficients = coefficients
+
+    @staticmethod
+    def variable(x, order):
+        x = np.asarray(x, dtype=float)
+        coefficients = np.zeros((order + 1,) + x.shape)
+        coefficients[0] = x
+        if order:
+            coefficients[1] = 1.0
+        return Jet(coefficients)
+
+    @property
+    def order(self):
+        return len(self.coefficients) - 1
+
+    def _constant(self, c):
+        coefficients = np.zeros_like(self.coefficients)
+        coefficients[0] = c
+        return Jet(coefficients)
+
+    def __add__(self, other):
+        if isinstance(other, Jet):
+            return Jet(self.coefficients + other.coefficients)
+        coefficients = self.coefficients.copy()
+        coefficients[0] = coefficients[0] + other
+        return Jet(coefficients)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Jet(-self.coefficients)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if not isinstance(other, Jet):
+            return Jet(self.coefficients * other)
+        a, b = self.coefficients, other.coefficients
+        out = np.zeros(np.broadcast_shapes(a.shape, b.shape))
+        for k in range(len(out)):
+            out[k] = sum(a[j] * b[k - j] for j in range(k + 1))
+        return Jet(out)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, Jet):
+            return Jet(self.coefficients / other)
+        a, b = self.coefficients, other.coefficients
+        q = np.zeros(np.broadcast_shapes(a.shape, b.shape))
+        for k in range(len(q)):
+            q[k] = (a[k] - sum(b[j] * q[k - j] for j in range(1, k + 1))) / b[0]
+        return Jet(q)
+
+    def __rtruediv__(self, other):
+        return self._constant(other) / self
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Jet):
+            return (exponent * self.log()).exp()
+        if float(exponent).is_integer():
+            n = int(exponent)
+            if n < 0:
+                return 1.0 / (self ** -n)
+            result, base = self._constant(1.0), self
+            while n:
+                if n & 1:
+                    result = result * base
+                base = base * base
+                n >>= 1
+            return result
+        # p = a**r satisfies a * p' = r * a' * p.
+        a = self.coefficients
+        p = np.zeros_like(a)
+        p[0] = a[0] ** exponent
+        for k in range(1, len(a)):
+            p[k] = sum(((exponent + 1) * j - k) * a[j] * p[k - j] for j in range(1, k + 1)) / (k * a[0])
+        return Jet(p)
+
+    def __rpow__(self, base):
+        return (self * math.log(base)).exp()
+
+    def _integrate(self, value, rate):
+        """
+        Coefficients of g with g(a0) = value and g' = rate(a) * a'.
+        """
+        a, d = self.coefficients, rate.coefficients
+        g = np.zeros_like(a)
+        g[0] = value
+        for k in range(1, len(a)):
+            g[k] = sum(j * a[j] * d[k - j] for j in range(1, k + 1)) / k
+        return Jet(g)
+
+    def exp(self):
+        a = self.coefficients
+        e = np.zeros_like(a)
+        e[0] = np.exp(a[0])
+        for k in range(1, len(a)):
+            e[k] = sum(j * a[j] * e[k - j] for j in range(1, k + 1)) / k
+        return Jet(e)
+
+    def log(self):
+        return self._integrate(np.log(self.coefficients[0]), 1.0 / self)
+
+    def _sin_cos(self):
+        a = self.coefficients
+        s, c = np.zeros_like(a), np.zeros_like(a)
+        s[0], c[0] = np.sin(a[0]), np.cos(a[0])
+        for k in range(1, len(a)):
+            s[k] = sum(j * a[j] * c[k - j] for j in range(1, k + 1)) / k
+            c[k] = -sum(j * a[j] * s[k - j] for j in range(1, k + 1)) / k
+        return Jet(s), Jet(c)
+
+    def sin(self):
+        return self._sin_cos()[0]
+
+    def cos(self):
+        return self._sin_cos()[1]
+
+    def tan(self):
+        s, c = self._sin_cos()
+        return s / c
+
+    def sinh(self):
+        e = self.exp()
+        return (e - 1.0 / e) * 0.5
+
+    def cosh(self):
+        e = self.exp()
+        return (e + 1.0 / e) * 0.5
+
+    def tanh(self):
+        e = (self * 2.0).exp()
+        return (e - 1.0) / (e + 1.0)
+
+    def asin(self):
+        return self._integrate(np.arcsin(self.coefficients[0]), (1.0 - self * self) ** -0.5)
+
+    def acos(self):
+        return self._integrate(np.arccos(self.coefficients[0]), -(1.0 - self * self) ** -0.5)
+
+    def atan(self):
+        return self._integrate(np.arctan(self.coefficients[0]), 1.0 / (1.0 + self * self))
+
+    def abs(self):
+        return self * np.sign(self.coefficients[0])
+
+
+# Reverse mode: values recorded on a tape, adjoints swept backwards
+
+class Tape:
+    """
+    Record of the operations of one evaluation, for reverse-mode gradients.
+    """
+    def __init__(self):
+        self.nodes = []
+
+    def variable(self, x):
+        return Node(self, np.asarray(x, dtype=float), ())
+
+    def gradient(self, output, inputs):
+        """
+        Adjoints d(output)/d(input) for each input node, one backward sweep.
+        """
+        adjoints = {id(output): np.ones_like(output.value)}
+        for node in reversed(self.nodes):
+            adjoint = adjoints.get(id(node))
+            if adjoint is None:
+                continue
+            for parent, partial in node.parents:
+                contribution = adjoint * partial
+                key = id(parent)
+                adjoints[key] = adjoints[key] + contribution if key in adjoints else contribution
+        return [np.broadcast_to(adjoints.get(id(node), 0.0), output.value.shape) for node in inputs]
+
+
+class Node:
+    """
+    A value on a Tape together with the local partial derivatives to its parents.
+    """
+    def __init__(self, tape, value, parents):
+        self.tape = tape
+        self.value = value
+        self.parents = parents
+        tape.nodes.append(self)
+
+    def _make(self, value, parents):
+        return Node(self.tape, value, parents)
+
+    def __add__(self, other):
+        if isinstance(other, Node):
+            return self._make(self.value + other.value, ((self, 1.0), (other, 1.0)))
+        return self._make(self.value + other, ((self, 1.0),))
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return self._make(-self.value, ((self, -1.0),))
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, Node):
+            return self._make(self.value * other.value, ((self, other.value), (other, self.value)))
+        return self._make(self.value * other, ((self, other),))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Node):
+            value = self.value / other.value
+            return self._make(value, ((self, 1.0 / other.value), (other, -value / other.value)))
+        return self._make(self.value / other, ((self, 1.0 / other),))
+
+    def __rtruediv__(self, other):
+        value = other / self.value
+        return self._make(value, ((self, -value / self.value),))
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Node):
+            return (exponent * self.log()).exp()
+        value = self.value ** exponent
+        return self._make(value, ((self, exponent * self.value ** (exponent - 1)),))
+
+    def __rpow__(self, base):
+        value = base ** self.value
+        return self._make(value, ((self, value * math.log(base)),))
+
+    def _unary(self, value, partial):
+        return self._make(value, ((self, partial),))
+
+    def exp(self):
+        value = np.exp(self.value)
+        return self._unary(value, value)
+
+    def log(self):
+        return self._unary(np.log(self.value), 1.0 / self.value)
+
+    def sin(self):
+        return self._unary(np.sin(self.value), np.cos(self.value))
+
+    def cos(self):
+        return self._unary(np.cos(self.value), -np.sin(self.value))
+
+    def tan(self):
+        value = np.tan(self.value)
+        return self._unary(value, 1.0 + value ** 2)
+
+    def sinh(self):
+        return self._unary(np.sinh(self.value), np.cosh(self.value))
+
+    def cosh(self):
+        return self._unary(np.cosh(self.value), np.sinh(self.value))
+
+    def tanh(self):
+        value = np.tanh(self.value)
+        return self._unary(value, 1.0 - value ** 2)
+
+    def asin(self):
+        return self._unary(np.arcsin(self.value), 1.0 / np.sqrt(1.0 - self.value ** 2))
+
+    def acos(self):
+        return self._unary(np.arccos(self.value), -1.0 / np.sqrt(1.0 - self.value ** 2))
+
+    def atan(self):
+        return self._unary(np.arctan(self.value), 1.0 / (1.0 + self.value ** 2))
+
+    def abs(self):
+        return self._unary(np.abs(self.value), np.sign(self.value))
+
+
+# Evaluation of parsed expressions on either number type
+
+def _evaluate(expr, leaves, memo=None):
+    """
+    Evaluate a SymPy tree bottom-up with AD numbers substituted for its symbols.
+
+    Shared subtrees are evaluated once. No derivative expression is built:
+    the tree is only read to drive the arithmetic.
+    """
+    if memo is None:
+        memo = {}
+    if expr in memo:
+        return memo[expr]
+    if expr in leaves:
+        result = leaves[expr]
+    elif expr.is_number:
+        result = float(expr)
+    elif isinstance(expr, Add):
+        terms = [_evaluate(arg, leaves, memo) for arg in expr.args]
+        result = terms[0]
+        for term in terms[1:]:
+            result = result + term
+    elif isinstance(expr, Mul):
+        factors = [_evaluate(arg, leaves, memo) for arg in expr.args]
+        result = factors[0]
+        for factor in factors[1:]:
+            result = result * factor
+    elif isinstance(expr, Pow):
+        base = _evaluate(expr.base, leaves, memo)
+        exponent = _evaluate(expr.exp, leaves, memo)
+        result = base ** exponent
+    elif type(expr) in _FUNCTIONS and len(expr.args) == 1:
+        argument = _evaluate(expr.args[0], leaves, memo)
+        if isinstance(argument, float):
+            result = float(expr.func(expr.args[0]))
+        else:
+            result = getattr(argument, _FUNCTIONS[type(expr)])()
+    elif isinstance(expr, Symbol):
+        raise ValueError(f"No value given for symbol '{expr}'")
+    else:
+        raise ValueError(f"Automatic differentiation does not support '{expr.func.__name__}'")
+    memo[expr] = result
+    return result
+
+
+def taylor_coefficients(expr, x, order=1, variable='x'):
+    """
+    Taylor coefficients f^(k)(x) / k!, k = 0..order, at every point of x (forward mode).
+
+    Args:
+        expr (str or sympy expression): Expression in one variable.
+        x (array-like): Evaluation points.
+        order (int): Highest derivative order.
+        variable (str): Variable name.
+
+    Returns:
+        ndarray: Shape (order + 1,) + x.shape.
+    """
+    symbol = as_symbols(variable)[0]
+    jet = Jet.variable(x, order)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = _evaluate(as_expression(expr), {symbol: jet})
+    if not isinstance(result, Jet):
+        result = jet._constant(result)
+    return result.coefficients
+
+
+def derivatives(expr, x, order=1, variable='x'):
+    """
+    Value and derivatives f(x), f'(x), ..., f^(order)(x) at every point of x.
+
+    Uses forward-mode Taylor arithmetic (dual numbers for order 1), so no
+    symbolic derivative is built or simplified.
+
+    Returns:
+        ndarray: Shape (order + 1,) + x.shape; row k is the k-th derivative.
+    """
+    coefficients = taylor_coefficients(expr, x, order, variable)
+    factorials = np.array([math.factorial(k) for k in range(order + 1)], dtype=float)
+    return coefficients * factorials.reshape((-1,) + (1,) * (coefficients.ndim - 1))
+
+
+def derivative_values(expr, x, order=1, variable='x'):
+    """
+    The order-th derivative of an expression at every point of x.
+    """
+    return derivatives(expr, x, order, variable)[order]
+
+
+def gradient(expr, variables, *values):
+    """
+    Value and gradient of a multivariate expression by reverse mode.
+
+    One forward evaluation records the operations on a tape; one backward
+    sweep then yields the partial derivatives with respect to every variable,
+    whatever their number, vectorized over the broadcast points.
+
+    Args:
+        expr (str or sympy expression): Expression to differentiate.
+        variables (str or sequence): Variable names, e.g. 'x, y'.
+        *values (array-like): Point coordinates, one array per variable.
+
+    Returns:
+        tuple: (value, [df/dv for each variable]) as arrays of the broadcast shape.
+    """
+    symbols_ = as_symbols(variables)
+    if len(symbols_) != len(values):
+        raise ValueError(f"Expected {len(symbols_)} coordinate arrays, got {len(values)}")
+    shape = np.broadcast_shapes(*(np.shape(v) for v in values))
+    tape = Tape()
+    inputs = [tape.variable(np.broadcast_to(np.asarray(v, dtype=float), shape)) for v in values]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        output = _evaluate(as_expression(expr), dict(zip(symbols_, inputs)))
+        if not isinstance(output, Node):
+            return np.full(shape, output), [np.zeros(shape) for _ in inputs]
+        return output.value + np.zeros(shape), tape.gradient(output, inputs)
+
+
+# Example usage
+if __name__ == "__main__":
+    x = np.linspace(0.5, 2.0, 4)
+    print("f = x**3 * sin(x); f, f', f'' at", x)
+    print(derivatives("x**3 * sin(x)", x, order=2))
+
+    points = np.random.default_rng(0).uniform(0.5, 2.0, (2, 1_000_000))
+    value, (dx, dy) = gradient("exp(x*y) + log(x)/y", "x, y", *points)
+    print("Gradient of exp(x*y) + log(x)/y at 10^6 points; first:", value[0], dx[0], dy[0])
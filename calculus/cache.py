@@ -0,0 +1,197 @@
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from sympy import Basic, Symbol, srepr
+from sympy.parsing.sympy_parser import parse_expr
+
+# Entries kept in memory per cache before the least recently used is evicted.
+DEFAULT_CACHE_SIZE = 1024
+
+
+class ExpressionCache:
+    """
+    Size-bounded LRU cache with hit/miss counters and an optional SQLite tier.
+
+    The in-memory tier is an OrderedDict; when a disk path is set, misses
+    fall through to the database and new results are written to both, so
+    results survive process restarts.
+    """
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, disk_path=None):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        if disk_path:
+            self.enable_disk(disk_path)
+
+    def enable_disk(self, path):
+        """
+        Add (or replace) the on-disk tier, stored as a SQLite file at `path`.
+        """
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB)")
+        db.commit()
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+            self._db = db
+
+    def disable_disk(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+            self._db = None
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for `key`, calling `compute()` on a miss.
+
+        Exceptions raised by `compute` propagate and nothing is stored.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            value = self._disk_get(key)
+            if value is not None:
+                self.disk_hits += 1
+                self._store(key, value[0])
+                return value[0]
+            self.misses += 1
+        result = compute()
+        with self._lock:
+            self._store(key, result)
+            self._disk_put(key, result)
+        return result
+
+    def _store(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _disk_get(self, key):
+        if self._db is None:
+            return None
+        row = self._db.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return (pickle.loads(row[0]),)
+        except Exception:
+            return None
+
+    def _disk_put(self, key, value):
+        if self._db is None:
+            return
+        try:
+            blob = pickle.dumps(value)
+        except Exception:
+            return
+        self._db.execute("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", (key, blob))
+        self._db.commit()
+
+    def stats(self):
+        """
+        Counters and current size, e.g. for display in the app.
+        """
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.disk_hits = 0
+            if disk and self._db is not None:
+                self._db.execute("DELETE FROM cache")
+                self._db.commit()
+
+
+# Shared caches: one for parsed input strings, one for computed results.
+# Setting LAMBDACALC_CACHE_PATH turns on the on-disk tier for results.
+parse_cache = ExpressionCache()
+result_cache = ExpressionCache(disk_path=os.environ.get("LAMBDACALC_CACHE_PATH"))
+
+
+def parse_expression(expr_str):
+    """
+    parse_expr with memoization on the whitespace-normalized input string.
+    """
+    key = " ".join(str(expr_str).split())
+    return parse_cache.get_or_compute(key, lambda: parse_expr(expr_str))
+
+
+def as_expression(expr):
+    """
+    A SymPy expression from a string (parsed through the cache), an
+    expression (returned unchanged) or anything else str() can express.
+    """
+    if isinstance(expr, Basic):
+        return expr
+    return parse_expression(expr if isinstance(expr, str) else str(expr))
+
+
+def as_symbols(variables):
+    """
+    A list of Symbols from 'x, y, z' or a sequence of names and Symbols.
+    """
+    if isinstance(variables, str):
+        variables = [v.strip() for v in variables.split(",")]
+    return [Symbol(v) if isinstance(v, str) else v for v in variables]
+
+
+def canonical_key(operation, expr, *args):
+    """
+    Cache key from the operation name, the expression's canonical srepr form
+    and the remaining arguments (variable, bounds, direction, ...).
+    """
+    return "|".join([operation, srepr(expr)] + [srepr(a) if hasattr(a, "free_symbols") else repr(a)
+                                               for a in args])
+
+
+def cached_operation(operation, expr, args, compute):
+    """
+    Memoize `compute()` for a symbolic operation on `expr` with `args`.
+    """
+    return result_cache.get_or_compute(canonical_key(operation, expr, *args), compute)
+
+
+def cache_stats():
+    return {"parse": parse_cache.stats(), "results": result_cache.stats()}
+
+
+def clear_caches(disk=False):
+    parse_cache.clear()
+    result_cache.clear(disk=disk)
+
+
+def enable_disk_cache(path):
+    """
+    Persist computed results in a SQLite file so they survive restarts.
+    """
+    result_cache.enable_disk(path)
+
+
+# Example usage
+if __name__ == "__main__":
+    from sympy import diff, symbols
+
+    x = symbols('x')
+    for text in ["x**2 + 3*x", "x**2+3*x", "3*x + x**2"]:
+        expr = parse_expression(text)
+        print(text, "->", cached_operation("diff", expr, (x,), lambda: diff(expr, x)))
+    print(cache_stats())
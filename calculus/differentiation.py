@@ -1,24 +1,41 @@
-from sympy import symbols, diff, sin, cos, exp, log, tan, simplify
-from sympy.parsing.sympy_parser import parse_expr
+from sympy import symbols, diff, sin, cos, exp, log, tan, simplify, factor_terms
+from calculus.cache import cached_operation, parse_expression
+# Numeric derivatives without symbolic trees (forward / reverse mode AD).
+from calculus.autodiff import derivatives, derivative_values, gradient
+
+# simplify_level values: raw derivative, cheap common-factor extraction, full simplify().
+SIMPLIFY_NONE, SIMPLIFY_BASIC, SIMPLIFY_FULL = 0, 1, 2
+SIMPLIFIERS = {
+    SIMPLIFY_NONE: lambda expr: expr,
+    SIMPLIFY_BASIC: factor_terms,
+    SIMPLIFY_FULL: simplify,
+}
 
 x = symbols('x')
 
-def differentiate_expression(expr_str, variable='x'):
+def differentiate_expression(expr_str, variable='x', simplify_level=SIMPLIFY_FULL):
     """
     Differentiate a mathematical expression with respect to a variable.
 
+    simplify() is usually the slowest step; lower levels skip it. For
+    derivative values at many points, see derivatives() / gradient(),
+    which never build a symbolic derivative.
+
     Args:
         expr_str (str): The expression to differentiate, as a string.
         variable (str): The variable to differentiate with respect to (default is 'x').
+        simplify_level (int): 0 returns the raw derivative, 1 only pulls out
+            common factors, 2 (default) runs full simplify().
 
     Returns:
         sympy expression: The derivative of the input expression.
     """
     try:
         var = symbols(variable)
-        expr = parse_expr(expr_str)
-        derivative = diff(expr, var)
-        return simplify(derivative)
+        expr = parse_expression(expr_str)
+        simplifier = SIMPLIFIERS[simplify_level]
+        return cached_operation("diff", expr, (var, simplify_level),
+                                lambda: simplifier(diff(expr, var)))
     except Exception as e:
         return f"Error in differentiation: {e}"
 
@@ -36,3 +53,6 @@ if __name__ == "__main__":
     for expr in examples:
         result = differentiate_expression(expr)
         print(f"d/dx of {expr} = {result}")
+
+    print("Unsimplified:", differentiate_expression("sin(x)**2 * cos(x)", simplify_level=SIMPLIFY_NONE))
+    print("Second derivative of tan(x) at 0, 0.5 via AD:", derivative_values("tan(x)", [0.0, 0.5], order=2))
@@ -0,0 +1,370 @@
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from multiprocessing.connection import wait
+
+try:
+    import resource
+except ImportError:  # Windows: no per-process address-space limit
+    resource = None
+
+# Wall-clock seconds a task may run before its worker is killed.
+DEFAULT_TASK_TIMEOUT = 30.0
+# How often the dispatcher checks deadlines and cancellations, in seconds.
+POLL_INTERVAL = 0.05
+# Address-space limit of each worker in the shared executor, in bytes; an
+# expression that blows up memory kills its worker instead of the machine.
+SHARED_MEMORY_LIMIT = 4 * 2 ** 30
+
+
+class TaskTimeout(TimeoutError):
+    """A task ran past its wall-clock limit and its worker was killed."""
+
+
+class WorkerCrashed(RuntimeError):
+    """A worker process died while running a task (e.g. it hit the memory limit)."""
+
+
+def _worker_main(conn, memory_limit):
+    """
+    Worker loop: receive (task_id, fn, args, kwargs), send back (task_id, ok, value).
+    """
+    if memory_limit and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        task_id, fn, args, kwargs = task
+        try:
+            message = (task_id, True, fn(*args, **kwargs))
+        except BaseException as e:
+            message = (task_id, False, e)
+        try:
+            conn.send(message)
+        except Exception as e:
+            # Unpicklable result or exception: report it as text instead.
+            conn.send((task_id, False, RuntimeError(f"Could not return task result: {e!r}")))
+
+
+class TaskFuture(Future):
+    """
+    Future for a task on a SymbolicExecutor.
+
+    Unlike a plain Future, cancel() also works while the task is running: the
+    worker is killed and replaced, and result() raises CancelledError.
+    """
+    def __init__(self, executor):
+        super().__init__()
+        self._executor = executor
+
+    def cancel(self):
+        if super().cancel():
+            return True
+        if self.running():
+            self._executor._request_cancel(self)
+            return True
+        return False
+
+
+class _Worker:
+    def __init__(self, context, memory_limit):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, memory_limit), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.future = None
+        self.deadline = None
+        self.task_id = None
+
+    def assign(self, task_id, future, fn, args, kwargs, timeout):
+        """
+        Send a task to the worker. Raises if it cannot be pickled (the pipe is
+        left untouched) or the pipe is broken; the worker stays idle then.
+        """
+        self.conn.send((task_id, fn, args, kwargs))
+        self.task_id = task_id
+        self.future = future
+        self.deadline = time.monotonic() + timeout if timeout else None
+
+    def release(self):
+        future = self.future
+        self.future = self.deadline = self.task_id = None
+        return future
+
+    def kill(self):
+        self.process.kill()
+        self.process.join(1)
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+
+class SymbolicExecutor:
+    """
+    Pool of worker processes for SymPy operations that may hang or blow up.
+
+    Each task gets a wall-clock limit; a worker whose task overruns, is
+    cancelled or dies is killed and replaced by a fresh process, so one
+    pathological expression cannot block the caller or the other tasks.
+    Functions and arguments must be picklable (module-level functions such
+    as differentiate_expression, indefinite_integral or compute_limit).
+
+    Args:
+        max_workers (int, optional): Number of processes (default: CPU count).
+        timeout (float): Default per-task wall-clock limit in seconds (None for no limit).
+        memory_limit (int, optional): Address-space limit per worker in bytes;
+            enforced with RLIMIT_AS where the platform supports it.
+        context (str, optional): multiprocessing start method ('spawn', 'fork', ...).
+    """
+    def __init__(self, max_workers=None, timeout=DEFAULT_TASK_TIMEOUT, memory_limit=None, context=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self._context = multiprocessing.get_context(context)
+        self._pending = deque()
+        self._cancel_requests = set()
+        self._lock = threading.Lock()
+        self._task_ids = 0
+        self._shutdown = False
+        self.respawns = 0
+        self._workers = [_Worker(self._context, memory_limit) for _ in range(self.max_workers)]
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, fn, *args, timeout=None, **kwargs):
+        """
+        Schedule fn(*args, **kwargs) and return a TaskFuture.
+
+        `timeout` overrides the executor's default wall-clock limit for this task.
+        """
+        future = TaskFuture(self)
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit to an executor that has been shut down")
+            self._task_ids += 1
+            self._pending.append((self._task_ids, future, fn, args, kwargs,
+                                  self.timeout if timeout is None else timeout))
+        return future
+
+    def map(self, fn, *iterables, timeout=None, return_exceptions=False):
+        """
+        Apply fn to the zipped iterables in parallel across the workers.
+
+        Args:
+            fn (callable): Picklable function.
+            *iterables: Argument sequences, as for the builtin map.
+            timeout (float, optional): Per-task wall-clock limit.
+            return_exceptions (bool): Put exceptions (TaskTimeout, WorkerCrashed, ...)
+                in the result list instead of raising the first one.
+
+        Returns:
+            list: Results in input order.
+        """
+        futures = [self.submit(fn, *args, timeout=timeout) for args in zip(*iterables)]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except BaseException as e:
+                if not return_exceptions:
+                    for other in futures:
+                        other.cancel()
+                    raise
+                results.append(e)
+        return results
+
+    def _request_cancel(self, future):
+        with self._lock:
+            self._cancel_requests.add(future)
+
+    def _replace(self, index, error):
+        worker = self._workers[index]
+        future = worker.release()
+        worker.kill()
+        self._workers[index] = _Worker(self._context, self.memory_limit)
+        self.respawns += 1
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+    def _assign(self, index, task_id, future, fn, args, kwargs, timeout):
+        """
+        Hand a task to an idle worker; a task that cannot be sent fails alone.
+        """
+        try:
+            self._workers[index].assign(task_id, future, fn, args, kwargs, timeout)
+        except OSError as e:
+            # The worker died while idle: replace it and report the lost task.
+            self._replace(index, None)
+            future.set_exception(WorkerCrashed(f"Could not send the task to its worker: {e!r}"))
+        except Exception as e:
+            # Pickling fails before anything is written, so the worker is still usable.
+            future.set_exception(e)
+
+    def _dispatch_loop(self):
+        while True:
+            with self._lock:
+                for index in range(len(self._workers)):
+                    while self._workers[index].future is None and self._pending:
+                        task_id, future, fn, args, kwargs, timeout = self._pending.popleft()
+                        if future.set_running_or_notify_cancel():
+                            self._assign(index, task_id, future, fn, args, kwargs, timeout)
+                busy = [i for i, w in enumerate(self._workers) if w.future is not None]
+                if self._shutdown and not busy and not self._pending:
+                    break
+                cancels, self._cancel_requests = self._cancel_requests, set()
+
+            if not busy:
+                time.sleep(POLL_INTERVAL)
+                continue
+            ready = wait([self._workers[i].conn for i in busy], timeout=POLL_INTERVAL)
+            now = time.monotonic()
+            for i in busy:
+                worker = self._workers[i]
+                if worker.conn in ready:
+                    try:
+                        task_id, ok, value = worker.conn.recv()
+                    except (EOFError, OSError):
+                        self._replace(i, WorkerCrashed(
+                            f"Worker exited with code {worker.process.exitcode} while running a task"))
+                        continue
+                    future = worker.release()
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+                elif worker.future in cancels:
+                    self._replace(i, CancelledError())
+                elif worker.deadline is not None and now > worker.deadline:
+                    self._replace(i, TaskTimeout("Task exceeded its time limit and its worker was restarted"))
+
+        for worker in self._workers:
+            worker.stop()
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """
+        Stop accepting tasks; finish (or cancel) queued ones, then stop the workers.
+        """
+        with self._lock:
+            self._shutdown = True
+            if cancel_pending:
+                while self._pending:
+                    self._pending.popleft()[1].cancel()
+        if wait:
+            self._dispatcher.join()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": len(self._workers),
+                "busy": sum(w.future is not None for w in self._workers),
+                "pending": len(self._pending),
+                "respawns": self.respawns,
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown(wait=True, cancel_pending=exc[0] is not None)
+
+
+_shared_executor = None
+_shared_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Process-wide executor, started on first use and shut down at exit.
+
+    Its workers are capped at SHARED_MEMORY_LIMIT bytes of address space.
+    """
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            _shared_executor = SymbolicExecutor(memory_limit=SHARED_MEMORY_LIMIT)
+            atexit.register(_shared_executor.shutdown, wait=False, cancel_pending=True)
+        return _shared_executor
+
+
+def run_symbolic(fn, *args, timeout=None, **kwargs):
+    """
+    Run fn(*args, **kwargs) on the shared executor and wait for its result.
+
+    Inside a SymbolicExecutor worker (or any daemonic process, which may not
+    start children) fn runs inline instead, under that worker's own timeout
+    and memory limit; `timeout` is then not enforced.
+
+    Raises:
+        TaskTimeout: The task ran past `timeout` (or the executor's default).
+        WorkerCrashed: The worker died, for example by exceeding its memory limit.
+    """
+    if multiprocessing.current_process().daemon:
+        return fn(*args, **kwargs)
+    return get_executor().submit(fn, *args, timeout=timeout, **kwargs).result()
+
+
+def run_symbolic_cached(operation, key_args, fn, expr_str, *args, timeout=None):
+    """
+    run_symbolic(fn, expr_str, *args), memoized in this process's result cache.
+
+    Workers fill their own caches, which die with them, so the lookup is
+    done here first under the key fn itself uses: `operation`, the parsed
+    expression and `key_args` (see calculus.cache.cached_operation). Error
+    strings returned by fn are passed through without being cached.
+    """
+    from calculus.cache import cached_operation, parse_expression
+
+    try:
+        expr = parse_expression(expr_str)
+    except Exception:
+        # Let fn report the parse error in its usual form.
+        return run_symbolic(fn, expr_str, *args, timeout=timeout)
+
+    def compute():
+        result = run_symbolic(fn, expr_str, *args, timeout=timeout)
+        if isinstance(result, str):
+            raise _ErrorResult(result)
+        return result
+
+    try:
+        return cached_operation(operation, expr, key_args, compute)
+    except _ErrorResult as e:
+        return e.args[0]
+
+
+class _ErrorResult(Exception):
+    """Carries an error string out of a cache computation so it is not stored."""
+
+
+# Example usage
+if __name__ == "__main__":
+    from calculus.differentiation import differentiate_expression
+    from calculus.integration import indefinite_integral
+
+    with SymbolicExecutor(max_workers=2, timeout=5) as executor:
+        exprs = ["x**2 * sin(x)", "exp(x)/x", "log(x)**3", "tan(x)**2"]
+        for expr, d in zip(exprs, executor.map(differentiate_expression, exprs)):
+            print(f"d/dx {expr} = {d}")
+
+        slow = executor.submit(indefinite_integral, "exp(sin(x)**3)*tan(x)**5", timeout=1)
+        try:
+            slow.result()
+        except TaskTimeout as e:
+            print("Timed out:", e)
+        print(executor.stats())
@@ -1,7 +1,15 @@
-from sympy import symbols, integrate, sin, cos, exp, log, tan
-from sympy.parsing.sympy_parser import parse_expr
+from collections import namedtuple
+
+from sympy import symbols, integrate, sin, cos, exp, log, tan, Integral
+from calculus.cache import cached_operation, parse_expression
+from calculus.executor import TaskTimeout, WorkerCrashed, run_symbolic
+from calculus.numeric import compile_expression
+from calculus.quadrature import integrate_numeric
 from sympy import sympify
 
+# Seconds symbolic integration may take before the numeric fallback is used.
+DEFAULT_TIME_BUDGET = 5.0
+
 x = symbols('x')
 
 def indefinite_integral(expr_str, variable='x'):
@@ -17,29 +25,78 @@ def indefinite_integral(expr_str, variable='x'):
     """
     try:
         var = symbols(variable)
-        expr = parse_expr(expr_str)
-        return integrate(expr, var)
+        expr = parse_expression(expr_str)
+        return cached_operation("integrate", expr, (var,), lambda: integrate(expr, var))
     except Exception as e:
         return f"Error in indefinite integration: {e}"
 
-def definite_integral(expr_str, a, b, variable='x'):
+class IntegralResult(namedtuple("IntegralResult", ["value", "error", "method"])):
+    """
+    Outcome of definite_integral: the value, an error estimate (0 for exact
+    symbolic results) and the method that produced it ('symbolic',
+    'gauss-kronrod' or 'tanh-sinh').
+    """
+    def __str__(self):
+        if self.method == "symbolic":
+            return str(self.value)
+        return f"{self.value} (± {self.error:.2g}, {self.method})"
+
+
+def _symbolic_definite(expr, var, a, b, seconds):
+    """
+    Closed-form definite integral, or None if SymPy overruns `seconds`.
+
+    The attempt runs on the shared SymbolicExecutor, whose worker is killed
+    when the budget runs out, so an abandoned integration does not keep
+    burning CPU in the background (inside an executor worker it runs inline,
+    bounded by that worker's budget). Finished results go through the result
+    cache; a budget of None integrates in-process without a limit.
+    """
+    if seconds is None:
+        compute = lambda: integrate(expr, (var, a, b))
+    else:
+        compute = lambda: run_symbolic(integrate, expr, (var, a, b), timeout=seconds)
+    try:
+        return cached_operation("integrate_definite", expr, (var, a, b), compute)
+    except (TaskTimeout, WorkerCrashed):
+        return None
+
+
+def definite_integral(expr_str, a, b, variable='x', time_budget=DEFAULT_TIME_BUDGET, tol=1e-10):
     """
     Compute the definite integral of an expression over [a, b].
 
+    Symbolic integration is tried first, for at most `time_budget` seconds,
+    in a worker process that is killed if it overruns. If it overruns, dies,
+    or returns an unevaluated Integral, the integrand is compiled to NumPy
+    and integrated with adaptive Gauss-Kronrod quadrature, switching to
+    tanh-sinh when Gauss-Kronrod does not converge (typically endpoint
+    singularities).
+
     Args:
         expr_str (str): Expression as a string.
-        a (float): Lower limit.
-        b (float): Upper limit.
+        a (float): Lower limit (may be 'oo' / '-oo').
+        b (float): Upper limit (may be 'oo' / '-oo').
         variable (str): Variable to integrate with respect to (default is 'x').
+        time_budget (float): Seconds allowed for the symbolic attempt (None waits indefinitely).
+        tol (float): Absolute and relative tolerance for the numeric fallback.
 
     Returns:
-        float or symbolic result.
+        IntegralResult: (value, error, method).
     """
     try:
         var = symbols(variable)
-        expr = parse_expr(expr_str)
-        result = integrate(expr, (var, a, b))
-        return result
+        expr = parse_expression(expr_str)
+        a, b = sympify(a), sympify(b)
+        result = _symbolic_definite(expr, var, a, b, time_budget)
+        if result is not None and not result.has(Integral):
+            return IntegralResult(result, 0.0, "symbolic")
+        if expr.free_symbols - {var} or a.free_symbols or b.free_symbols:
+            raise ValueError("no closed form was found within the time budget and the "
+                             "integrand has free parameters, so it cannot be evaluated numerically")
+        f = compile_expression(expr, variable)
+        value, error, method = integrate_numeric(f, float(a), float(b), tol, tol)
+        return IntegralResult(value, error, method)
     except Exception as e:
         return f"Error in definite integration: {e}"
 
@@ -54,3 +111,6 @@ if __name__ == "__main__":
     exprs = ["x", "x**2", "sin(x)", "exp(x)"]
     for expr in exprs:
         print(f"∫₀¹ {expr} dx = {definite_integral(expr, 0, 1)}")
+
+    print("\nNo closed form, numeric fallback:")
+    print(f"∫₀¹ sin(sin(x)) dx = {definite_integral('sin(sin(x))', 0, 1, time_budget=1)}")
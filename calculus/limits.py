@@ -1,10 +1,157 @@
-from sympy import symbols, limit, sin, cos, exp, oo
-from sympy.parsing.sympy_parser import parse_expr
+from collections import Counter
+
+from sympy import sympify, symbols, limit, sin, cos, exp, oo, nan, zoo, S
+from sympy import cancel, fraction, series, Poly, Heaviside, floor, ceiling, frac, sign
+from sympy import (Abs, Add, AccumBounds, DiracDelta, Mod, Mul, Pow, acos, acosh, acot, asin,
+                   asinh, atan, atanh, cosh, cot, coth, csc, erf, log, preorder_traversal, sec,
+                   sinh, tan, tanh)
+from calculus.cache import cached_operation, parse_expression
+
+# How often each tier of the limit engine produced the answer.
+limit_tier_counts = Counter()
+
+# Functions that are continuous wherever they take a finite value. Anything
+# else (Piecewise, Min, user functions, ...) is left to the Gruntz tier.
+_CONTINUOUS = (Add, Mul, Pow, sin, cos, tan, cot, sec, csc, asin, acos, atan, acot,
+               sinh, cosh, tanh, coth, asinh, acosh, atanh, exp, log, Abs, erf)
+
+# Step-like functions, continuous except where this test on their
+# substituted arguments holds.
+_JUMPS = {
+    floor: lambda x: x.is_integer is not False,
+    ceiling: lambda x: x.is_integer is not False,
+    frac: lambda x: x.is_integer is not False,
+    Mod: lambda p, q: (p / q).is_integer is not False,
+    sign: lambda x: x.is_zero is not False,
+    Heaviside: lambda x, *h0: x.is_zero is not False,
+    DiracDelta: lambda x, *k: x.is_zero is not False,
+}
+
+
+def _finite(value):
+    return (value is not None and value.is_number and value.is_finite is True
+            and not value.has(nan, zoo, oo, -oo, AccumBounds))
+
+
+def _smooth(expr):
+    """
+    True if every function in expr is one of the continuous elementary ones.
+    """
+    return all(node.is_Atom or isinstance(node, _CONTINUOUS) for node in preorder_traversal(expr))
+
+
+def _continuous_at(expr, var, point):
+    """
+    True if every subexpression is finite at the point and no step function
+    sits on a jump, so that substitution gives the limit.
+    """
+    for node in preorder_traversal(expr):
+        if node.is_Atom:
+            continue
+        values = [arg.subs(var, point) for arg in node.args]
+        if not all(_finite(v) for v in values):
+            return False
+        if isinstance(node, Pow) and values[0].is_zero is not False and values[1].is_zero is not False:
+            return False  # 0**0 is indeterminate
+        jump = _JUMPS.get(node.func)
+        if jump is not None:
+            if jump(*values):
+                return False
+        elif not isinstance(node, _CONTINUOUS):
+            return False
+    return True
+
+
+def _by_substitution(expr, var, point):
+    """
+    Tier 1: plain substitution, valid when the expression is continuous at the point.
+    """
+    if not point.is_finite or not _continuous_at(expr, var, point):
+        return None
+    value = expr.subs(var, point)
+    return value if _finite(value) else None
+
+
+def _by_cancellation(expr, var, point, direction):
+    """
+    Tier 2: rational functions. Cancel common factors and substitute; at
+    infinity compare the degrees of numerator and denominator.
+    """
+    if not expr.is_rational_function(var) or expr.free_symbols - {var}:
+        return None
+    reduced = cancel(expr)
+    if point.is_finite:
+        value = reduced.subs(var, point)
+        return value if _finite(value) else None
+    num, den = fraction(reduced)
+    num, den = Poly(num, var), Poly(den, var)
+    ratio = num.LC() / den.LC()
+    excess = num.degree() - den.degree()
+    if excess < 0:
+        return S.Zero
+    if excess == 0:
+        return ratio
+    # x**excess -> oo, with sign (-1)**excess at -oo.
+    return sign(ratio) * (-1 if point == -oo and excess % 2 else 1) * oo
+
+
+def _by_series(expr, var, point, direction):
+    """
+    Tier 3: leading terms of a series expansion around a finite point.
+
+    Accepted only when the truncated expansion is a polynomial in the
+    variable, i.e. has no poles or logarithms; for a two-sided limit both
+    one-sided expansions must agree.
+    """
+    if not point.is_finite or not _smooth(expr):
+        return None
+    values = []
+    for side in (["+", "-"] if direction == "" else [direction]):
+        expansion = series(expr, var, point, n=3, dir=side).removeO()
+        if not expansion.is_polynomial(var):
+            return None
+        values.append(expansion.subs(var, point))
+    if all(_finite(v) for v in values) and all(v == values[0] for v in values):
+        return values[0]
+    return None
+
+
+def _layered_limit(expr, var, point, direction):
+    tiers = [
+        ("substitution", lambda: _by_substitution(expr, var, point)),
+        ("cancellation", lambda: _by_cancellation(expr, var, point, direction)),
+        ("series", lambda: _by_series(expr, var, point, direction)),
+    ]
+    for name, attempt in tiers:
+        try:
+            value = attempt()
+        except Exception:
+            value = None
+        if value is not None:
+            limit_tier_counts[name] += 1
+            return value
+    limit_tier_counts["gruntz"] += 1
+    return limit(expr, var, point, dir=direction or "+-")
+
+
+def limit_tier_stats():
+    """
+    Counts and hit rates of the limit engine's tiers (cache hits are not counted).
+    """
+    total = sum(limit_tier_counts.values())
+    return {name: {"count": count, "rate": count / total}
+            for name, count in limit_tier_counts.items()}
+
 
 def compute_limit(expr_str, var_str='x', point=0, direction="+"):
     """
     Compute the limit of an expression as the variable approaches a point.
 
+    Cheap tiers are tried before SymPy's full (Gruntz) limit: direct
+    substitution where the expression is continuous, cancellation for
+    rational functions, then a short series expansion. The tier that
+    answered is tallied in limit_tier_counts.
+
     Args:
         expr_str (str): The expression (string) whose limit is to be evaluated.
         var_str (str): The variable (default 'x').
@@ -16,12 +163,14 @@ def compute_limit(expr_str, var_str='x', point=0, direction="+"):
     """
     try:
         var = symbols(var_str)
-        expr = parse_expr(expr_str)
+        expr = parse_expression(expr_str)
         if point == "oo":
             point = oo
         elif point == "-oo":
             point = -oo
-        return limit(expr, var, point, dir=direction)
+        point = sympify(point)
+        return cached_operation("limit", expr, (var, point, direction),
+                                lambda: _layered_limit(expr, var, point, direction))
     except Exception as e:
         return f"Error computing limit: {e}"
 
@@ -41,4 +190,5 @@ if __name__ == "__main__":
         dirn = opt_dir[0] if opt_dir else ""
         result = compute_limit(expr, var, point, dirn)
         print(f"lim {var}→{point}{'^' + dirn if dirn else ''} of {expr} = {result}")
+    print("Tier hit rates:", limit_tier_stats())
 
@@ -0,0 +1,140 @@
+import numpy as np
+from sympy import ImmutableMatrix, lambdify
+
+from calculus.cache import as_expression, as_symbols, canonical_key, cached_operation
+from calculus.differentiation import SIMPLIFIERS, SIMPLIFY_NONE
+from calculus.numeric import compiled_cache
+
+
+def _expressions(exprs):
+    if isinstance(exprs, str) or not hasattr(exprs, "__iter__"):
+        exprs = [exprs]
+    return [as_expression(e) for e in exprs]
+
+
+def jacobian_matrix(exprs, variables, simplify_level=SIMPLIFY_NONE):
+    """
+    Symbolic Jacobian of a vector of expressions.
+
+    Each expression is parsed once and differentiated with respect to all
+    variables in one pass; the result is cached as a whole.
+
+    Args:
+        exprs (str or sequence): Expression(s), as strings or sympy expressions.
+        variables (str or sequence): Variable names, e.g. 'x, y, z'.
+        simplify_level (int): As in differentiate_expression (default: no simplification).
+
+    Returns:
+        ImmutableMatrix: Shape (len(exprs), len(variables)).
+    """
+    F = ImmutableMatrix(_expressions(exprs))
+    syms = as_symbols(variables)
+    simplifier = SIMPLIFIERS[simplify_level]
+    return cached_operation("jacobian", F, (tuple(syms), simplify_level),
+                            lambda: F.jacobian(syms).applyfunc(simplifier))
+
+
+def gradient_vector(expr, variables, simplify_level=SIMPLIFY_NONE):
+    """
+    Symbolic gradient of a single expression, as a 1 x n row matrix.
+    """
+    return jacobian_matrix([expr], variables, simplify_level)
+
+
+def hessian_matrix(expr, variables, simplify_level=SIMPLIFY_NONE):
+    """
+    Symbolic Hessian of a single expression.
+
+    Second derivatives are taken from the gradient entries and only for the
+    upper triangle; the lower triangle is mirrored.
+
+    Returns:
+        ImmutableMatrix: Shape (n, n), symmetric.
+    """
+    f = _expressions([expr])[0]
+    syms = as_symbols(variables)
+    simplifier = SIMPLIFIERS[simplify_level]
+
+    def compute():
+        first = [f.diff(s) for s in syms]
+        n = len(syms)
+        entries = [[None] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i, n):
+                entries[i][j] = entries[j][i] = simplifier(first[i].diff(syms[j]))
+        return ImmutableMatrix(entries)
+
+    return cached_operation("hessian", f, (tuple(syms), simplify_level), compute)
+
+
+def compile_matrix(matrix, variables, symmetric=False):
+    """
+    Compile a matrix of expressions into one vectorized NumPy function.
+
+    All entries go through a single common-subexpression elimination, so
+    work shared between entries (typical for Jacobians and Hessians) is done
+    once per call. For symmetric matrices only the upper triangle is
+    generated.
+
+    Args:
+        matrix (sympy Matrix): Entries to compile.
+        variables (str or sequence): Variable names in argument order.
+        symmetric (bool): Mirror the upper triangle instead of evaluating both halves.
+
+    Returns:
+        callable: f(*arrays) -> ndarray of shape batch_shape + matrix.shape.
+    """
+    matrix = ImmutableMatrix(matrix)
+    syms = as_symbols(variables)
+    m, n = matrix.shape
+    positions = [(i, j) for i in range(m) for j in range(i if symmetric else 0, n)]
+
+    def build():
+        raw = lambdify(syms, [matrix[i, j] for i, j in positions], modules="numpy", cse=True)
+
+        def compiled(*args):
+            args = [np.asarray(a, dtype=float) for a in args]
+            batch = np.broadcast_shapes(*(a.shape for a in args))
+            out = np.empty(batch + (m, n))
+            for (i, j), value in zip(positions, raw(*args)):
+                out[..., i, j] = value
+                if symmetric:
+                    out[..., j, i] = value
+            return out
+        return compiled
+
+    return compiled_cache.get_or_compute(canonical_key("compile_matrix", matrix, *syms, symmetric), build)
+
+
+def jacobian_function(exprs, variables):
+    """
+    Compiled Jacobian: f(*arrays) -> (*batch, len(exprs), len(variables)).
+    """
+    return compile_matrix(jacobian_matrix(exprs, variables), variables)
+
+
+def gradient_function(expr, variables):
+    """
+    Compiled gradient: f(*arrays) -> (*batch, len(variables)).
+    """
+    compiled = compile_matrix(gradient_vector(expr, variables), variables)
+    return lambda *args: compiled(*args)[..., 0, :]
+
+
+def hessian_function(expr, variables):
+    """
+    Compiled Hessian: f(*arrays) -> (*batch, n, n).
+    """
+    return compile_matrix(hessian_matrix(expr, variables), variables, symmetric=True)
+
+
+# Example usage
+if __name__ == "__main__":
+    exprs = ["x**2*y + sin(z)", "exp(x*y*z)", "x*y + y*z + z*x"]
+    print("Jacobian:", jacobian_matrix(exprs, "x, y, z"))
+    print("Hessian of exp(x*y*z):", hessian_matrix("exp(x*y*z)", "x, y, z"))
+
+    points = np.random.default_rng(0).uniform(-1, 1, (3, 100_000))
+    J = jacobian_function(exprs, "x, y, z")(*points)
+    H = hessian_function("exp(x*y*z)", "x, y, z")(*points)
+    print("Batched Jacobian:", J.shape, "Batched Hessian:", H.shape)
@@ -0,0 +1,146 @@
+import numpy as np
+from sympy import Basic, lambdify, symbols, sympify
+
+from calculus.cache import ExpressionCache, canonical_key, parse_expression
+
+# Compiled callables are not picklable, so they get their own in-memory cache.
+compiled_cache = ExpressionCache()
+
+
+def compile_expression(expr, variables='x'):
+    """
+    Compile an expression into a vectorized NumPy callable.
+
+    The expression is lambdified with common-subexpression elimination, so
+    shared subterms are computed once per call, and the callable is cached
+    on the expression's canonical form. Results of differentiate_expression
+    and indefinite_integral can be passed in directly.
+
+    Args:
+        expr (str or sympy expression): Expression to compile.
+        variables (str or sequence): Variable name(s), in argument order.
+
+    Returns:
+        callable: f(*arrays) -> ndarray, broadcasting over its inputs.
+    """
+    if isinstance(expr, str):
+        if expr.startswith("Error"):
+            raise ValueError(expr)
+        expr = parse_expression(expr)
+    elif not isinstance(expr, Basic):
+        expr = sympify(expr)
+    if isinstance(variables, str):
+        variables = [v.strip() for v in variables.split(",")]
+    syms = symbols(list(variables))
+
+    def build():
+        raw = lambdify(syms, expr, modules="numpy", cse=True)
+
+        def compiled(*args):
+            args = [np.asarray(a, dtype=float) for a in args]
+            # Constant expressions return a scalar; broadcast to the input shape.
+            return np.asarray(raw(*args)) + np.zeros(np.broadcast(*args).shape) if args else raw()
+        compiled.expression = expr
+        compiled.variables = tuple(syms)
+        return compiled
+
+    return compiled_cache.get_or_compute(canonical_key("compile", expr, *syms), build)
+
+
+def adaptive_sample(f, a, b, initial_points=65, max_points=4097, tol=1e-3, max_rounds=12):
+    """
+    Sample f on [a, b], refining where the graph bends.
+
+    Each round evaluates every interval midpoint in one vectorized call and
+    keeps the midpoints where f deviates from the straight line through the
+    endpoints by more than `tol` times the sampled range of f. Non-finite
+    values (poles, domain gaps) also trigger refinement, down to a minimum
+    spacing of (b - a) * 1e-6.
+
+    Args:
+        f (callable): Vectorized function of one array argument.
+        a, b (float): Interval endpoints.
+        initial_points (int): Size of the starting uniform grid.
+        max_points (int): Upper bound on the number of samples returned.
+        tol (float): Relative deviation that triggers refinement.
+        max_rounds (int): Maximum number of refinement rounds.
+
+    Returns:
+        tuple: (x, y) arrays sorted by x.
+    """
+    x = np.linspace(a, b, initial_points)
+    with np.errstate(all='ignore'):
+        y = np.asarray(f(x), dtype=float)
+        min_width = abs(b - a) * 1e-6
+        for _ in range(max_rounds):
+            mid = (x[:-1] + x[1:]) / 2
+            y_mid = np.asarray(f(mid), dtype=float)
+            finite = np.isfinite(y)
+            scale = np.ptp(y[finite]) if finite.any() else 1.0
+            scale = scale or 1.0
+            deviation = np.abs(y_mid - (y[:-1] + y[1:]) / 2)
+            deviation = np.where(np.isfinite(deviation), deviation, np.inf)
+            refine = (deviation > tol * scale) & (np.diff(x) > min_width)
+            budget = max_points - len(x)
+            if not refine.any() or budget <= 0:
+                break
+            chosen = np.flatnonzero(refine)
+            if len(chosen) > budget:
+                chosen = chosen[np.argsort(deviation[chosen])[::-1][:budget]]
+            x = np.concatenate([x, mid[chosen]])
+            y = np.concatenate([y, y_mid[chosen]])
+            order = np.argsort(x, kind="stable")
+            x, y = x[order], y[order]
+    return x, y
+
+
+def evaluate_expression(expr, x, variable='x'):
+    """
+    Evaluate an expression (string or sympy) on an array of points through its compiled form.
+    """
+    return compile_expression(expr, variable)(x)
+
+
+def sample_expression(expr, a, b, variable='x', **options):
+    """
+    Adaptive samples (x, y) of an expression on [a, b]; options go to adaptive_sample.
+    """
+    return adaptive_sample(compile_expression(expr, variable), a, b, **options)
+
+
+def plot_expression(expr, a, b, variable='x', ax=None, label=None, **options):
+    """
+    Plot an expression on [a, b] from adaptive samples.
+
+    Args:
+        expr (str or sympy expression): Expression to plot.
+        a, b (float): Interval endpoints.
+        variable (str): Variable name.
+        ax (matplotlib Axes, optional): Axes to draw on; a new figure is created if omitted.
+        label (str, optional): Legend label (defaults to the expression).
+
+    Returns:
+        matplotlib Axes.
+    """
+    if ax is None:
+        import matplotlib.pyplot as plt
+        _, ax = plt.subplots()
+    x, y = sample_expression(expr, a, b, variable, **options)
+    ax.plot(x, np.where(np.isfinite(y), y, np.nan), label=label or str(expr))
+    return ax
+
+
+# Example usage
+if __name__ == "__main__":
+    from calculus.differentiation import differentiate_expression
+
+    f = compile_expression("sin(x)**2 + sin(x)*cos(x)")
+    grid = np.linspace(0, 10, 1_000_000)
+    print("f on 10^6 points, first values:", f(grid)[:3])
+
+    df = compile_expression(differentiate_expression("exp(-x**2)*sin(5*x)"))
+    print("Derivative at 0, 1:", df(np.array([0.0, 1.0])))
+
+    x, y = sample_expression("sin(1/x)", 0.01, 1)
+    print(f"Adaptive grid for sin(1/x) on [0.01, 1]: {len(x)} points,",
+          f"{np.count_nonzero(x < 0.1)} of them below x = 0.1")
@@ -0,0 +1,153 @@
+import numpy as np
+
+# Gauss-Kronrod 7/15 rule on [-1, 1]: Kronrod nodes (positive half, 0 last),
+# Kronrod weights, and the weights of the embedded 7-point Gauss rule, whose
+# nodes are every other Kronrod node.
+_XGK = np.array([0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+                 0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+                 0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+                 0.207784955007898467600689403773245, 0.0])
+_WGK = np.array([0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+                 0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+                 0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+                 0.204432940075298892414161999234649, 0.209482141084727828012999174891714])
+_WG = np.array([0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+                0.381830050505118944950369775488975, 0.417959183673469387755102040816327])
+
+NODES = np.concatenate([-_XGK[:-1], _XGK[::-1]])
+KRONROD_WEIGHTS = np.concatenate([_WGK[:-1], _WGK[::-1]])
+GAUSS_WEIGHTS = np.zeros(15)
+GAUSS_WEIGHTS[1::2] = np.concatenate([_WG[:-1], _WG[::-1]])
+
+
+def _finite_transform(f, a, b):
+    """
+    Rewrite the integral of f over [a, b] as an integral over a finite interval.
+
+    Infinite endpoints are mapped with x = t / (1 - t) style substitutions;
+    neither rule below evaluates the transformed integrand at the endpoints.
+    """
+    if np.isfinite(a) and np.isfinite(b):
+        return f, a, b
+    if np.isfinite(a):
+        return (lambda t: f(a + t / (1 - t)) / (1 - t) ** 2), 0.0, 1.0
+    if np.isfinite(b):
+        return (lambda t: f(b - (1 - t) / t) / t ** 2), 0.0, 1.0
+    return (lambda t: f(t / (1 - t ** 2)) * (1 + t ** 2) / (1 - t ** 2) ** 2), -1.0, 1.0
+
+
+def _evaluate(f, x):
+    with np.errstate(all='ignore'):
+        y = np.asarray(f(x), dtype=float) + np.zeros(x.shape)
+    # Integrable endpoint singularities can still produce inf/nan at a node.
+    return np.where(np.isfinite(y), y, 0.0)
+
+
+def gauss_kronrod(f, a, b, abs_tol=1e-10, rel_tol=1e-10, max_intervals=2000):
+    """
+    Adaptive Gauss-Kronrod (G7/K15) quadrature with vectorized refinement.
+
+    Every round evaluates all unconverged subintervals in one call of f on a
+    (m, 15) array of nodes. A subinterval is accepted once its |K15 - G7|
+    estimate is below its share of the tolerance; the rest are bisected.
+
+    Args:
+        f (callable): Vectorized integrand.
+        a, b (float): Limits; either may be infinite.
+        abs_tol, rel_tol (float): Target absolute / relative error.
+        max_intervals (int): Cap on the number of live subintervals.
+
+    Returns:
+        tuple: (value, error_estimate, converged).
+    """
+    f, a, b = _finite_transform(f, a, b)
+    lo, hi = np.array([a], dtype=float), np.array([b], dtype=float)
+    total, error = 0.0, 0.0
+    width = b - a
+    while len(lo):
+        center, half = (lo + hi) / 2, (hi - lo) / 2
+        y = _evaluate(f, center[:, None] + half[:, None] * NODES)
+        kronrod = half * (y @ KRONROD_WEIGHTS)
+        gauss = half * (y @ GAUSS_WEIGHTS)
+        err = np.abs(kronrod - gauss)
+
+        estimate = total + kronrod.sum()
+        target = max(abs_tol, rel_tol * abs(estimate))
+        done = err <= target * (hi - lo) / width
+        if len(lo) * 2 > max_intervals:
+            done[:] = True
+        total += kronrod[done].sum()
+        error += err[done].sum()
+        split_lo, split_hi, split_mid = lo[~done], hi[~done], center[~done]
+        lo = np.concatenate([split_lo, split_mid])
+        hi = np.concatenate([split_mid, split_hi])
+    return float(total), float(error), bool(error <= max(abs_tol, rel_tol * abs(total)))
+
+
+def tanh_sinh(f, a, b, abs_tol=1e-10, rel_tol=1e-10, max_level=10):
+    """
+    Tanh-sinh (double-exponential) quadrature.
+
+    The substitution x = tanh(pi/2 sinh t) clusters nodes double-exponentially
+    at the endpoints, which handles integrable endpoint singularities that
+    make Gauss-Kronrod subdivide without end. Each level halves the step and
+    only evaluates the new nodes; the error estimate is the change between
+    levels.
+
+    Args:
+        f (callable): Vectorized integrand.
+        a, b (float): Limits; either may be infinite.
+        abs_tol, rel_tol (float): Target absolute / relative error.
+        max_level (int): Maximum number of step halvings.
+
+    Returns:
+        tuple: (value, error_estimate, converged).
+    """
+    f, a, b = _finite_transform(f, a, b)
+    half = (b - a) / 2
+    t_max = 3.2  # beyond this the weights underflow in double precision
+
+    def level_sum(t):
+        s = np.pi / 2 * np.sinh(t)
+        weight = np.pi / 2 * np.cosh(t) / np.cosh(s) ** 2
+        # Distance to the nearer endpoint, computed without cancellation.
+        gap = half * 2 / (1 + np.exp(2 * np.abs(s)))
+        x = np.where(s < 0, a + gap, b - gap)
+        return half * (_evaluate(f, x) * weight).sum()
+
+    h = 1.0
+    total = level_sum(np.arange(-t_max, t_max + h / 2, h)) * h
+    error = np.inf
+    for _ in range(max_level):
+        h /= 2
+        new = level_sum(np.arange(-t_max + h, t_max, 2 * h))
+        refined = total / 2 + new * h
+        error = abs(refined - total)
+        total = refined
+        if error <= max(abs_tol, rel_tol * abs(total)):
+            return float(total), float(error), True
+    return float(total), float(error), False
+
+
+def integrate_numeric(f, a, b, abs_tol=1e-10, rel_tol=1e-10):
+    """
+    Gauss-Kronrod first, tanh-sinh if that does not converge.
+
+    Returns:
+        tuple: (value, error_estimate, method) for the better of the two attempts.
+    """
+    value, error, converged = gauss_kronrod(f, a, b, abs_tol, rel_tol)
+    if converged:
+        return value, error, "gauss-kronrod"
+    ts_value, ts_error, _ = tanh_sinh(f, a, b, abs_tol, rel_tol)
+    if ts_error < error:
+        return ts_value, ts_error, "tanh-sinh"
+    return value, error, "gauss-kronrod"
+
+
+# Example usage
+if __name__ == "__main__":
+    print("∫₀^π sin(x) dx =", integrate_numeric(np.sin, 0, np.pi))
+    print("∫₀¹ 1/sqrt(x) dx =", integrate_numeric(lambda x: 1 / np.sqrt(x), 0, 1))
+    print("∫ exp(-x²) dx over ℝ =", integrate_numeric(lambda x: np.exp(-x ** 2), -np.inf, np.inf),
+          "(√π =", np.sqrt(np.pi), ")")
@@ -0,0 +1 @@
+# Lets pytest import the top-level packages (algebra, calculus, ...) from tests/.
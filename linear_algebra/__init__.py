@@ -1,3 +1,14 @@
-from .eigenstuff import *
-from .matrix_ops import *
-from .vector_spaces import *
\ No newline at end of file
+from utils.lazy import lazy_package
+
+# Submodules are imported on first use of one of their names.
+__getattr__, __dir__, __all__ = lazy_package(__name__, [
+    "batched",
+    "eigenstuff",
+    "exact",
+    "expression",
+    "factorization",
+    "matrix_ops",
+    "out_of_core",
+    "sparse",
+    "vector_spaces",
+])
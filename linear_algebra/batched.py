@@ -0,0 +1,235 @@
+import numpy as np
+
+# Matrices processed per chunk of a stacked (..., n, n) batch; bounds the
+# temporaries of the closed-form kernels and of LAPACK's stacked routines.
+BATCH_CHUNK_SIZE = 65536
+# Largest size with a closed-form determinant / inverse kernel.
+CLOSED_FORM_MAX_SIZE = 4
+
+
+def _check_stack(A):
+    A = np.asarray(A)
+    if A.ndim < 2 or A.shape[-1] != A.shape[-2]:
+        raise ValueError("Expected a square matrix or a stack of square matrices with shape (..., n, n).")
+    return A
+
+
+def map_chunks(func, A, chunk_size=BATCH_CHUNK_SIZE, core_ndim=2):
+    """
+    Apply func to a stacked array in chunks along its flattened batch axes.
+
+    func receives arrays of shape (k,) + core_shape and returns an array or
+    a tuple of arrays with a leading axis of length k. Outputs are written
+    into preallocated arrays, so peak memory is the result plus one chunk
+    of temporaries.
+
+    Parameters:
+        func (callable): Kernel working on a flat batch.
+        A (ndarray): Input of shape batch_shape + core_shape.
+        chunk_size (int): Matrices per chunk.
+        core_ndim (int): Number of trailing axes forming one item (2 for matrices).
+
+    Returns:
+        ndarray or tuple of ndarrays with shape batch_shape + result_core_shape.
+    """
+    batch_shape = A.shape[:A.ndim - core_ndim]
+    flat = A.reshape((-1,) + A.shape[A.ndim - core_ndim:])
+    count = len(flat)
+    outputs = None
+    for start in range(0, max(count, 1), chunk_size):
+        result = func(flat[start:start + chunk_size])
+        single = not isinstance(result, tuple)
+        result = (result,) if single else result
+        if outputs is None:
+            outputs = [np.empty((count,) + r.shape[1:], dtype=r.dtype) for r in result]
+        for k, r in enumerate(result):
+            if not np.can_cast(r.dtype, outputs[k].dtype):
+                # e.g. np.linalg.eig returns complex only for chunks that need it.
+                outputs[k] = outputs[k].astype(np.result_type(outputs[k], r))
+            outputs[k][start:start + chunk_size] = r
+    outputs = tuple(out.reshape(batch_shape + out.shape[1:]) for out in outputs)
+    return outputs[0] if single else outputs
+
+
+# Closed-form kernels on flat batches of shape (k, n, n)
+
+def _det2(A):
+    return A[:, 0, 0] * A[:, 1, 1] - A[:, 0, 1] * A[:, 1, 0]
+
+
+def _det3(A):
+    a, b, c = A[:, 0, 0], A[:, 0, 1], A[:, 0, 2]
+    d, e, f = A[:, 1, 0], A[:, 1, 1], A[:, 1, 2]
+    g, h, i = A[:, 2, 0], A[:, 2, 1], A[:, 2, 2]
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+
+def _minors4(A):
+    """
+    The twelve 2x2 minors of the top and bottom row pairs of 4x4 matrices.
+    """
+    a = [[A[:, i, j] for j in range(4)] for i in range(4)]
+    s = [a[0][0] * a[1][1] - a[1][0] * a[0][1], a[0][0] * a[1][2] - a[1][0] * a[0][2],
+         a[0][0] * a[1][3] - a[1][0] * a[0][3], a[0][1] * a[1][2] - a[1][1] * a[0][2],
+         a[0][1] * a[1][3] - a[1][1] * a[0][3], a[0][2] * a[1][3] - a[1][2] * a[0][3]]
+    c = [a[2][0] * a[3][1] - a[3][0] * a[2][1], a[2][0] * a[3][2] - a[3][0] * a[2][2],
+         a[2][0] * a[3][3] - a[3][0] * a[2][3], a[2][1] * a[3][2] - a[3][1] * a[2][2],
+         a[2][1] * a[3][3] - a[3][1] * a[2][3], a[2][2] * a[3][3] - a[3][2] * a[2][3]]
+    return a, s, c
+
+
+def _det4_from_minors(s, c):
+    return s[0] * c[5] - s[1] * c[4] + s[2] * c[3] + s[3] * c[2] - s[4] * c[1] + s[5] * c[0]
+
+
+def _det4(A):
+    _, s, c = _minors4(A)
+    return _det4_from_minors(s, c)
+
+
+def _adj2(A):
+    adj = np.empty_like(A)
+    adj[:, 0, 0], adj[:, 1, 1] = A[:, 1, 1], A[:, 0, 0]
+    adj[:, 0, 1], adj[:, 1, 0] = -A[:, 0, 1], -A[:, 1, 0]
+    return adj, _det2(A)
+
+
+def _adj3(A):
+    adj = np.empty_like(A)
+    for i in range(3):
+        for j in range(3):
+            # Cofactor of entry (j, i), with cyclic indices absorbing the sign.
+            r0, r1 = (j + 1) % 3, (j + 2) % 3
+            c0, c1 = (i + 1) % 3, (i + 2) % 3
+            adj[:, i, j] = A[:, r0, c0] * A[:, r1, c1] - A[:, r0, c1] * A[:, r1, c0]
+    det = (A[:, 0, 0] * adj[:, 0, 0] + A[:, 0, 1] * adj[:, 1, 0] + A[:, 0, 2] * adj[:, 2, 0])
+    return adj, det
+
+
+def _adj4(A):
+    a, s, c = _minors4(A)
+    adj = np.empty_like(A)
+    adj[:, 0, 0] = a[1][1] * c[5] - a[1][2] * c[4] + a[1][3] * c[3]
+    adj[:, 0, 1] = -a[0][1] * c[5] + a[0][2] * c[4] - a[0][3] * c[3]
+    adj[:, 0, 2] = a[3][1] * s[5] - a[3][2] * s[4] + a[3][3] * s[3]
+    adj[:, 0, 3] = -a[2][1] * s[5] + a[2][2] * s[4] - a[2][3] * s[3]
+    adj[:, 1, 0] = -a[1][0] * c[5] + a[1][2] * c[2] - a[1][3] * c[1]
+    adj[:, 1, 1] = a[0][0] * c[5] - a[0][2] * c[2] + a[0][3] * c[1]
+    adj[:, 1, 2] = -a[3][0] * s[5] + a[3][2] * s[2] - a[3][3] * s[1]
+    adj[:, 1, 3] = a[2][0] * s[5] - a[2][2] * s[2] + a[2][3] * s[1]
+    adj[:, 2, 0] = a[1][0] * c[4] - a[1][1] * c[2] + a[1][3] * c[0]
+    adj[:, 2, 1] = -a[0][0] * c[4] + a[0][1] * c[2] - a[0][3] * c[0]
+    adj[:, 2, 2] = a[3][0] * s[4] - a[3][1] * s[2] + a[3][3] * s[0]
+    adj[:, 2, 3] = -a[2][0] * s[4] + a[2][1] * s[2] - a[2][3] * s[0]
+    adj[:, 3, 0] = -a[1][0] * c[3] + a[1][1] * c[1] - a[1][2] * c[0]
+    adj[:, 3, 1] = a[0][0] * c[3] - a[0][1] * c[1] + a[0][2] * c[0]
+    adj[:, 3, 2] = -a[3][0] * s[3] + a[3][1] * s[1] - a[3][2] * s[0]
+    adj[:, 3, 3] = a[2][0] * s[3] - a[2][1] * s[1] + a[2][2] * s[0]
+    return adj, _det4_from_minors(s, c)
+
+
+_DET_KERNELS = {1: lambda A: A[:, 0, 0], 2: _det2, 3: _det3, 4: _det4}
+_ADJ_KERNELS = {1: lambda A: (np.ones_like(A), A[:, 0, 0]), 2: _adj2, 3: _adj3, 4: _adj4}
+
+
+def _equilibrate(A):
+    """
+    Scale every row to unit max-norm; returns the scaled stack and the row scales.
+
+    Determinants and adjugates of the scaled matrices neither overflow nor
+    underflow, whatever the magnitude of A; zero rows are left as they are.
+    """
+    scale = np.abs(A).max(axis=-1)
+    scale = np.where(scale == 0, 1, scale)
+    return A / scale[..., None], scale
+
+
+def _rcond(A, inv):
+    """
+    Reciprocal 1-norm condition numbers 1 / (||A||_1 ||inv(A)||_1) of a stack:
+    the quantity FactorizedMatrix.rcond estimates for a single matrix. NaN or
+    0 where the inverse is not finite or A is zero.
+    """
+    anorm = np.abs(A).sum(axis=-2).max(axis=-1)
+    inorm = np.abs(inv).sum(axis=-2).max(axis=-1)
+    return 1 / anorm / inorm
+
+
+def batched_det(A, chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Determinants of a stack of square matrices.
+
+    Sizes up to 4x4 use closed-form expansions vectorized over the batch;
+    larger matrices use LAPACK's stacked LU. Both run chunk by chunk.
+
+    Parameters:
+        A (array-like): Shape (..., n, n).
+        chunk_size (int): Matrices per chunk.
+
+    Returns:
+        ndarray: Shape (...,) (a scalar for a single matrix).
+    """
+    A = _check_stack(A)
+    A = A.astype(np.result_type(A, float), copy=False)
+    kernel = _DET_KERNELS.get(A.shape[-1], np.linalg.det)
+    result = map_chunks(kernel, A, chunk_size)
+    return result[()] if result.ndim == 0 else result
+
+
+def batched_inverse(A, chunk_size=BATCH_CHUNK_SIZE, singular="raise"):
+    """
+    Inverses of a stack of square matrices.
+
+    Sizes up to 4x4 use the adjugate formula, adj(A) / det(A), vectorized
+    over the batch; larger matrices use LAPACK's stacked inverse. Rows are
+    equilibrated first so that the determinant and adjugate cannot under- or
+    overflow. A matrix counts as singular when its reciprocal 1-norm
+    condition number is below n * eps, the test inverse() applies to a
+    single matrix (FactorizedMatrix.is_singular), so both paths agree.
+
+    Parameters:
+        A (array-like): Shape (..., n, n).
+        chunk_size (int): Matrices per chunk.
+        singular (str): 'raise' (ValueError if any matrix is singular) or
+            'nan' (fill those inverses with NaN).
+
+    Returns:
+        ndarray: Shape (..., n, n).
+    """
+    A = _check_stack(A)
+    A = A.astype(np.result_type(A, float), copy=False)
+    n = A.shape[-1]
+    tol = n * np.finfo(A.dtype).eps
+    if singular not in ("raise", "nan"):
+        raise ValueError(f"Unknown singular policy: {singular}")
+
+    def kernel(block):
+        scaled, scale = _equilibrate(block)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            if n <= CLOSED_FORM_MAX_SIZE:
+                adj, det = _ADJ_KERNELS[n](scaled)
+                inv = adj / det[:, None, None]
+            else:
+                inv = np.full_like(scaled, np.nan)
+                # LAPACK's stacked inverse raises on an exactly zero pivot.
+                pivoted = np.linalg.slogdet(scaled)[0] != 0
+                inv[pivoted] = np.linalg.inv(scaled[pivoted])
+            # A = diag(scale) @ scaled, so inv(A) = inv(scaled) @ diag(1 / scale).
+            inv /= scale[:, None, :]
+            bad = ~(_rcond(block, inv) >= tol)
+        if bad.any() and singular == "raise":
+            raise ValueError("Matrix is singular and not invertible.")
+        inv[bad] = np.nan
+        return inv
+
+    return map_chunks(kernel, A, chunk_size)
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    stack = rng.standard_normal((1_000_000, 4, 4))
+    det = batched_det(stack)
+    print("Max |det - numpy det| over 10^6 4x4 matrices:", np.abs(det - np.linalg.det(stack)).max())
+    inv = batched_inverse(stack[:1000])
+    print("Max |A @ inv(A) - I| for 1000 of them:", np.abs(stack[:1000] @ inv - np.eye(4)).max())
@@ -1,21 +1,245 @@
 import numpy as np
+from linear_algebra.batched import BATCH_CHUNK_SIZE, map_chunks
+from linear_algebra.matrix_ops import _is_sparse
 
-def eigenvalues_and_vectors(matrix):
+# Sparse input up to this size is densified for a full eigendecomposition.
+DENSE_EIGEN_LIMIT = 2000
+# Symmetric matrices whose bandwidth is at most this fraction of n use the banded solver.
+BANDED_FRACTION = 0.1
+
+def _bandwidths(matrix):
+    """
+    Lower and upper bandwidth: how far non-zeros reach below / above the diagonal.
+
+    Diagonals are scanned from the corners inwards as views, so nothing of
+    the matrix's size is allocated, and a dense matrix stops at the first one.
+    """
+    def reach(offsets):
+        for k in offsets:
+            if np.count_nonzero(np.diagonal(matrix, k)):
+                return abs(k)
+        return 0
+
+    n = len(matrix)
+    return reach(range(-(n - 1), 0)), reach(range(n - 1, 0, -1))
+
+def detect_structure(matrix, tol=1e-12):
+    """
+    Classify a square matrix for eigen-solver dispatch in O(n^2).
+
+    Parameters:
+        matrix (ndarray): Square matrix.
+        tol (float): Relative tolerance of the symmetry (Hermitian) test.
+
+    Returns:
+        tuple: (structure, bandwidth) where structure is one of 'diagonal',
+        'upper_triangular', 'lower_triangular', 'tridiagonal', 'banded',
+        'symmetric' or 'general'; the last three imply Hermitian.
+    """
+    lower, upper = _bandwidths(matrix)
+    if lower == 0 and upper == 0:
+        return "diagonal", 0
+    scale = np.abs(matrix).max()
+    if lower == upper and np.allclose(matrix, matrix.conj().T, rtol=0, atol=tol * scale):
+        if lower == 1 and np.isrealobj(matrix):
+            return "tridiagonal", 1
+        if lower <= max(1, int(BANDED_FRACTION * len(matrix))):
+            return "banded", lower
+        return "symmetric", lower
+    if lower == 0:
+        return "upper_triangular", upper
+    if upper == 0:
+        return "lower_triangular", lower
+    return "general", max(lower, upper)
+
+def _sorted_order(values):
+    return np.lexsort((values.imag, values.real)) if np.iscomplexobj(values) else np.argsort(values)
+
+def _select(values, vectors, subset_by_index, subset_by_value):
+    """
+    Apply index / value subsets to eigenpairs, ordered by (real part, imaginary part).
+    """
+    order = _sorted_order(values)
+    if subset_by_value is not None:
+        low, high = subset_by_value
+        real = values.real[order]
+        order = order[(real > low) & (real <= high)]
+    if subset_by_index is not None:
+        low, high = subset_by_index
+        order = order[low:high + 1]
+    return values[order], None if vectors is None else vectors[:, order]
+
+def _triangular_vectors(matrix, values, upper):
+    """
+    Eigenvectors of a triangular matrix with distinct diagonal by back substitution.
+    """
+    from scipy.linalg import solve_triangular
+
+    n = len(matrix)
+    vectors = np.zeros(matrix.shape, dtype=np.result_type(matrix, values, float))
+    for k, value in enumerate(values):
+        vectors[k, k] = 1
+        if upper and k > 0:
+            block = matrix[:k, :k] - value * np.eye(k)
+            vectors[:k, k] = solve_triangular(block, -matrix[:k, k], lower=False)
+        elif not upper and k < n - 1:
+            block = matrix[k + 1:, k + 1:] - value * np.eye(n - k - 1)
+            vectors[k + 1:, k] = solve_triangular(block, -matrix[k + 1:, k], lower=True)
+    return vectors / np.linalg.norm(vectors, axis=0)
+
+def _distinct(values, tol=1e-10):
+    ordered = np.sort_complex(values.astype(complex))
+    scale = max(np.abs(values).max(), 1.0)
+    return len(values) < 2 or np.abs(np.diff(ordered)).min() > tol * scale
+
+def _eig_2d(matrix, structure, bandwidth, eigenvalues_only, subset_by_index, subset_by_value):
+    """
+    Run the solver for a detected structure; returns (values, vectors, path).
+    """
+    select = "a"
+    select_range = None
+    if subset_by_index is not None:
+        select, select_range = "i", subset_by_index
+    elif subset_by_value is not None:
+        select, select_range = "v", subset_by_value
+    subset = select != "a"
+
+    if structure == "diagonal":
+        values = np.diagonal(matrix).copy()
+        vectors = None if eigenvalues_only else np.eye(len(matrix), dtype=matrix.dtype)
+        values, vectors = _select(values, vectors, subset_by_index, subset_by_value)
+        return values, vectors, structure
+
+    if structure in ("upper_triangular", "lower_triangular"):
+        values = np.diagonal(matrix).copy()
+        if eigenvalues_only:
+            return _select(values, None, subset_by_index, subset_by_value)[0], None, structure
+        if _distinct(values):
+            vectors = _triangular_vectors(matrix, values, structure == "upper_triangular")
+            values, vectors = _select(values, vectors, subset_by_index, subset_by_value)
+            return values, vectors, structure
+        structure = "general"  # repeated eigenvalues: let LAPACK handle the defective case
+
+    if structure == "tridiagonal":
+        from scipy.linalg import eigh_tridiagonal
+        result = eigh_tridiagonal(np.diagonal(matrix), np.diagonal(matrix, -1),
+                                  eigvals_only=eigenvalues_only, select=select, select_range=select_range)
+        values, vectors = (result, None) if eigenvalues_only else result
+        return values, vectors, structure
+
+    if structure == "banded":
+        from scipy.linalg import eig_banded
+        # Upper band storage: row bandwidth - k holds the k-th superdiagonal.
+        band = np.zeros((bandwidth + 1, len(matrix)), dtype=matrix.dtype)
+        for k in range(bandwidth + 1):
+            band[bandwidth - k, k:] = np.diagonal(matrix, k)
+        result = eig_banded(band, eigvals_only=eigenvalues_only, select=select, select_range=select_range)
+        values, vectors = (result, None) if eigenvalues_only else result
+        return values, vectors, structure
+
+    if structure == "symmetric":
+        if subset:
+            from scipy.linalg import eigh
+            kwargs = {"subset_by_index": subset_by_index} if select == "i" else {"subset_by_value": subset_by_value}
+            result = eigh(matrix, eigvals_only=eigenvalues_only, **kwargs)
+        else:
+            result = np.linalg.eigvalsh(matrix) if eigenvalues_only else np.linalg.eigh(matrix)
+        values, vectors = (result, None) if eigenvalues_only else result
+        return values, vectors, structure
+
+    if eigenvalues_only:
+        values, vectors = np.linalg.eigvals(matrix), None
+    else:
+        values, vectors = np.linalg.eig(matrix)
+    if subset:
+        values, vectors = _select(values, vectors, subset_by_index, subset_by_value)
+    return values, vectors, "general"
+
+def eigenvalues_and_vectors(matrix, chunk_size=BATCH_CHUNK_SIZE, eigenvalues_only=False,
+                            subset_by_index=None, subset_by_value=None, structure="auto",
+                            return_path=False):
     """
     Compute eigenvalues and eigenvectors of a square matrix.
 
+    The matrix structure is detected first (O(n^2)) and routed to the
+    cheapest suitable solver: diagonal and triangular matrices read their
+    eigenvalues off the diagonal, symmetric/Hermitian ones use eigh
+    (tridiagonal and narrow-banded ones LAPACK's specialised drivers), and
+    everything else the general eig. Hermitian paths return real,
+    ascending eigenvalues.
+
+    For a few eigenpairs of a large (e.g. sparse) matrix, use
+    top_k_eigenpairs / bottom_k_eigenpairs instead.
+
     Parameters:
-        matrix (ndarray): A square NumPy array.
+        matrix (ndarray): A square NumPy array, or a stack of shape (..., n, n);
+            small scipy.sparse matrices are densified.
+        chunk_size (int): Matrices per chunk for stacked input.
+        eigenvalues_only (bool): Skip the eigenvectors (returned as None).
+        subset_by_index (tuple, optional): (lo, hi) inclusive indices into the
+            ascending eigenvalues (ordered by real part for general matrices).
+        subset_by_value (tuple, optional): Keep eigenvalues with lo < value <= hi
+            (real part for general matrices).
+        structure (str): 'auto' or a structure name from detect_structure to force a path.
+        return_path (bool): Also return the name of the solver path that ran.
 
     Returns:
-        eigenvalues (ndarray): The eigenvalues of the matrix.
-        eigenvectors (ndarray): The corresponding eigenvectors.
+        eigenvalues (ndarray): The eigenvalues of the matrix, shape (..., n).
+        eigenvectors (ndarray): The corresponding eigenvectors, shape (..., n, n).
+        path (str): Only with return_path=True.
     """
-    if matrix.shape[0] != matrix.shape[1]:
+    if _is_sparse(matrix):
+        if max(matrix.shape) > DENSE_EIGEN_LIMIT:
+            raise ValueError("Full spectrum of a large sparse matrix requested; "
+                             "use top_k_eigenpairs or bottom_k_eigenpairs.")
+        matrix = matrix.toarray()
+    matrix = np.asarray(matrix)
+    if matrix.ndim < 2 or matrix.shape[-1] != matrix.shape[-2]:
         raise ValueError("Matrix must be square to compute eigenvalues.")
-    
-    eigenvalues, eigenvectors = np.linalg.eig(matrix)
-    return eigenvalues, eigenvectors
+    if subset_by_index is not None and subset_by_value is not None:
+        raise ValueError("Give at most one of subset_by_index and subset_by_value.")
+
+    if matrix.ndim == 2:
+        if structure == "auto":
+            structure, bandwidth = detect_structure(matrix)
+        else:
+            bandwidth = max(_bandwidths(matrix))
+        values, vectors, path = _eig_2d(matrix, structure, bandwidth, eigenvalues_only,
+                                        subset_by_index, subset_by_value)
+    else:
+        values, vectors, path = _eig_stack(matrix, chunk_size, eigenvalues_only, subset_by_index,
+                                           subset_by_value, structure)
+    return (values, vectors, path) if return_path else (values, vectors)
+
+def _eig_stack(matrix, chunk_size, eigenvalues_only, subset_by_index, subset_by_value, structure):
+    """
+    Stacked input: Hermitian stacks go through eigh, others through eig, chunk by chunk.
+    """
+    if subset_by_value is not None:
+        raise ValueError("subset_by_value gives ragged results for stacked input; use subset_by_index.")
+    if structure == "auto":
+        scale = np.abs(matrix).max(initial=0)
+        hermitian = np.allclose(matrix, np.swapaxes(matrix, -1, -2).conj(), rtol=0, atol=1e-12 * scale)
+        structure = "symmetric" if hermitian else "general"
+    if structure == "symmetric":
+        solver = np.linalg.eigvalsh if eigenvalues_only else np.linalg.eigh
+    else:
+        solver = np.linalg.eigvals if eigenvalues_only else np.linalg.eig
+        structure = "general"
+    if eigenvalues_only:
+        values, vectors = map_chunks(solver, matrix, chunk_size), None
+    else:
+        values, vectors = map_chunks(lambda block: tuple(solver(block)), matrix, chunk_size)
+    if subset_by_index is not None:
+        low, high = subset_by_index
+        if structure == "general":
+            order = np.argsort(values.real, axis=-1)
+            values = np.take_along_axis(values, order, axis=-1)
+            if vectors is not None:
+                vectors = np.take_along_axis(vectors, order[..., None, :], axis=-1)
+        values = values[..., low:high + 1]
+        vectors = None if vectors is None else vectors[..., low:high + 1]
+    return values, vectors, structure
 
 # Example usage
 if __name__ == "__main__":
@@ -32,3 +256,13 @@ if __name__ == "__main__":
 
     print("\nEigenvectors (columns):")
     print(eigenvectors)
+
+    stack = np.random.default_rng(0).standard_normal((1000, 3, 3))
+    values, vectors = eigenvalues_and_vectors(stack)
+    print("\nStacked input:", values.shape, vectors.shape)
+
+    n = 2000
+    T = np.diag(2.0 * np.ones(n)) - np.diag(np.ones(n - 1), 1) - np.diag(np.ones(n - 1), -1)
+    values, _, path = eigenvalues_and_vectors(T, eigenvalues_only=True, subset_by_index=(0, 4),
+                                              return_path=True)
+    print(f"\nFive smallest eigenvalues of a {n}x{n} tridiagonal matrix via the '{path}' path:", values)
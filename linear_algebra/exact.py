@@ -0,0 +1,399 @@
+from fractions import Fraction
+from math import lcm
+
+import numpy as np
+
+# Integer matrices at least this large use the multi-modular determinant by default.
+MODULAR_MIN_SIZE = 48
+# Moduli for the multi-modular methods are primes just below 2**31, so a
+# product of two residues fits in int64 and elimination runs in NumPy.
+MODULUS_LIMIT = 2 ** 31
+
+def _as_rows(A):
+    """
+    Exact copy of A as a list of rows of ints and Fractions.
+    """
+    rows = A.tolist() if isinstance(A, np.ndarray) else [list(row) for row in A]
+    if any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError("Matrix rows must have equal length.")
+    return [[int(v) if isinstance(v, (int, np.integer)) else Fraction(v) for v in row] for row in rows]
+
+
+def _integer_rows(rows):
+    """
+    Clear denominators row by row.
+
+    Returns:
+        tuple: (integer rows, scale) with scale the product of the row multipliers.
+    """
+    scale = 1
+    result = []
+    for row in rows:
+        multiplier = lcm(*(Fraction(v).denominator for v in row)) if row else 1
+        scale *= multiplier
+        result.append([int(v * multiplier) for v in row])
+    return result, scale
+
+
+def _as_number(value):
+    value = Fraction(value)
+    return value.numerator if value.denominator == 1 else value
+
+
+def _bareiss(rows, columns=None):
+    """
+    Fraction-free Gaussian elimination in place on integer rows.
+
+    Every intermediate entry is a minor of the input, so the divisions are
+    exact and entries grow only linearly in bit length.
+
+    Returns:
+        tuple: (pivot columns, sign of the row permutation).
+    """
+    m = len(rows)
+    columns = len(rows[0]) if columns is None else columns
+    pivots = []
+    sign = 1
+    previous = 1
+    r = 0
+    for c in range(columns):
+        pivot = next((i for i in range(r, m) if rows[i][c] != 0), None)
+        if pivot is None:
+            continue
+        if pivot != r:
+            rows[r], rows[pivot] = rows[pivot], rows[r]
+            sign = -sign
+        top = rows[r]
+        p = top[c]
+        for i in range(r + 1, m):
+            row = rows[i]
+            factor = row[c]
+            rows[i] = [(p * row[j] - factor * top[j]) // previous if j > c else 0
+                       for j in range(len(row))]
+        pivots.append(c)
+        previous = p
+        r += 1
+        if r == m:
+            break
+    return pivots, sign
+
+
+def bareiss_det(A):
+    """
+    Exact determinant by Bareiss fraction-free elimination.
+
+    Parameters:
+        A (array-like): Square matrix of ints or Fractions.
+
+    Returns:
+        int or Fraction: The determinant.
+    """
+    rows, scale = _integer_rows(_as_rows(A))
+    n = len(rows)
+    if any(len(row) != n for row in rows):
+        raise ValueError("Matrix must be square to compute a determinant.")
+    if n == 0:
+        return 1
+    pivots, sign = _bareiss(rows)
+    if len(pivots) < n:
+        return 0
+    return _as_number(Fraction(sign * rows[-1][-1], scale))
+
+
+def bareiss_rank(A):
+    """
+    Exact rank by Bareiss fraction-free elimination.
+    """
+    rows, _ = _integer_rows(_as_rows(A))
+    if not rows or not rows[0]:
+        return 0
+    return len(_bareiss(rows)[0])
+
+
+# Primes below MODULUS_LIMIT found so far, largest first.
+_PRIMES = []
+
+
+def _moduli(count):
+    """
+    The `count` largest primes below MODULUS_LIMIT.
+    """
+    from number_theory.primes import check_prime
+
+    candidate = _PRIMES[-1] - 2 if _PRIMES else MODULUS_LIMIT - 1
+    while len(_PRIMES) < count:
+        if check_prime(candidate):
+            _PRIMES.append(candidate)
+        candidate -= 2
+    return _PRIMES[:count]
+
+
+def _eliminate_mod(A, p):
+    """
+    Row-echelon form of an int64 matrix modulo p, vectorized over rows.
+
+    Returns:
+        int: The rank of A modulo p.
+    """
+    A = A % p
+    m, n = A.shape
+    r = 0
+    for c in range(n):
+        nonzero = np.flatnonzero(A[r:, c])
+        if len(nonzero) == 0:
+            continue
+        pivot = r + nonzero[0]
+        if pivot != r:
+            A[[r, pivot]] = A[[pivot, r]]
+        factors = A[r + 1:, c] * pow(int(A[r, c]), -1, p) % p
+        A[r + 1:, c:] = (A[r + 1:, c:] - factors[:, None] * A[r, c:]) % p
+        r += 1
+        if r == m:
+            break
+    return r
+
+
+def _det_mod(A, primes):
+    """
+    Determinants of a square int64 matrix modulo each prime, eliminating
+    modulo all primes at once on a (primes, n, n) stack.
+    """
+    k, n = len(primes), len(A)
+    p = np.array(primes, dtype=np.int64)
+    stack = A[None] % p[:, None, None]
+    det = np.ones(k, dtype=np.int64)
+    every = np.arange(k)
+    for c in range(n):
+        nonzero = stack[:, c:, c] != 0
+        # A prime with no pivot left gets a zero head: its det becomes 0 and
+        # its multipliers below stay zero.
+        pivot = c + nonzero.argmax(axis=1)
+        swapped = pivot != c
+        if swapped.any():
+            rows = stack[every, c].copy()
+            stack[every, c] = stack[every, pivot]
+            stack[every, pivot] = rows
+            det[swapped] = (p - det)[swapped] % p[swapped]
+        head = stack[:, c, c]
+        det = det * head % p
+        inverse = np.array([pow(int(v), -1, int(q)) if v else 0 for v, q in zip(head, primes)], dtype=np.int64)
+        factors = stack[:, c + 1:, c] * inverse[:, None] % p[:, None]
+        stack[:, c + 1:, c:] = (stack[:, c + 1:, c:]
+                                - factors[:, :, None] * stack[:, c, None, c:]) % p[:, None, None]
+    return [int(v) for v in det]
+
+
+def _integer_array(A):
+    """
+    int64 copy of an integer matrix, or None when it has Fractions or huge entries.
+    """
+    rows = _as_rows(A)
+    if not all(isinstance(v, int) for row in rows for v in row):
+        return None, rows
+    if any(abs(v) >= 2 ** 62 for row in rows for v in row):
+        return None, rows
+    shape = (len(rows), len(rows[0]) if rows else 0)
+    return np.array(rows, dtype=np.int64).reshape(shape), rows
+
+
+def _hadamard_bits(rows):
+    """
+    Bits needed for |det A| by Hadamard's bound: the product of the row norms.
+    """
+    bits = 0.0
+    for row in rows:
+        norm_squared = sum(v * v for v in row)
+        if norm_squared == 0:
+            return 0
+        bits += norm_squared.bit_length() / 2
+    return int(bits) + 1
+
+
+def _minor_bits(rows):
+    """
+    Bits bounding |M| for every minor M of an integer matrix: Hadamard's bound
+    over the min(m, n) largest row norms, or column norms if that is smaller.
+    """
+    def bound(lines, k):
+        bits = sorted((sum(v * v for v in line).bit_length() / 2 for line in lines), reverse=True)
+        return sum(bits[:k])
+
+    k = min(len(rows), len(rows[0]))
+    return int(min(bound(rows, k), bound(zip(*rows), k))) + 1
+
+
+def modular_det(A):
+    """
+    Exact determinant of an integer matrix by multi-modular elimination.
+
+    The determinant is computed modulo enough word-sized primes to cover
+    Hadamard's bound, each elimination running vectorized in NumPy, and
+    the residues are combined with the Chinese Remainder Theorem.
+
+    Parameters:
+        A (array-like): Square integer matrix.
+
+    Returns:
+        int: The determinant.
+    """
+    from number_theory.mod_arithmetic import chinese_remainder_theorem
+
+    array, rows = _integer_array(A)
+    if array is None:
+        raise ValueError("modular_det needs an integer matrix with entries below 2**62.")
+    n = len(rows)
+    if array.shape != (n, n):
+        raise ValueError("Matrix must be square to compute a determinant.")
+    if n == 0:
+        return 1
+    bits = _hadamard_bits(rows)
+    if bits == 0:
+        return 0
+    # Twice the bound, plus a sign bit, so the symmetric residue is the determinant.
+    primes = _moduli(bits // 30 + 2)
+    residues = _det_mod(array, primes)
+    modulus = 1
+    for p in primes:
+        modulus *= p
+    value = chinese_remainder_theorem(residues, primes)
+    return value - modulus if value > modulus // 2 else value
+
+
+def modular_rank(A):
+    """
+    Exact rank of an integer matrix from its rank modulo large primes.
+
+    The rank modulo p never exceeds the true rank r, and equals it unless p
+    divides a non-zero r x r minor. Primes are taken until their product
+    exceeds Hadamard's bound on every minor, so no such minor is divisible
+    by all of them and the largest rank seen is r. Full-rank matrices
+    usually stop after the first prime.
+    """
+    array, rows = _integer_array(A)
+    if array is None:
+        raise ValueError("modular_rank needs an integer matrix with entries below 2**62.")
+    if array.size == 0:
+        return 0
+    best = 0
+    # Each prime exceeds 2**30.
+    for p in _moduli(_minor_bits(rows) // 30 + 1):
+        best = max(best, _eliminate_mod(array, p))
+        if best == min(array.shape):
+            break
+    return best
+
+
+def exact_det(A, method="auto"):
+    """
+    Exact determinant of an integer or rational matrix.
+
+    Parameters:
+        A (array-like): Square matrix of ints or Fractions.
+        method (str): 'bareiss', 'modular' (integer matrices only), or 'auto'
+            (modular for integer matrices of size MODULAR_MIN_SIZE and up).
+
+    Returns:
+        int or Fraction: The determinant.
+    """
+    if method == "auto":
+        array, _ = _integer_array(A)
+        method = "modular" if array is not None and len(array) >= MODULAR_MIN_SIZE else "bareiss"
+    if method == "modular":
+        return modular_det(A)
+    if method == "bareiss":
+        return bareiss_det(A)
+    raise ValueError(f"Unknown exact method: {method}")
+
+
+def exact_rank(A, method="auto"):
+    """
+    Exact rank of an integer or rational matrix.
+
+    Parameters:
+        A (array-like): Matrix of ints or Fractions.
+        method (str): 'bareiss', 'modular' (integer matrices only; see
+            modular_rank), or 'auto' (modular for integer matrices with
+            min(m, n) of MODULAR_MIN_SIZE and up).
+
+    Returns:
+        int: The rank.
+    """
+    if method == "auto":
+        array, _ = _integer_array(A)
+        method = "modular" if array is not None and min(array.shape) >= MODULAR_MIN_SIZE else "bareiss"
+    if method == "modular":
+        return modular_rank(A)
+    if method == "bareiss":
+        return bareiss_rank(A)
+    raise ValueError(f"Unknown exact method: {method}")
+
+
+def exact_solve(A, B):
+    """
+    Solve A X = B exactly over the rationals.
+
+    The augmented system is reduced with Bareiss elimination; back
+    substitution then stays in integers by solving for det(A) * X, which
+    is integral by Cramer's rule, and divides once at the end.
+
+    Parameters:
+        A (array-like): Square, non-singular matrix of ints or Fractions.
+        B (array-like): Right-hand side (n,) or (n, k) of ints or Fractions.
+
+    Returns:
+        ndarray: Object array of ints / Fractions, shaped like B.
+    """
+    rows = _as_rows(A)
+    n = len(rows)
+    if any(len(row) != n for row in rows):
+        raise ValueError("Matrix must be square.")
+    B = np.asarray(B, dtype=object)
+    if n == 0:
+        return np.empty(B.shape, dtype=object)
+    vector = B.ndim == 1
+    rhs = _as_rows(B.reshape(n, -1))
+    k = len(rhs[0])
+    augmented, _ = _integer_rows([row + extra for row, extra in zip(rows, rhs)])
+    pivots, _ = _bareiss(augmented, columns=n)
+    if len(pivots) < n:
+        raise ValueError("Matrix is singular and not invertible.")
+    det = augmented[-1][n - 1]
+    # X[i] holds det * x_i; the divisions by the pivots are exact.
+    X = [[0] * k for _ in range(n)]
+    for i in range(n - 1, -1, -1):
+        row = augmented[i]
+        for j in range(k):
+            total = det * row[n + j] - sum(row[c] * X[c][j] for c in range(i + 1, n))
+            X[i][j] = total // row[i]
+    result = np.empty((n, k), dtype=object)
+    for i in range(n):
+        for j in range(k):
+            result[i, j] = _as_number(Fraction(X[i][j], det))
+    return result[:, 0] if vector else result
+
+
+def exact_inverse(A):
+    """
+    Exact inverse of an integer or rational matrix, as an object array of Fractions.
+    """
+    n = len(_as_rows(A))
+    return exact_solve(A, np.eye(n, dtype=int))
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    H = [[Fraction(1, i + j + 1) for j in range(6)] for i in range(6)]
+    print("det of the 6x6 Hilbert matrix:", exact_det(H))
+    print("Its inverse, first row:", exact_inverse(H)[0].tolist())
+    print("Float rank of the 14x14 Hilbert matrix:", np.linalg.matrix_rank(np.array(
+        [[1 / (i + j + 1) for j in range(14)] for i in range(14)])),
+          "exact:", exact_rank([[Fraction(1, i + j + 1) for j in range(14)] for i in range(14)]))
+
+    M = np.random.default_rng(0).integers(-1000, 1000, size=(80, 80))
+    modular_det(M[:2, :2])  # warm up: imports number_theory (SymPy) and finds the primes
+    for method in ("bareiss", "modular"):
+        start = time.perf_counter()
+        det = exact_det(M, method)
+        print(f"80x80 integer det ({method}): {str(det)[:20]}... in {time.perf_counter() - start:.3f} s")
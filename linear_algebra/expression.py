@@ -0,0 +1,215 @@
+import numpy as np
+from linear_algebra.matrix_ops import _is_sparse, add_matrices, multiply_matrices, transpose_matrix
+
+
+def matrix_chain_order(dims):
+    """
+    Cheapest parenthesization of a matrix chain by dynamic programming.
+
+    Parameters:
+        dims (list): n + 1 sizes; factor i has shape (dims[i], dims[i + 1]).
+
+    Returns:
+        tuple: (multiply-add count, split table) where split[i][j] is the
+        factor after which the product of factors i..j is split.
+    """
+    n = len(dims) - 1
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+    for length in range(2, n + 1):
+        for i in range(n - length + 1):
+            j = i + length - 1
+            cost[i][j] = None
+            for k in range(i, j):
+                candidate = cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
+                if cost[i][j] is None or candidate < cost[i][j]:
+                    cost[i][j], split[i][j] = candidate, k
+    return (cost[0][n - 1] if n else 0), split
+
+
+def _matmul_shape(left, right):
+    if len(left) == 0 or len(right) == 0 or len(left) > 2 or len(right) > 2:
+        raise ValueError("Matrix expressions hold 1-D and 2-D operands only.")
+    if left[-1] != right[0]:
+        raise ValueError(f"Cannot multiply shapes {left} and {right}.")
+    return left[:-1] + right[1:]
+
+
+def lazy(A):
+    """
+    Wrap a matrix (dense, sparse or memory-mapped) as a lazy expression leaf.
+    """
+    if isinstance(A, MatrixExpression):
+        return A
+    return MatrixExpression("leaf", (A, False), tuple(A.shape) if hasattr(A, "shape") else np.shape(A))
+
+
+class MatrixExpression:
+    """
+    A matrix computation recorded as a graph and run by evaluate().
+
+    Expressions are built with +, @ and .T from lazy() leaves (plain arrays
+    are wrapped automatically). Nothing is computed until evaluate(), which
+
+    - multiplies every chain of factors in the order found by the
+      matrix-chain dynamic program, so A @ B @ C @ v costs matrix-vector
+      products rather than matrix-matrix ones;
+    - never copies for a transpose: transposes are pushed down to the
+      leaves, whose transposed views NumPy hands to BLAS as a flag (a sum
+      with broadcast terms is transposed after it is computed, also as a view);
+    - sums terms into one buffer in place, allocating once per sum.
+
+    Parameters:
+        op (str): 'leaf', 'sum', 'product' or 'transpose'.
+        args (tuple): (matrix, transposed) for a leaf, the operand
+            expressions otherwise (just one for 'transpose').
+        shape (tuple): Shape of the result.
+    """
+    # Make NumPy arrays defer to __radd__ / __rmatmul__ below.
+    __array_ufunc__ = None
+
+    def __init__(self, op, args, shape):
+        self.op = op
+        self.args = args
+        self.shape = shape
+
+    @property
+    def T(self):
+        """
+        The transposed expression, with the transpose pushed down to the leaves.
+        """
+        if len(self.shape) < 2:
+            return self
+        shape = self.shape[::-1]
+        if self.op == "leaf":
+            matrix, transposed = self.args
+            return MatrixExpression("leaf", (matrix, not transposed), shape)
+        if self.op == "transpose":
+            return self.args[0]
+        if self.op == "sum":
+            if all(term.shape == self.shape for term in self.args):
+                return MatrixExpression("sum", tuple(term.T for term in self.args), shape)
+            # (A + v).T is not A.T + v: a broadcast term must be added first.
+            return MatrixExpression("transpose", (self,), shape)
+        return MatrixExpression("product", tuple(factor.T for factor in reversed(self.args)), shape)
+
+    def __add__(self, other):
+        other = lazy(other)
+        shape = np.broadcast_shapes(self.shape, other.shape)
+        terms = tuple(t for e in (self, other) for t in (e.args if e.op == "sum" else (e,)))
+        return MatrixExpression("sum", terms, shape)
+
+    def __radd__(self, other):
+        return lazy(other) + self
+
+    def __matmul__(self, other):
+        other = lazy(other)
+        shape = _matmul_shape(self.shape, other.shape)
+        # Products are merged into one chain, except where that would put a
+        # 1-D factor inside it: (A @ v) @ B stays a node, evaluated first.
+        left = self.args if self.op == "product" and len(self.args[-1].shape) == 2 else (self,)
+        right = other.args if other.op == "product" and len(other.args[0].shape) == 2 else (other,)
+        return MatrixExpression("product", left + right, shape)
+
+    def __rmatmul__(self, other):
+        return lazy(other) @ self
+
+    def __repr__(self):
+        return f"MatrixExpression({self.op}, shape={self.shape})"
+
+    def _chain_dims(self):
+        """
+        Chain sizes of a product; 1-D end factors count as a row / column
+        vector (__matmul__ never puts a 1-D factor anywhere else).
+        """
+        shapes = [factor.shape for factor in self.args]
+        dims = [shapes[0][0] if len(shapes[0]) == 2 else 1]
+        for shape in shapes[:-1]:
+            dims.append(shape[-1])
+        dims.append(shapes[-1][1] if len(shapes[-1]) == 2 else 1)
+        return dims
+
+    def cost(self):
+        """
+        Multiply-adds of the matrix products evaluate() will perform.
+        """
+        if self.op == "leaf":
+            return 0
+        inner = sum(arg.cost() for arg in self.args)
+        if self.op != "product":
+            return inner
+        return inner + matrix_chain_order(self._chain_dims())[0]
+
+    def evaluate(self):
+        """
+        Compute the expression. Sums and products return new arrays (or
+        sparse matrices); a bare leaf returns its matrix or a transposed view.
+        """
+        if self.op == "leaf":
+            matrix, transposed = self.args
+            return transpose_matrix(matrix) if transposed else matrix
+        if self.op == "product":
+            return self._evaluate_product()
+        if self.op == "transpose":
+            return transpose_matrix(self.args[0].evaluate())
+        return self._evaluate_sum()
+
+    def _evaluate_product(self):
+        values = [factor.evaluate() for factor in self.args]
+        _, split = matrix_chain_order(self._chain_dims())
+
+        def multiply(i, j):
+            if i == j:
+                return values[i]
+            k = split[i][j]
+            return multiply_matrices(multiply(i, k), multiply(k + 1, j))
+
+        return multiply(0, len(values) - 1)
+
+    def _evaluate_sum(self):
+        # Computed terms come first: their fresh results can take the sum in place.
+        terms = sorted(self.args, key=lambda term: term.op == "leaf")
+        total = terms[0].evaluate()
+        owned = terms[0].op != "leaf"
+        for term in terms[1:]:
+            value = term.evaluate()
+            in_place = (owned and type(total) is np.ndarray and not _is_sparse(value)
+                        and np.result_type(total, value) == total.dtype
+                        and np.broadcast_shapes(total.shape, np.shape(value)) == total.shape)
+            if in_place:
+                np.add(total, value, out=total)
+            else:
+                total = add_matrices(total, value)
+                owned = True
+        return total
+
+
+def evaluate(expression):
+    """
+    Evaluate a MatrixExpression (anything else is returned unchanged).
+    """
+    return expression.evaluate() if isinstance(expression, MatrixExpression) else expression
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 2000
+    A, B, C = (rng.standard_normal((n, n)) for _ in range(3))
+    v = rng.standard_normal(n)
+
+    start = time.perf_counter()
+    eager = multiply_matrices(multiply_matrices(multiply_matrices(A, B), C), v)
+    eager_time = time.perf_counter() - start
+
+    expression = lazy(A) @ B @ C @ v
+    start = time.perf_counter()
+    result = expression.evaluate()
+    print(f"A B C v, left to right: {eager_time:.3f} s; chain-ordered: {time.perf_counter() - start:.4f} s")
+    print("Relative difference:", np.abs(result - eager).max() / np.abs(eager).max())
+
+    expression = (lazy(A) @ B).T + lazy(A).T @ C + B
+    print("(A B)^T + A^T C + B, multiply-adds:", expression.cost())
+    print("Matches eager evaluation:", np.allclose(expression.evaluate(), (A @ B).T + A.T @ C + B))
@@ -0,0 +1,199 @@
+import warnings
+from functools import cached_property
+
+import numpy as np
+from scipy.linalg import LinAlgWarning, cho_factor, cho_solve, lu_factor, lu_solve, qr, get_lapack_funcs
+
+
+class FactorizedMatrix:
+    """
+    A square or rectangular matrix together with its cached factorizations.
+
+    The factorization is computed once, on first use, and every query is
+    answered from it: Cholesky for symmetric (Hermitian) positive definite
+    matrices, LU with partial pivoting for other square matrices, and QR
+    with column pivoting for rank (and for rectangular input).
+
+    Singularity is judged from the reciprocal condition number estimated
+    by LAPACK from the factors, not from an exact det == 0 test, so nearly
+    singular matrices are caught and exactly representable non-zero
+    determinants of well-conditioned matrices are not misjudged.
+
+    Parameters:
+        A (array-like): The matrix.
+        assume (str): 'auto' (try Cholesky when A is Hermitian), 'general' (LU),
+            or 'positive_definite' (Cholesky, raising if it fails).
+    """
+    def __init__(self, A, assume="auto"):
+        A = np.asarray(A)
+        if A.ndim != 2:
+            raise ValueError("FactorizedMatrix expects a 2-D matrix.")
+        self.A = A.astype(np.result_type(A, float))
+        self.assume = assume
+        self.shape = A.shape
+
+    @property
+    def is_square(self):
+        return self.shape[0] == self.shape[1]
+
+    def _require_square(self):
+        if not self.is_square:
+            raise ValueError("Matrix must be square.")
+
+    def _is_hermitian(self):
+        """
+        Hermitian up to rounding: |A - A^H| <= n * eps * max|A| entrywise.
+
+        cho_factor reads one triangle only, so the tolerance must be relative
+        to the scale of A; within it, the factors are backward stable for A.
+        """
+        A = self.A
+        tol = len(A) * np.finfo(A.dtype).eps * np.abs(A).max(initial=0)
+        return bool(np.all(np.abs(A - A.conj().T) <= tol))
+
+    @cached_property
+    def _factors(self):
+        """
+        ('cholesky', (c, lower)) or ('lu', (lu, piv)), computed once.
+        """
+        self._require_square()
+        A = self.A
+        if self.assume != "general" and self._is_hermitian():
+            try:
+                return "cholesky", cho_factor(A, check_finite=False)
+            except np.linalg.LinAlgError:
+                if self.assume == "positive_definite":
+                    raise ValueError("Matrix is not positive definite.")
+        elif self.assume == "positive_definite":
+            raise ValueError("Matrix is not symmetric, so it cannot be positive definite.")
+        with warnings.catch_warnings():
+            # Exactly singular input is reported through rcond / is_singular instead.
+            warnings.simplefilter("ignore", LinAlgWarning)
+            return "lu", lu_factor(A, check_finite=False)
+
+    @property
+    def method(self):
+        """
+        The factorization in use for det/solve/inverse: 'cholesky' or 'lu'.
+        """
+        return self._factors[0]
+
+    @cached_property
+    def _pivoted_qr(self):
+        return qr(self.A, mode="r", pivoting=True, check_finite=False)
+
+    @cached_property
+    def rcond(self):
+        """
+        Reciprocal 1-norm condition number estimate (0 for singular matrices).
+        """
+        method, factors = self._factors
+        anorm = np.abs(self.A).sum(axis=0).max()
+        if anorm == 0:
+            return 0.0
+        if method == "cholesky":
+            c, lower = factors
+            pocon, = get_lapack_funcs(("pocon",), (c,))
+            value, _ = pocon(c, anorm, uplo="L" if lower else "U")
+        else:
+            lu, _ = factors
+            if not np.all(np.isfinite(lu)):
+                return 0.0
+            gecon, = get_lapack_funcs(("gecon",), (lu,))
+            value, _ = gecon(lu, anorm)
+        return float(value)
+
+    def cond(self):
+        """
+        Estimated 1-norm condition number (inf for singular matrices).
+        """
+        return np.inf if self.rcond == 0 else 1.0 / self.rcond
+
+    def is_singular(self, tol=None):
+        """
+        True when the reciprocal condition number is below tol (default n * eps).
+        """
+        tol = self.shape[0] * np.finfo(self.A.dtype).eps if tol is None else tol
+        return self.rcond < tol
+
+    def _check_invertible(self):
+        if self.is_singular():
+            raise ValueError("Matrix is singular and not invertible.")
+
+    def det(self):
+        """
+        Determinant from the diagonal of the factors.
+        """
+        method, factors = self._factors
+        if method == "cholesky":
+            return np.prod(np.diagonal(factors[0])) ** 2
+        lu, piv = factors
+        swaps = np.count_nonzero(piv != np.arange(len(piv)))
+        return (-1) ** swaps * np.prod(np.diagonal(lu))
+
+    def slogdet(self):
+        """
+        (sign, log|det|), safe from overflow for large matrices.
+        """
+        method, factors = self._factors
+        if method == "cholesky":
+            return 1.0, 2 * np.sum(np.log(np.abs(np.diagonal(factors[0]))))
+        lu, piv = factors
+        diagonal = np.diagonal(lu)
+        swaps = np.count_nonzero(piv != np.arange(len(piv)))
+        sign = (-1) ** swaps * np.prod(np.sign(diagonal))
+        with np.errstate(divide='ignore'):
+            return sign, np.sum(np.log(np.abs(diagonal)))
+
+    def solve(self, B):
+        """
+        Solve A X = B for one right-hand side (n,) or many (n, k) at once.
+        """
+        self._check_invertible()
+        method, factors = self._factors
+        if method == "cholesky":
+            return cho_solve(factors, B, check_finite=False)
+        return lu_solve(factors, B, check_finite=False)
+
+    def inverse(self):
+        """
+        Inverse of A, by solving against the identity with the cached factors.
+        """
+        return self.solve(np.eye(self.shape[0], dtype=self.A.dtype))
+
+    def rank(self, tol=None):
+        """
+        Numerical rank from the pivoted QR factorization.
+
+        Parameters:
+            tol (float, optional): Threshold on |R_ii|; by default
+                max(m, n) * eps * |R_00|, as in numpy.linalg.matrix_rank.
+        """
+        R = self._pivoted_qr[0]
+        diagonal = np.abs(np.diagonal(R))
+        if len(diagonal) == 0 or diagonal[0] == 0:
+            return 0
+        if tol is None:
+            tol = max(self.shape) * np.finfo(self.A.dtype).eps * diagonal[0]
+        return int(np.count_nonzero(diagonal > tol))
+
+
+def factorize(A, assume="auto"):
+    """
+    Wrap A in a FactorizedMatrix (returned unchanged if it already is one).
+    """
+    return A if isinstance(A, FactorizedMatrix) else FactorizedMatrix(A, assume)
+
+
+# Example usage
+if __name__ == "__main__":
+    A = np.array([[4.0, 2.0, 0.6], [2.0, 5.0, 1.0], [0.6, 1.0, 3.0]])
+    F = FactorizedMatrix(A)
+    print("Method:", F.method)
+    print("Determinant:", F.det(), "(numpy:", np.linalg.det(A), ")")
+    print("Solve with 2 right-hand sides:\n", F.solve(np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])))
+    print("Condition number estimate:", F.cond())
+    print("Rank:", F.rank())
+
+    S = np.array([[1.0, 2.0], [2.0, 4.0 + 1e-17]])
+    print("Nearly singular matrix flagged as singular?", FactorizedMatrix(S).is_singular())
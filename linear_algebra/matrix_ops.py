@@ -1,41 +1,172 @@
+import os
+import sys
+
 import numpy as np
+from linear_algebra.batched import batched_det, batched_inverse
+
+# SciPy (factorizations, sparse support) is imported only by the paths that
+# need it, so dense callers of add/multiply/determinant don't pay for it.
+
+def _is_sparse(A):
+    # A scipy.sparse matrix can only exist once scipy.sparse has been imported.
+    module = sys.modules.get("scipy.sparse")
+    return module is not None and module.issparse(A)
+
+def _is_factorized(A):
+    module = sys.modules.get("linear_algebra.factorization")
+    return module is not None and isinstance(A, module.FactorizedMatrix)
+
+def _is_on_disk(A):
+    # Memory-mapped arrays and .npy paths take the blocked out-of-core path.
+    return isinstance(A, (np.memmap, str, os.PathLike))
+
+def _open_paths(A, B):
+    # .npy paths become memory maps, so NumPy can take the cases blocking doesn't cover.
+    if isinstance(A, (str, os.PathLike)) or isinstance(B, (str, os.PathLike)):
+        from linear_algebra.out_of_core import open_matrix
+        A, B = open_matrix(A), open_matrix(B)
+    return A, B
 
-def add_matrices(A, B):
+def _is_exact(A):
+    # Object arrays hold Python ints / Fractions, which only the exact backend handles.
+    return isinstance(A, np.ndarray) and A.dtype == object
+
+def add_matrices(A, B, out=None):
     """
-    Add two matrices A and B.
+    Add two matrices A and B (dense or scipy.sparse).
+
+    Two 2-D np.memmap or .npy path operands of the same shape, or any
+    operands with an `out` memmap / .npy path, are added in row panels
+    without loading them whole (see out_of_core); other memory-mapped
+    operands (scalars, broadcasting) go through np.add.
     """
+    if _is_sparse(A) or _is_sparse(B):
+        from linear_algebra.sparse import sparse_add
+        return sparse_add(A, B)
+    if out is not None or _is_on_disk(A) or _is_on_disk(B):
+        A, B = _open_paths(A, B)
+        if out is not None or (np.ndim(A) == 2 and np.shape(A) == np.shape(B)):
+            from linear_algebra.out_of_core import blocked_add
+            return blocked_add(A, B, out)
     return np.add(A, B)
 
-def multiply_matrices(A, B):
+def multiply_matrices(A, B, out=None):
     """
-    Multiply two matrices A and B.
+    Multiply two matrices A and B (stacks of shape (..., n, m) broadcast;
+    scipy.sparse operands keep the product sparse).
+
+    A 2-D by 2-D product with an np.memmap or .npy path operand, or an
+    `out` memmap / .npy path, uses the tiled out-of-core product, for
+    matrices larger than memory; other memory-mapped operands (vectors,
+    stacks) go through np.matmul.
     """
+    if _is_sparse(A) or _is_sparse(B):
+        from linear_algebra.sparse import sparse_multiply
+        return sparse_multiply(A, B)
+    if out is not None or _is_on_disk(A) or _is_on_disk(B):
+        A, B = _open_paths(A, B)
+        if out is not None or (np.ndim(A) == 2 and np.ndim(B) == 2):
+            from linear_algebra.out_of_core import blocked_multiply
+            return blocked_multiply(A, B, out)
     return np.matmul(A, B)
 
-def transpose_matrix(A):
+def transpose_matrix(A, out=None):
     """
-    Transpose of matrix A.
+    Transpose of matrix A; for a stack (..., n, m) each matrix is transposed.
+
+    Given `out` (a memmap or .npy path), the transpose of a 2-D matrix is
+    copied there tile by tile; otherwise it is a view.
     """
+    if out is not None:
+        from linear_algebra.out_of_core import blocked_transpose
+        return blocked_transpose(A, out)
+    if isinstance(A, (str, os.PathLike)):
+        from linear_algebra.out_of_core import open_matrix
+        A = open_matrix(A)
+    if _is_sparse(A):
+        from linear_algebra.sparse import sparse_transpose
+        return sparse_transpose(A)
+    if np.ndim(A) > 2:
+        return np.swapaxes(A, -1, -2)
     return np.transpose(A)
 
-def determinant(A):
+def determinant(A, exact=False):
     """
-    Compute the determinant of matrix A.
+    Compute the determinant of matrix A (an array or a FactorizedMatrix).
+
+    Stacks of shape (..., n, n) give one determinant per matrix; sizes up to
+    4x4 use closed-form kernels. With exact=True (or an object array of
+    ints / Fractions) the determinant of an integer or rational matrix is
+    computed exactly.
     """
-    return np.linalg.det(A)
+    if exact or _is_exact(A):
+        from linear_algebra.exact import exact_det
+        return exact_det(A)
+    if _is_factorized(A):
+        return A.det()
+    return batched_det(A)
 
-def inverse(A):
+def inverse(A, exact=False):
     """
     Compute the inverse of matrix A, if it exists.
+
+    Singularity is judged from the estimated condition number of the LU
+    (or Cholesky) factors, which are then reused for the inverse. Stacks of
+    shape (..., n, n) are inverted in chunks (closed form up to 4x4), with
+    the same rcond < n * eps singularity test.
+    With exact=True (or an object array) an integer or rational matrix gets
+    an exact inverse as an object array of Fractions.
     """
-    if np.linalg.det(A) == 0:
-        raise ValueError("Matrix is singular and not invertible.")
-    return np.linalg.inv(A)
+    if exact or _is_exact(A):
+        from linear_algebra.exact import exact_inverse
+        return exact_inverse(A)
+    if not _is_factorized(A) and np.ndim(A) > 2:
+        return batched_inverse(A)
+    from linear_algebra.factorization import factorize
+    return factorize(A).inverse()
 
-def rank(A):
+def solve(A, B, exact=False):
     """
-    Compute the rank of matrix A.
+    Solve A X = B for one or many right-hand sides (columns of B).
+
+    Pass a FactorizedMatrix to reuse its factors across calls. A stack of
+    matrices (..., n, n) is solved with numpy's stacked solver, and a sparse
+    A with a sparse LU factorization (see iterative_solve for very large systems).
+    With exact=True (or an object array) the solution is exact and rational.
+    """
+    if exact or _is_exact(A):
+        from linear_algebra.exact import exact_solve
+        return exact_solve(A, B)
+    if _is_sparse(A):
+        from linear_algebra.sparse import sparse_solve
+        return sparse_solve(A, B)
+    if not _is_factorized(A) and np.ndim(A) > 2:
+        return np.linalg.solve(A, B)
+    from linear_algebra.factorization import factorize
+    return factorize(A).solve(B)
+
+def condition_number(A):
+    """
+    Estimated 1-norm condition number of a square matrix A.
+    """
+    from linear_algebra.factorization import factorize
+    return factorize(A).cond()
+
+def rank(A, exact=False):
     """
+    Compute the rank of matrix A (one rank per matrix for stacked input).
+
+    With exact=True (or an object array) an integer or rational matrix gets
+    its exact rank, immune to the rounding that misjudges ill-conditioned ones.
+    """
+    if exact or _is_exact(A):
+        from linear_algebra.exact import exact_rank
+        return exact_rank(A)
+    if _is_sparse(A):
+        from linear_algebra.sparse import sparse_rank
+        return sparse_rank(A)
+    if _is_factorized(A):
+        return A.rank()
     return np.linalg.matrix_rank(A)
 
 # Example usage
@@ -52,3 +183,16 @@ if __name__ == "__main__":
     print("Determinant of A:", determinant(A))
     print("Inverse of A:\n", inverse(A))
     print("Rank of A:", rank(A))
+
+    from linear_algebra.factorization import FactorizedMatrix
+    F = FactorizedMatrix(A)
+    print("Solve A x = [1, 1] from cached factors:", solve(F, np.array([1.0, 1.0])))
+    print("Determinant and inverse from the same factors:", determinant(F), inverse(F).tolist())
+
+    from fractions import Fraction
+    H = np.array([[Fraction(1, i + j + 1) for j in range(14)] for i in range(14)])
+    print("Rank of the 14x14 Hilbert matrix, float vs exact:", rank(H.astype(float)), rank(H))
+    print("Exact inverse of A:", inverse(A, exact=True).tolist())
+
+    stack = np.random.default_rng(0).standard_normal((100000, 3, 3))
+    print("Determinants of a (100000, 3, 3) stack:", determinant(stack)[:3])
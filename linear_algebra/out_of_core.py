@@ -0,0 +1,177 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Bytes of tiles held in memory at once across all workers.
+DEFAULT_WORKING_SET = 256 * 2 ** 20
+# Tiles are never smaller than this (edge tiles excepted), to keep BLAS efficient.
+MIN_TILE = 64
+
+
+def open_matrix(source, mode="r"):
+    """
+    An array view of a matrix without reading it into memory.
+
+    Parameters:
+        source (str, os.PathLike or array): A .npy file (memory-mapped with
+            `mode`) or an array / np.memmap, returned unchanged.
+        mode (str): np.load mmap_mode for files: 'r', 'r+' or 'c'.
+
+    Returns:
+        np.memmap or ndarray.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return np.load(source, mmap_mode=mode)
+    return source
+
+
+def _output(out, shape, dtype):
+    """
+    Allocate the result: a new .npy memmap for a path, an in-memory array for None.
+    """
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if isinstance(out, (str, os.PathLike)):
+        return np.lib.format.open_memmap(out, mode="w+", dtype=dtype, shape=shape)
+    if out.shape != shape:
+        raise ValueError(f"Output has shape {out.shape}, expected {shape}.")
+    if not np.can_cast(dtype, out.dtype, casting="same_kind"):
+        # The rule NumPy's ufuncs (np.matmul, np.add) apply to `out`.
+        raise TypeError(f"Cannot write a {dtype} result to an output of dtype {out.dtype}.")
+    return out
+
+
+def tile_size(working_set, itemsize, workers, tiles_per_task):
+    """
+    Largest square tile so that `workers` tasks, each holding `tiles_per_task`
+    tiles of `itemsize`-byte entries, fit in `working_set` bytes.
+    """
+    tile = int((working_set / (workers * tiles_per_task * itemsize)) ** 0.5)
+    return max(tile, MIN_TILE)
+
+
+def _ranges(n, step):
+    return [(start, min(start + step, n)) for start in range(0, n, step)]
+
+
+def _run(task, items, workers):
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() re-raises the first exception from a worker.
+        list(pool.map(task, items))
+
+
+def _finish(result):
+    if isinstance(result, np.memmap):
+        result.flush()
+    return result
+
+
+def blocked_multiply(A, B, out=None, working_set=DEFAULT_WORKING_SET, workers=None):
+    """
+    Matrix product A @ B computed tile by tile, for operands larger than memory.
+
+    Each task owns one output tile: it streams the matching row-panel tiles
+    of A and column-panel tiles of B from disk, accumulates their products
+    in memory, and writes the finished tile once. Tasks run in a thread pool
+    (NumPy releases the GIL in matmul and memmap copies), and the tile size
+    is chosen so that all workers together stay within `working_set` bytes.
+
+    Parameters:
+        A, B (np.memmap, ndarray or .npy path): Operands of shapes (m, k), (k, n).
+        out (np.memmap, ndarray or .npy path, optional): Destination; a path
+            creates a memory-mapped .npy file. By default the result is in memory.
+        working_set (int): Approximate byte limit for tiles in flight.
+        workers (int, optional): Thread count (default: os.cpu_count()).
+
+    Returns:
+        np.memmap or ndarray: The product, shape (m, n).
+    """
+    A, B = open_matrix(A), open_matrix(B)
+    if A.ndim != 2 or B.ndim != 2 or A.shape[1] != B.shape[0]:
+        raise ValueError(f"Cannot multiply matrices of shapes {A.shape} and {B.shape}.")
+    workers = workers or os.cpu_count() or 1
+    dtype = np.result_type(A, B)
+    # One tile each of A, B, the accumulator and the product temporary.
+    tile = tile_size(working_set, dtype.itemsize, workers, 4)
+    (m, k), n = A.shape, B.shape[1]
+    C = _output(out, (m, n), dtype)
+    inner = _ranges(k, tile)
+
+    def task(block):
+        (r0, r1), (c0, c1) = block
+        acc = np.zeros((r1 - r0, c1 - c0), dtype=dtype)
+        for k0, k1 in inner:
+            acc += np.asarray(A[r0:r1, k0:k1]) @ np.asarray(B[k0:k1, c0:c1])
+        C[r0:r1, c0:c1] = acc
+
+    _run(task, [(rows, cols) for rows in _ranges(m, tile) for cols in _ranges(n, tile)], workers)
+    return _finish(C)
+
+
+def blocked_add(A, B, out=None, working_set=DEFAULT_WORKING_SET, workers=None):
+    """
+    Elementwise sum A + B streamed in row panels (same arguments as blocked_multiply).
+    """
+    A, B = open_matrix(A), open_matrix(B)
+    if A.shape != B.shape:
+        raise ValueError(f"Cannot add matrices of shapes {A.shape} and {B.shape}.")
+    workers = workers or os.cpu_count() or 1
+    dtype = np.result_type(A, B)
+    row_bytes = max(int(np.prod(A.shape[1:])), 1) * dtype.itemsize
+    # Two operand panels and the sum per worker.
+    rows = max(int(working_set / (3 * workers * row_bytes)), 1)
+    C = _output(out, A.shape, dtype)
+
+    def task(panel):
+        r0, r1 = panel
+        np.add(A[r0:r1], B[r0:r1], out=C[r0:r1])
+
+    _run(task, _ranges(len(A), rows), workers)
+    return _finish(C)
+
+
+def blocked_transpose(A, out=None, working_set=DEFAULT_WORKING_SET, workers=None):
+    """
+    Transpose of a 2-D matrix copied tile by tile (same arguments as blocked_multiply).
+
+    Square tiles keep both the reads from A and the writes to the output
+    in contiguous runs of at least a tile row.
+    """
+    A = open_matrix(A)
+    if A.ndim != 2:
+        raise ValueError("blocked_transpose expects a 2-D matrix.")
+    workers = workers or os.cpu_count() or 1
+    tile = tile_size(working_set, A.dtype.itemsize, workers, 2)
+    m, n = A.shape
+    C = _output(out, (n, m), A.dtype)
+
+    def task(block):
+        (r0, r1), (c0, c1) = block
+        C[c0:c1, r0:r1] = np.asarray(A[r0:r1, c0:c1]).T
+
+    _run(task, [(rows, cols) for rows in _ranges(m, tile) for cols in _ranges(n, tile)], workers)
+    return _finish(C)
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        a_path, b_path = os.path.join(directory, "A.npy"), os.path.join(directory, "B.npy")
+        np.save(a_path, rng.standard_normal((3000, 2000)))
+        np.save(b_path, rng.standard_normal((2000, 2500)))
+
+        start = time.perf_counter()
+        C = blocked_multiply(a_path, b_path, out=os.path.join(directory, "C.npy"), working_set=32 * 2 ** 20)
+        print(f"3000x2000 @ 2000x2500 from .npy files with a 32 MiB working set: {time.perf_counter() - start:.2f} s")
+        reference = np.load(a_path) @ np.load(b_path)
+        print("Max error against an in-memory matmul:", np.abs(C - reference).max())
+
+        T = blocked_transpose(C, out=os.path.join(directory, "CT.npy"))
+        S = blocked_add(T, T, working_set=32 * 2 ** 20)
+        print("Transpose and add agree:", np.allclose(S, 2 * reference.T))
+        del C, T
@@ -0,0 +1,261 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import structural_rank
+from scipy.sparse.linalg import LinearOperator, bicgstab, cg, eigs, eigsh, gmres, minres, spilu, splu
+
+# Sparse matrices with min(m, n) up to this size get an exact (dense SVD) rank.
+DENSE_RANK_LIMIT = 2000
+
+
+def is_sparse(A):
+    return sp.issparse(A)
+
+
+def as_sparse(A, format="csr"):
+    """
+    Convert a dense array or any scipy.sparse matrix to the given sparse format.
+    """
+    return A.asformat(format) if sp.issparse(A) else sp.csr_array(A).asformat(format)
+
+
+def sparse_add(A, B):
+    """
+    Sum of two matrices, at least one sparse; the result stays sparse when both are.
+    """
+    return A + B
+
+
+def sparse_multiply(A, B):
+    """
+    Matrix product with a sparse operand; sparse @ sparse stays sparse.
+    """
+    return A @ B
+
+
+def sparse_transpose(A):
+    return A.T
+
+
+def is_symmetric(A, tol=1e-12):
+    """
+    Hermitian check that works for dense and sparse matrices without densifying.
+    """
+    if A.shape[0] != A.shape[1]:
+        return False
+    if sp.issparse(A):
+        difference = abs(A - A.conj().T)
+        scale = abs(A).max()
+        return difference.nnz == 0 or difference.max() <= tol * scale
+    A = np.asarray(A)
+    return np.allclose(A, A.conj().T, rtol=0, atol=tol * np.abs(A).max(initial=0))
+
+
+def is_diagonally_dominant(A):
+    """
+    True if A has a positive real diagonal that strictly dominates every row.
+
+    For Hermitian A this proves positive definiteness (Gershgorin discs),
+    in O(nnz) and without densifying.
+    """
+    if sp.issparse(A):
+        diagonal = A.diagonal()
+        off = np.asarray(abs(A).sum(axis=1)).ravel() - np.abs(diagonal)
+    else:
+        A = np.asarray(A)
+        diagonal = np.diagonal(A)
+        off = np.abs(A).sum(axis=1) - np.abs(diagonal)
+    return bool(np.all(np.isreal(diagonal)) and np.all(diagonal.real > off))
+
+
+def sparse_rank(A, tol=None, method="auto"):
+    """
+    Rank of a sparse matrix.
+
+    Parameters:
+        A (sparse matrix): Input matrix.
+        tol (float, optional): Singular value threshold for the dense method.
+        method (str): 'dense' (exact numerical rank via SVD of the densified
+            matrix), 'structural' (rank of the sparsity pattern, an upper
+            bound), or 'auto' ('dense' up to DENSE_RANK_LIMIT, otherwise an error,
+            since no exact sparse rank-revealing factorization is available).
+
+    Returns:
+        int: The rank.
+    """
+    if method == "structural":
+        return int(structural_rank(sp.csr_matrix(A)))
+    if method == "auto" and min(A.shape) > DENSE_RANK_LIMIT:
+        raise ValueError(f"Numerical rank of a sparse matrix larger than {DENSE_RANK_LIMIT} "
+                         "would need densifying; use method='structural' for an upper bound.")
+    return int(np.linalg.matrix_rank(A.toarray(), tol))
+
+
+class SparseFactorization:
+    """
+    Sparse LU factors (SuperLU) of a square matrix, for repeated direct solves.
+
+    Parameters:
+        A (sparse matrix): Square, non-singular matrix.
+    """
+    def __init__(self, A):
+        if A.shape[0] != A.shape[1]:
+            raise ValueError("Matrix must be square.")
+        try:
+            self._lu = splu(sp.csc_matrix(A))
+        except RuntimeError as e:
+            raise ValueError(f"Matrix is singular and not invertible. ({e})")
+        self.shape = A.shape
+
+    def solve(self, B):
+        """
+        Solve A X = B for a vector or a dense block of right-hand sides.
+        """
+        B = B.toarray() if sp.issparse(B) else np.asarray(B)
+        return self._lu.solve(B.astype(np.result_type(B, self._lu.L.dtype)))
+
+
+def sparse_solve(A, B):
+    """
+    Direct sparse solve of A X = B with a sparse LU factorization.
+    """
+    return SparseFactorization(A).solve(B)
+
+
+def jacobi_preconditioner(A):
+    """
+    Diagonal (Jacobi) preconditioner M ~ A^-1 as a LinearOperator.
+    """
+    diagonal = A.diagonal() if sp.issparse(A) else np.diagonal(A)
+    if np.any(diagonal == 0):
+        raise ValueError("Jacobi preconditioner needs a non-zero diagonal.")
+    inverse = 1.0 / diagonal
+    return LinearOperator(A.shape, matvec=lambda x: inverse * x.ravel(), dtype=inverse.dtype)
+
+
+def ilu_preconditioner(A, drop_tol=1e-4, fill_factor=10):
+    """
+    Incomplete LU preconditioner M ~ A^-1 as a LinearOperator.
+    """
+    ilu = spilu(sp.csc_matrix(A), drop_tol=drop_tol, fill_factor=fill_factor)
+    return LinearOperator(A.shape, matvec=ilu.solve, dtype=ilu.L.dtype)
+
+
+_PRECONDITIONERS = {"jacobi": jacobi_preconditioner, "ilu": ilu_preconditioner}
+_SOLVERS = {"cg": cg, "minres": minres, "gmres": gmres, "bicgstab": bicgstab}
+
+
+def _auto_method(A, assume):
+    if assume == "positive_definite":
+        return "cg"
+    if assume == "general" or isinstance(A, LinearOperator) or not is_symmetric(A):
+        return "gmres"
+    # CG can break down on indefinite matrices; MINRES only needs symmetry.
+    return "cg" if is_diagonally_dominant(A) else "minres"
+
+
+def iterative_solve(A, b, method="auto", preconditioner=None, rtol=1e-8, maxiter=None, x0=None,
+                    assume="auto"):
+    """
+    Solve A x = b with a Krylov method, for systems too large to factor.
+
+    Parameters:
+        A (sparse matrix, ndarray or LinearOperator): Square system matrix.
+        b (ndarray): Right-hand side.
+        method (str): 'cg' (symmetric positive definite), 'minres' (symmetric),
+            'gmres', 'bicgstab', or 'auto': cg when A is known to be positive
+            definite, minres for other symmetric A, otherwise gmres.
+        preconditioner (str or LinearOperator, optional): 'jacobi', 'ilu', or
+            an operator approximating A^-1 (cg and minres need it to be
+            symmetric positive definite).
+        rtol (float): Relative residual tolerance.
+        maxiter (int, optional): Iteration limit.
+        x0 (ndarray, optional): Starting guess.
+        assume (str): What 'auto' may take for granted: 'auto' (symmetry is
+            checked, definiteness proven only by diagonal dominance),
+            'positive_definite' or 'general'.
+
+    Returns:
+        tuple: (x, info) where info is 0 on convergence, > 0 the iteration
+        count reached without converging, < 0 a breakdown.
+    """
+    if method == "auto":
+        method = _auto_method(A, assume)
+    if method not in _SOLVERS:
+        raise ValueError(f"Unknown iterative method: {method}")
+    if isinstance(preconditioner, str):
+        preconditioner = _PRECONDITIONERS[preconditioner](A)
+    return _SOLVERS[method](A, b, x0=x0, rtol=rtol, maxiter=maxiter, M=preconditioner)
+
+
+def partial_eigenpairs(A, k=6, which="largest", sigma=None, return_eigenvectors=True):
+    """
+    A few eigenpairs of a large (sparse or dense) matrix.
+
+    Symmetric/Hermitian matrices use Lanczos (eigsh) and order eigenvalues
+    algebraically; other matrices use Arnoldi (eigs) and order them by
+    magnitude. For the smallest eigenvalues of a large matrix, shift-invert
+    around `sigma` (e.g. sigma=0) converges much faster; with a shift the k
+    eigenvalues nearest `sigma` are returned and `which` is not used.
+
+    Parameters:
+        A (sparse matrix, ndarray or LinearOperator): Square matrix.
+        k (int): Number of eigenpairs (k < n, and k < n - 1 for non-symmetric A).
+        which (str): 'largest' or 'smallest'.
+        sigma (float, optional): Shift for shift-invert mode (requires a factorizable A).
+        return_eigenvectors (bool): Skip the eigenvectors when False.
+
+    Returns:
+        eigenvalues (ndarray), sorted ascending, and eigenvectors (columns)
+        when requested.
+    """
+    if which not in ("largest", "smallest"):
+        raise ValueError("which must be 'largest' or 'smallest'.")
+    symmetric = not isinstance(A, LinearOperator) and is_symmetric(A)
+    if sigma is not None:
+        # Shift-invert: the eigenvalues of largest magnitude of (A - sigma I)^-1
+        # are those of A nearest sigma.
+        mode = "LM"
+    elif symmetric:
+        mode = {"largest": "LA", "smallest": "SA"}[which]
+    else:
+        mode = {"largest": "LM", "smallest": "SM"}[which]
+    solver = eigsh if symmetric else eigs
+    result = solver(A, k=k, which=mode, sigma=sigma, return_eigenvectors=return_eigenvectors)
+    values, vectors = result if return_eigenvectors else (result, None)
+    order = np.argsort(values.real if symmetric else np.abs(values))
+    if not return_eigenvectors:
+        return values[order]
+    return values[order], vectors[:, order]
+
+
+def top_k_eigenpairs(A, k=6, **options):
+    """
+    The k largest eigenpairs (algebraically for symmetric A, by magnitude otherwise).
+    """
+    return partial_eigenpairs(A, k, "largest", **options)
+
+
+def bottom_k_eigenpairs(A, k=6, **options):
+    """
+    The k smallest eigenpairs (algebraically for symmetric A, by magnitude otherwise).
+    """
+    return partial_eigenpairs(A, k, "smallest", **options)
+
+
+# Example usage
+if __name__ == "__main__":
+    n = 1_000_000
+    # 1-D Laplacian: symmetric positive definite, three non-zeros per row.
+    L = sp.diags([-np.ones(n - 1), 2.0 * np.ones(n) + 1e-3, -np.ones(n - 1)], [-1, 0, 1], format="csr")
+    b = np.ones(n)
+
+    x = sparse_solve(L, b)
+    print("Direct sparse solve, residual:", np.linalg.norm(L @ x - b))
+    x, info = iterative_solve(L, b, preconditioner="jacobi", maxiter=5000)
+    print("CG + Jacobi, info:", info, "relative residual:", np.linalg.norm(L @ x - b) / np.linalg.norm(b))
+
+    R = sp.random(20000, 20000, density=1e-4, random_state=0, format="csr")
+    print("Top 3 eigenvalues of a 20000 x 20000 sparse symmetric matrix:",
+          top_k_eigenpairs(R + R.T, 3, return_eigenvectors=False))
+    print("Bottom 3 eigenvalues of a 20000-point Laplacian (shift-invert at 0):",
+          bottom_k_eigenpairs(L[:20000, :20000], 3, sigma=0, return_eigenvectors=False))
@@ -1,5 +1,10 @@
 import numpy as np
 
+# Rows of the Gram matrix computed at once by orthogonality_report.
+REPORT_BLOCK_SIZE = 1024
+# Vectors orthogonalized together by blocked Gram-Schmidt.
+GRAM_SCHMIDT_BLOCK_SIZE = 64
+
 def dot_product(v1, v2):
     """
     Compute the dot product of two vectors.
@@ -10,8 +15,8 @@ def dot_product(v1, v2):
     Returns:
         float: The dot product.
     """
-    v1 = np.array(v1)
-    v2 = np.array(v2)
+    v1 = np.asarray(v1)
+    v2 = np.asarray(v2)
     return np.dot(v1, v2)
 
 def is_orthogonal(v1, v2, tol=1e-10):
@@ -37,7 +42,7 @@ def norm(v):
     Returns:
         float: Norm of the vector.
     """
-    v = np.array(v)
+    v = np.asarray(v)
     return np.linalg.norm(v)
 
 def projection(u, v):
@@ -50,13 +55,158 @@ def projection(u, v):
     Returns:
         ndarray: Projection of u onto v.
     """
-    u = np.array(u)
-    v = np.array(v)
+    u = np.asarray(u)
+    v = np.asarray(v)
     v_norm_squared = np.dot(v, v)
     if v_norm_squared == 0:
         raise ValueError("Cannot project onto the zero vector.")
     return (np.dot(u, v) / v_norm_squared) * v
 
+def _rows(X):
+    X = np.asarray(X)
+    if X.ndim != 2:
+        raise ValueError("Expected a row-stacked (N, d) array of vectors.")
+    return X
+
+def pairwise_dot(X, Y):
+    """
+    Dot products of matching rows of two row-stacked arrays.
+
+    Parameters:
+        X, Y (array-like): Arrays of shape (N, d).
+
+    Returns:
+        ndarray: Shape (N,), entry i being dot_product(X[i], Y[i]).
+    """
+    return np.einsum("ij,ij->i", _rows(X), _rows(Y))
+
+def gram_matrix(X, Y=None):
+    """
+    All-pairs dot products of row-stacked vectors, as one matrix product.
+
+    Parameters:
+        X (array-like): Shape (N, d).
+        Y (array-like, optional): Shape (M, d); defaults to X.
+
+    Returns:
+        ndarray: Shape (N, M), entry (i, j) being dot_product(X[i], Y[j]).
+    """
+    X = _rows(X)
+    Y = X if Y is None else _rows(Y)
+    return X @ Y.T
+
+def row_norms(X):
+    """
+    Euclidean norm of every row of an (N, d) array, without squaring a copy of X.
+    """
+    X = _rows(X)
+    if np.iscomplexobj(X):
+        return np.linalg.norm(X, axis=1)
+    return np.sqrt(np.einsum("ij,ij->i", X, X))
+
+def project_onto_basis(X, basis, orthonormal=False):
+    """
+    Project every row of X onto the span of the rows of a shared basis.
+
+    Parameters:
+        X (array-like): Vectors to project, shape (N, d).
+        basis (array-like): Spanning vectors, shape (k, d).
+        orthonormal (bool): The basis rows are orthonormal, so the
+            coefficients are inner products with the conjugated basis rows;
+            otherwise they come from a least-squares solve (dependent basis
+            vectors are allowed).
+
+    Returns:
+        ndarray: Projections, shape (N, d).
+    """
+    X, basis = _rows(X), _rows(basis)
+    if orthonormal:
+        return (X @ basis.conj().T) @ basis
+    coefficients = np.linalg.lstsq(basis.T, X.T, rcond=None)[0]
+    return coefficients.T @ basis
+
+def orthogonality_report(X, tol=1e-10, normalize=False):
+    """
+    Check every pair of rows of X for orthogonality.
+
+    The Gram matrix is formed REPORT_BLOCK_SIZE rows at a time, so memory
+    stays O(block * N) for large sets.
+
+    Parameters:
+        X (array-like): Vectors, shape (N, d).
+        tol (float): Pairs with |dot| >= tol count as not orthogonal.
+        normalize (bool): Compare cosines instead of raw dot products.
+
+    Returns:
+        dict: 'orthogonal' (bool), 'max_abs_dot' (largest off-diagonal
+        |dot|, or cosine), and 'pairs' (array of the (i, j), i < j, failing).
+    """
+    X = _rows(X)
+    n = len(X)
+    scale = row_norms(X) if normalize else None
+    worst = 0.0
+    pairs = []
+    for start in range(0, n, REPORT_BLOCK_SIZE):
+        stop = min(start + REPORT_BLOCK_SIZE, n)
+        # Only columns j > i are needed: the Gram matrix is symmetric.
+        block = np.abs(X[start:stop] @ X[start:].T)
+        if normalize:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                block /= np.outer(scale[start:stop], scale[start:])
+            block[np.isnan(block)] = 0.0
+        block[np.tril_indices(stop - start, 0, block.shape[1])] = 0.0
+        worst = max(worst, float(block.max(initial=0.0)))
+        rows, cols = np.nonzero(block >= tol)
+        pairs.append(np.column_stack((rows + start, cols + start)))
+    pairs = np.concatenate(pairs) if pairs else np.empty((0, 2), dtype=int)
+    return {"orthogonal": len(pairs) == 0, "max_abs_dot": worst, "pairs": pairs}
+
+def _check_independent(r_diagonal, threshold):
+    # A tiny diagonal entry of R means that vector was (nearly) in the span of the earlier ones.
+    if len(r_diagonal) and np.abs(r_diagonal).min() <= threshold:
+        raise ValueError("Vectors are linearly dependent.")
+
+def orthonormalize(X, method="householder", block_size=GRAM_SCHMIDT_BLOCK_SIZE, tol=1e-12):
+    """
+    Orthonormal rows spanning the same nested subspaces as the rows of X.
+
+    Parameters:
+        X (array-like): Linearly independent vectors, shape (N, d) with N <= d.
+        method (str): 'householder' (LAPACK's blocked Householder QR; most
+            accurate) or 'gram_schmidt' (blocked classical Gram-Schmidt with
+            one re-orthogonalization pass, working block_size rows at a time
+            with matrix-matrix products).
+        block_size (int): Rows per block for 'gram_schmidt'.
+        tol (float): Relative threshold for detecting dependent vectors.
+
+    Returns:
+        ndarray: Q of shape (N, d) with orthonormal rows; Q[:i] spans the
+        same space as X[:i] for every i.
+    """
+    X = _rows(X)
+    n, d = X.shape
+    if n > d:
+        raise ValueError(f"{n} vectors in dimension {d} are linearly dependent.")
+    if method == "householder":
+        # X.T = Q R, so the columns of Q orthonormalize the rows of X in order.
+        q, r = np.linalg.qr(X.T)
+        r_diagonal = np.diagonal(r)
+        _check_independent(r_diagonal, tol * np.abs(r_diagonal).max(initial=0.0))
+        return q.T
+    if method != "gram_schmidt":
+        raise ValueError(f"Unknown orthonormalization method: {method}")
+    Q = np.empty(X.shape, dtype=np.result_type(X, float))
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        V = X[start:stop].astype(Q.dtype)
+        # Twice is enough: the second pass removes what rounding left of the first.
+        for _ in range(2):
+            V -= (V @ Q[:start].conj().T) @ Q[:start]
+        q, r = np.linalg.qr(V.T)
+        _check_independent(np.diagonal(r), tol * row_norms(X[start:stop]).max())
+        Q[start:stop] = q.T
+    return Q
+
 # Example usage
 if __name__ == "__main__":
     a = [1, 2]
@@ -66,3 +216,13 @@ if __name__ == "__main__":
     print("Are orthogonal?", is_orthogonal(a, b))
     print("Norm of a:", norm(a))
     print("Projection of a onto b:", projection(a, b))
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((2000, 3000))
+    Q = orthonormalize(vectors, method="gram_schmidt")
+    print("\nBlocked Gram-Schmidt on 2000 vectors, max |Q Q^T - I|:", np.abs(gram_matrix(Q) - np.eye(2000)).max())
+    report = orthogonality_report(Q, tol=1e-8)
+    print("Orthogonality report:", report["orthogonal"], report["max_abs_dot"])
+    print("Row norms of Q (first 3):", row_norms(Q)[:3])
+    P = project_onto_basis(vectors[:5], Q[:10], orthonormal=True)
+    print("Projection onto the first 10 directions reproduces vectors[:5]?", np.allclose(P, vectors[:5], atol=1e-8))
@@ -1,12 +1,6 @@
-from algebra import *
-from calculus import *
-from linear_algebra import *
-from number_theory import *
-#from calculus import  differentiate_expression, indefinite_integral,definite_integral
-
+# Each page imports only what it uses; the packages load their modules lazily.
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 
 st.title("Interactive Math Explorer!📊")
 
@@ -17,6 +11,8 @@ topic= st.sidebar.selectbox(
 #----------------------------------ALGEBRA------------------------
 
 if topic == "Algebra":
+    from algebra import Complex, Polynomial, IntegerModRing, RingElement
+
     operation= st.selectbox("Select Operation",[
         "Complex Numbers","Polynomials","Ring Theory"
     ])
@@ -57,6 +53,7 @@ if topic == "Algebra":
             elif op == "Derivative": st.success(f"Derivative p1: {p1.derivative()}, p2: {p2.derivative()}")
             elif op == "Integral": st.success(f"Integral p1: {p1.integrate()}, p2: {p2.integrate()}")
             elif op== 'Plot':
+                import matplotlib.pyplot as plt
                 x= np.linspace(-10,10,400)
                 y1= p1.evaluate(x)
                 y2= p2.evaluate(x)
@@ -85,6 +82,10 @@ if topic == "Algebra":
 #---------------------------CALCULUS-------------------------------------
 
 elif topic == "Calculus":
+    from sympy import Symbol
+    from calculus import (differentiate_expression, indefinite_integral, definite_integral,
+                          run_symbolic_cached, SIMPLIFY_FULL, TaskTimeout, WorkerCrashed)
+
     operation = st.selectbox("Select Operations",[
         "Differentiation","Integration"])
     
@@ -92,8 +93,13 @@ elif topic == "Calculus":
         expr = st.text_input("Enter the expression to differentiate","x**2 + 3*x")
         #var= st.text_input("Variable: ","x")
         if st.button("Compute Derivation"):
-            result = differentiate_expression(expr)
-            st.success(f"{result}")
+            try:
+                # Same cache key as differentiate_expression, so repeats skip the worker.
+                result = run_symbolic_cached("diff", (Symbol("x"), SIMPLIFY_FULL),
+                                             differentiate_expression, expr)
+                st.success(f"{result}")
+            except (TaskTimeout, WorkerCrashed) as e:
+                st.error(f"Differentiation stopped: {e}")
 
 
     elif operation =="Integration":
@@ -101,17 +107,25 @@ elif topic == "Calculus":
         if inte == "Indefinite Integral":
             exprs = st.text_input("Enter the expression for Indefinite Integral","x**2")
             if st.button("Compute Integral"):
-                st.success(indefinite_integral(exprs))
+                try:
+                    st.success(run_symbolic_cached("integrate", (Symbol("x"),), indefinite_integral, exprs))
+                except (TaskTimeout, WorkerCrashed) as e:
+                    st.error(f"Integration stopped: {e}")
         elif inte == "Definite Integral":
             exprs = st.text_input("Enter the expression for Definite Integral","x**2")
             a = st.number_input("Lower limit", value=0)
             b = st.number_input("Upper limit", value=1)
             if st.button("Compute Integral"):
+                # Not sent to a worker: definite_integral already runs its symbolic step there
+                # under a time budget, caches it here, and falls back to quadrature in-process.
                 st.success(definite_integral(exprs, a,b))
 
 #---------------------------------------LINEAR ALGEBRA-----------------------------
 
 elif topic == "Linear Algebra":
+    from linear_algebra import (add_matrices, multiply_matrices, transpose_matrix, determinant, inverse,
+                                rank, eigenvalues_and_vectors, dot_product, is_orthogonal, norm, projection)
+
     operation = st.selectbox("Select Operation",[
         "Matrix Operation","Vectors"
     ])
@@ -185,6 +199,8 @@ elif topic == "Linear Algebra":
 #------------------------------NUMBER THEORY--------------
 
 elif topic == "Number Theory":
+    from number_theory import check_prime, generate_primes, get_prime_factors
+
     operation = st.radio("**Select Operation:**",[
         "Check Prime", "Generate Primes", "Prime Factors"
     ])
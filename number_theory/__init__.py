@@ -1,3 +1,8 @@
-from .gcd_lcm import *
-from .mod_arithmetic import *
-from .primes import *
\ No newline at end of file
+from utils.lazy import lazy_package
+
+# Submodules are imported on first use of one of their names.
+__getattr__, __dir__, __all__ = lazy_package(__name__, [
+    "gcd_lcm",
+    "mod_arithmetic",
+    "primes",
+])
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+import sympy
+
+from calculus.autodiff import derivative_values, derivatives, gradient, taylor_coefficients
+
+EXPRESSIONS = [
+    "x**3*sin(x)",
+    "exp(-x**2)*cos(3*x)",
+    "log(x)/x + sqrt(x)",
+    "tan(x) + atan(x)",
+    "sinh(x)*tanh(x) - cosh(x)",
+    "asin(x/3) + acos(x/4)",
+    "2**x + x**x",
+    "1/(1 + x**2)",
+]
+
+
+def reference(expr, order, points):
+    x = sympy.symbols("x")
+    f = sympy.sympify(expr)
+    return np.array([sympy.lambdify(x, sympy.diff(f, x, k), "numpy")(points) + 0 * points
+                     for k in range(order + 1)])
+
+
+@pytest.mark.parametrize("expr", EXPRESSIONS)
+def test_derivatives_match_sympy(expr):
+    points = np.linspace(0.3, 2.5, 7)
+    assert np.allclose(derivatives(expr, points, order=3), reference(expr, 3, points), rtol=1e-9, atol=1e-9)
+
+
+def test_abs_first_derivative():
+    points = np.array([-2.0, 0.5, 3.0])
+    assert np.allclose(derivatives("abs(x - 1)*x", points), [[-6, 0.25, 6], [5, 0, 5]])
+
+
+def test_taylor_coefficients_and_single_order():
+    points = np.array([0.0, 1.0])
+    assert np.allclose(taylor_coefficients("exp(x)", points, order=4)[:, 0], [1, 1, 1 / 2, 1 / 6, 1 / 24])
+    assert np.allclose(derivative_values("x**5", points, order=5), [120, 120])
+    assert np.allclose(derivatives("7", points, order=2), [[7, 7], [0, 0], [0, 0]])
+
+
+def test_reverse_mode_gradient_matches_sympy():
+    x, y, z = sympy.symbols("x y z")
+    f = sympy.exp(x * y) + sympy.log(x) / y + sympy.sin(z) * x ** 2
+    points = np.random.default_rng(0).uniform(0.5, 2.0, (3, 50))
+    value, partials = gradient(str(f), "x, y, z", *points)
+    assert np.allclose(value, sympy.lambdify((x, y, z), f)(*points))
+    for partial, var in zip(partials, (x, y, z)):
+        assert np.allclose(partial, sympy.lambdify((x, y, z), f.diff(var))(*points))
+
+
+def test_gradient_broadcasts_and_checks_arity():
+    value, (dx, dy) = gradient("x*y", "x, y", np.arange(3.0), 2.0)
+    assert np.allclose(value, [0, 2, 4]) and np.allclose(dx, 2) and np.allclose(dy, [0, 1, 2])
+    with pytest.raises(ValueError):
+        gradient("x*y", "x, y", 1.0)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from linear_algebra.batched import batched_det, batched_inverse, map_chunks
+from linear_algebra.matrix_ops import inverse
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 5, 7])
+def test_det_and_inverse_match_numpy(n):
+    stack = np.random.default_rng(n).standard_normal((300, n, n))
+    assert np.allclose(batched_det(stack), np.linalg.det(stack))
+    assert np.allclose(batched_inverse(stack), np.linalg.inv(stack), rtol=1e-7, atol=1e-9)
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 6])
+@pytest.mark.parametrize("scale", [1e-300, 1e-120, 1e120])
+def test_singularity_is_judged_relative_to_scale(n, scale):
+    rng = np.random.default_rng(0)
+    stack = scale * (rng.standard_normal((50, n, n)) + n * np.eye(n))
+    inverse = batched_inverse(stack)
+    assert np.allclose(inverse @ stack, np.eye(n))
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 6])
+def test_singular_matrices(n):
+    stack = np.repeat(np.eye(n)[None], 3, axis=0)
+    stack[1, -1] = stack[1, 0]                      # repeated row
+    stack[2, -1] = 0                                # zero row
+    stack[0] *= 1e-200
+    with pytest.raises(ValueError):
+        batched_inverse(stack)
+    inverse = batched_inverse(stack, singular="nan")
+    assert np.allclose(inverse[0], 1e200 * np.eye(n))
+    assert np.isnan(inverse[1:]).all()
+
+
+def test_complex_and_batch_shapes():
+    rng = np.random.default_rng(2)
+    stack = rng.standard_normal((2, 5, 3, 3)) + 1j * rng.standard_normal((2, 5, 3, 3))
+    assert batched_det(stack).shape == (2, 5)
+    assert np.allclose(batched_inverse(stack) @ stack, np.eye(3))
+    assert np.ndim(batched_det(np.eye(3))) == 0
+
+
+def test_map_chunks_crosses_chunk_boundaries():
+    stack = np.random.default_rng(3).standard_normal((10, 2, 2))
+    assert np.allclose(map_chunks(np.linalg.det, stack, chunk_size=3), np.linalg.det(stack))
+    values, vectors = map_chunks(lambda block: tuple(np.linalg.eig(block)), stack, chunk_size=4)
+    assert values.shape == (10, 2) and vectors.shape == (10, 2, 2)
+
+
+@pytest.mark.parametrize("n", [2, 3, 6])
+@pytest.mark.parametrize("gap, invertible", [(1e-15, False), (1e-13, True), (1e-10, True)])
+def test_stacked_and_single_inverse_agree_on_singularity(n, gap, invertible):
+    # Two rows `gap` apart: rcond is about gap / 4, against a threshold of n * eps.
+    A = np.eye(n)
+    A[:2, :2] = [[1, 1], [1, 1 + gap]]
+    stacked = batched_inverse(A[None], singular="nan")[0]
+    if invertible:
+        assert np.allclose(stacked, inverse(A), rtol=1e-6)
+    else:
+        with pytest.raises(ValueError):
+            inverse(A)
+        assert np.isnan(stacked).all()
@@ -0,0 +1,74 @@
+import pytest
+from sympy import cos, sin, symbols
+
+from calculus.cache import (ExpressionCache, as_expression, as_symbols, canonical_key, parse_expression,
+                            parse_cache, result_cache)
+from calculus.differentiation import differentiate_expression
+
+x = symbols("x")
+
+
+def test_lru_eviction_and_counters():
+    cache = ExpressionCache(maxsize=2)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value * 2
+
+    assert cache.get_or_compute("a", lambda: compute(1)) == 2
+    assert cache.get_or_compute("b", lambda: compute(2)) == 4
+    assert cache.get_or_compute("a", lambda: compute(1)) == 2
+    cache.get_or_compute("c", lambda: compute(3))  # evicts "b", the least recently used
+    cache.get_or_compute("b", lambda: compute(2))
+    assert calls == [1, 2, 3, 2]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 4, 2)
+
+
+def test_exceptions_are_not_cached():
+    cache = ExpressionCache()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        cache.get_or_compute("k", fail)
+    assert cache.get_or_compute("k", lambda: 5) == 5
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    first = ExpressionCache(disk_path=path)
+    first.get_or_compute("k", lambda: sin(x) ** 2)
+    first.disable_disk()
+
+    second = ExpressionCache(disk_path=path)
+    assert second.get_or_compute("k", lambda: pytest.fail("should be read from disk")) == sin(x) ** 2
+    assert second.stats()["disk_hits"] == 1
+    second.clear(disk=True)
+    assert second.get_or_compute("k", lambda: 1) == 1
+    second.disable_disk()
+
+
+def test_equivalent_inputs_share_keys():
+    assert parse_expression("x**2 + 3*x") is parse_expression("  x**2 +   3*x ")
+    assert canonical_key("diff", parse_expression("x**2+3*x"), x) == canonical_key("diff", parse_expression("3*x + x**2"), x)
+    assert canonical_key("diff", cos(x), x) != canonical_key("diff", cos(x), symbols("y"))
+
+
+def test_differentiation_uses_the_result_cache():
+    parse_cache.clear()
+    result_cache.clear()
+    first = differentiate_expression("x**3 + sin(x)")
+    misses = result_cache.stats()["misses"]
+    assert differentiate_expression("sin(x) + x**3") == first
+    assert result_cache.stats()["misses"] == misses and result_cache.stats()["hits"] >= 1
+
+
+def test_input_helpers():
+    y = symbols("y")
+    assert as_expression("sin(x) + y") == sin(x) + y
+    assert as_expression(cos(x)) == cos(x)
+    assert as_expression(3) == 3
+    assert as_symbols("x, y") == [x, y] == as_symbols(["x", y])
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from algebra.complex_numbers import Complex, ComplexArray
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal(50) + 1j * rng.standard_normal(50)
+
+
+def test_arithmetic_matches_numpy(values):
+    a, b = ComplexArray(values), ComplexArray(values[::-1])
+    assert np.allclose((a + b).to_numpy(), values + values[::-1])
+    assert np.allclose((a - b).to_numpy(), values - values[::-1])
+    assert np.allclose((a * b).to_numpy(), values * values[::-1])
+    assert np.allclose((a / b).to_numpy(), values / values[::-1])
+    assert np.allclose((2 - a).to_numpy(), 2 - values)
+    assert np.allclose((1 / a).to_numpy(), 1 / values)
+
+
+def test_mixed_operands_with_complex(values):
+    z = Complex(1.5, -2.0)
+    result = ComplexArray(values) * z
+    assert np.allclose(result.to_numpy(), values * complex(1.5, -2.0))
+
+
+def test_in_place_operations_reuse_buffer(values):
+    a = ComplexArray(values.copy())
+    buffer = a.to_numpy()
+    a += 1
+    a *= 2j
+    a.conjugate(inplace=True)
+    assert a.to_numpy() is buffer
+    assert np.allclose(buffer, np.conj((values + 1) * 2j))
+
+
+def test_polar_round_trip(values):
+    a = ComplexArray(values)
+    r, theta = a.polar()
+    assert np.allclose(ComplexArray.from_polar(r, theta).to_numpy(), values)
+
+
+def test_complex_list_round_trip(values):
+    items = ComplexArray(values[:5]).to_complex_list()
+    assert all(isinstance(z, Complex) for z in items)
+    assert ComplexArray.from_complex_list(items) == ComplexArray(values[:5])
+
+
+def test_indexing_returns_complex_scalars(values):
+    a = ComplexArray(values)
+    assert isinstance(a[3], Complex)
+    assert isinstance(a[1:4], ComplexArray)
+    a[0] = Complex(7, 8)
+    assert a.to_numpy()[0] == 7 + 8j
+
+
+def test_division_by_zero_raises():
+    with pytest.raises(ZeroDivisionError):
+        ComplexArray([1, 2]) / ComplexArray([1, 0])
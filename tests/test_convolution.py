@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from algebra.convolution import choose_method, convolve, fft_convolve, fft_error_bound
+from algebra.polynomials import Polynomial
+
+
+def exact_product(a, b):
+    return np.convolve(np.array([int(v) for v in a], dtype=object), np.array([int(v) for v in b], dtype=object))
+
+
+@pytest.mark.parametrize("method", ["schoolbook", "karatsuba", "fft", "auto"])
+@pytest.mark.parametrize("sizes", [(1, 1), (5, 300), (700, 650), (3000, 2000)])
+def test_integer_products_are_exact(method, sizes):
+    rng = np.random.default_rng(sum(sizes))
+    a = rng.integers(-9, 10, sizes[0]).astype(float)
+    b = rng.integers(-9, 10, sizes[1]).astype(float)
+    assert np.array_equal(convolve(a, b, method), exact_product(a, b).astype(float))
+
+
+def test_fft_falls_back_when_rounding_is_not_guaranteed():
+    rng = np.random.default_rng(1)
+    a = rng.integers(-10 ** 6, 10 ** 6, 3000).astype(float)
+    b = rng.integers(-10 ** 6, 10 ** 6, 3000).astype(float)
+    assert fft_error_bound(a, b) >= 0.5
+    assert np.array_equal(fft_convolve(a, b), exact_product(a, b).astype(float))
+
+
+def test_real_and_complex_fft_match_direct_product():
+    rng = np.random.default_rng(2)
+    a, b = rng.standard_normal(1500), rng.standard_normal(1200)
+    assert np.allclose(fft_convolve(a, b), np.convolve(a, b))
+    z = a + 1j * rng.standard_normal(1500)
+    assert np.allclose(fft_convolve(z, b), np.convolve(z, b))
+
+
+def test_choose_method_by_size():
+    assert choose_method(10, 5000) == "schoolbook"
+    assert choose_method(500, 500) == "karatsuba"
+    assert choose_method(5000, 5000) == "fft"
+
+
+def test_polynomial_power_matches_repeated_multiplication():
+    p = Polynomial([1, -2, 3])
+    expected = Polynomial([1])
+    for _ in range(7):
+        expected = expected.multiply(p, "schoolbook")
+    assert np.array_equal(p.power(7).coefficients, expected.coefficients)
+    assert np.array_equal(p.power(0).coefficients, [1.0])
+    with pytest.raises(ValueError):
+        p.power(-1)
+
+
+def test_fft_error_bound_covers_observed_error():
+    rng = np.random.default_rng(1)
+    a, b = rng.standard_normal(3000) * 1e6, rng.standard_normal(2000)
+    error = np.abs(np.convolve(a, b) - fft_convolve(a, b, round_integers=False)).max()
+    bound = fft_error_bound(a, b)
+    assert error <= bound
+    # The documented safety factor of four over the single-transform bound.
+    assert np.isclose(bound, 4 * np.finfo(float).eps * np.log2(4999) * np.linalg.norm(a) * np.linalg.norm(b))
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from linear_algebra.eigenstuff import _bandwidths, detect_structure, eigenvalues_and_vectors
+
+
+def random_symmetric(n, seed=0):
+    M = np.random.default_rng(seed).standard_normal((n, n))
+    return M + M.T
+
+
+def banded(n, bandwidth, seed=0):
+    A = random_symmetric(n, seed)
+    rows, cols = np.indices(A.shape)
+    A[np.abs(rows - cols) > bandwidth] = 0
+    return A
+
+
+STRUCTURES = {
+    "diagonal": np.diag(np.arange(5.0, 0, -1)),
+    "upper_triangular": np.triu(np.random.default_rng(1).standard_normal((5, 5))) + np.diag(np.arange(5.0)),
+    "lower_triangular": np.tril(np.random.default_rng(2).standard_normal((5, 5))) + np.diag(np.arange(5.0)),
+    "tridiagonal": banded(40, 1),
+    "banded": banded(60, 3),
+    "symmetric": random_symmetric(8),
+    "general": np.random.default_rng(3).standard_normal((6, 6)),
+}
+
+
+@pytest.mark.parametrize("structure", STRUCTURES)
+def test_each_path_matches_lapack(structure):
+    A = STRUCTURES[structure]
+    assert detect_structure(A)[0] == structure
+    values, vectors, path = eigenvalues_and_vectors(A, return_path=True)
+    assert path == structure
+    assert np.allclose(np.sort_complex(values.astype(complex)), np.sort_complex(np.linalg.eigvals(A)))
+    assert np.allclose(A @ vectors, vectors * values, atol=1e-8)
+
+
+@pytest.mark.parametrize("structure", ["tridiagonal", "banded", "symmetric", "general", "diagonal"])
+def test_subsets(structure):
+    A = STRUCTURES[structure]
+    every = np.sort(np.linalg.eigvals(A).real)
+    values, _ = eigenvalues_and_vectors(A, eigenvalues_only=True, subset_by_index=(1, 3))
+    assert np.allclose(np.sort(values.real), every[1:4])
+    low, high = every[0] - 1e-9, every[2] + 1e-9
+    values, vectors = eigenvalues_and_vectors(A, subset_by_value=(low, high))
+    assert np.allclose(np.sort(values.real), every[:3])
+    assert vectors.shape == (len(A), 3)
+
+
+def test_repeated_triangular_eigenvalues_use_general_path():
+    A = np.array([[2.0, 1.0], [0.0, 2.0]])
+    _, _, path = eigenvalues_and_vectors(A, return_path=True)
+    assert path == "general"
+
+
+def test_small_scale_asymmetry_is_not_symmetric():
+    A = 1e-9 * np.array([[1.0, 0.0, 2.0], [3.0, 1.0, 0.0], [0.0, 5.0, 1.0]])
+    assert detect_structure(A)[0] == "general"
+
+
+def test_stacks_and_sparse_input():
+    stack = np.stack([random_symmetric(4, seed) for seed in range(10)])
+    values, vectors, path = eigenvalues_and_vectors(stack, return_path=True)
+    assert path == "symmetric" and np.allclose(values, np.linalg.eigvalsh(stack))
+    values, _ = eigenvalues_and_vectors(stack, subset_by_index=(0, 1))
+    assert values.shape == (10, 2)
+    general = np.random.default_rng(5).standard_normal((10, 3, 3))
+    assert eigenvalues_and_vectors(general, return_path=True)[2] == "general"
+    S = sp.csr_array(STRUCTURES["banded"])
+    assert np.allclose(eigenvalues_and_vectors(S, eigenvalues_only=True)[0], np.linalg.eigvalsh(S.toarray()))
+    with pytest.raises(ValueError):
+        eigenvalues_and_vectors(sp.identity(5000, format="csr"))
+    with pytest.raises(ValueError):
+        eigenvalues_and_vectors(np.ones((2, 3)))
+
+
+@pytest.mark.parametrize("lower, upper", [(0, 0), (0, 3), (2, 0), (1, 4), (5, 5), (6, 6)])
+def test_bandwidths_without_index_arrays(lower, upper):
+    import tracemalloc
+
+    A = np.triu(np.tril(np.ones((7, 7)), upper), -lower)
+    assert _bandwidths(A) == (lower, upper)
+    assert _bandwidths(np.zeros((3, 3))) == (0, 0) and _bandwidths(np.zeros((0, 0))) == (0, 0)
+    large = banded(800, 3)
+    tracemalloc.start()
+    assert _bandwidths(large) == (3, 3)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < large.nbytes / 100
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from algebra.evaluation import batch_evaluate, coefficient_matrix, multipoint_evaluate, subproduct_tree
+from algebra.polynomials import ModPolynomial, Polynomial
+from algebra.ring_theory import IntegerModRing
+
+
+def test_batch_evaluate_matches_polyval():
+    polys = [Polynomial([1, 0, -2]), Polynomial([1, -1]), Polynomial([3])]
+    x = np.linspace(-2, 2, 7)
+    values = batch_evaluate(polys, x)
+    assert values.shape == (3, 7)
+    for row, p in zip(values, polys):
+        assert np.allclose(row, np.polyval(p.coefficients, x))
+
+
+def test_coefficient_matrix_left_pads():
+    assert np.array_equal(coefficient_matrix([[1, 2, 3], [4]]), [[1, 2, 3], [0, 0, 4]])
+
+
+@pytest.mark.parametrize("points", [
+    np.arange(100.0),
+    np.linspace(0, 3, 200),
+    np.exp(2j * np.pi * np.random.default_rng(1).random(100)),
+])
+def test_float_multipoint_is_as_accurate_as_horner(points):
+    p = Polynomial(np.random.default_rng(0).standard_normal(100))
+    expected = np.polyval(p.coefficients, points)
+    scale = np.polyval(np.abs(p.coefficients), np.abs(points))
+    assert np.all(np.abs(multipoint_evaluate(p, points) - expected) <= 1e-12 * scale)
+
+
+@pytest.mark.parametrize("modulus", [998244353, 1000000007, 97])
+def test_exact_multipoint_over_ring(modulus):
+    rng = np.random.default_rng(modulus % 1000)
+    ring = IntegerModRing(modulus)
+    q = ModPolynomial(rng.integers(0, modulus, 300), ring)
+    xs = rng.integers(0, modulus, 500)
+    assert np.array_equal(multipoint_evaluate(q, xs, leaf_size=16), q.evaluate(xs))
+
+
+def test_subproduct_tree_root_vanishes_on_points():
+    points = np.array([1, 2, 3, 4, 5])
+    root = subproduct_tree(points, 101)[-1][0]
+    assert np.all(ModPolynomial(root, 101).evaluate(points) == 0)
+    assert len(root) == len(points) + 1
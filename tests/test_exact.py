@@ -0,0 +1,69 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy
+
+from linear_algebra.exact import (_moduli, bareiss_det, bareiss_rank, exact_det, exact_inverse, exact_rank, exact_solve,
+                                  modular_det, modular_rank)
+from linear_algebra.matrix_ops import determinant, inverse, rank
+
+
+def hilbert(n):
+    return [[Fraction(1, i + j + 1) for j in range(n)] for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [1, 3, 10, 60])
+def test_integer_det_methods_agree_with_sympy(n):
+    M = np.random.default_rng(n).integers(-1000, 1000, size=(n, n))
+    expected = int(sympy.Matrix(M.tolist()).det(method="bareiss"))
+    assert bareiss_det(M) == modular_det(M) == exact_det(M) == expected
+
+
+def test_rational_det_inverse_and_solve():
+    H = hilbert(6)
+    assert exact_det(H) == sympy.Matrix(H).det()
+    inverse_H = exact_inverse(H)
+    assert (np.array(H, dtype=object).dot(inverse_H) == np.eye(6, dtype=int)).all()
+    b = [Fraction(k, 7) for k in range(6)]
+    x = exact_solve(H, b)
+    assert list(np.array(H, dtype=object).dot(x)) == b
+    with pytest.raises(ValueError):
+        exact_solve([[1, 2], [2, 4]], [1, 1])
+
+
+def test_rank_beats_floating_point():
+    assert exact_rank(hilbert(14)) == 14
+    M = np.random.default_rng(0).integers(-9, 9, size=(60, 50))
+    deficient = M @ np.random.default_rng(1).integers(-9, 9, size=(50, 70))
+    assert modular_rank(deficient) == bareiss_rank(deficient) == exact_rank(deficient) == 50
+
+
+def test_large_entries_fall_back_to_bareiss():
+    M = [[2 ** 70, 1], [3, 2 ** 65]]
+    assert exact_det(M) == 2 ** 135 - 3
+    with pytest.raises(ValueError):
+        modular_det(M)
+
+
+def test_empty_matrices():
+    assert exact_det([]) == 1 and modular_det([]) == 1
+    assert exact_rank([[]]) == 0 and exact_rank([]) == 0 and modular_rank([[]]) == 0
+    assert exact_inverse([]).shape == (0, 0)
+    assert exact_solve([], []).shape == (0,)
+    empty = np.zeros((0, 0), dtype=int)
+    assert determinant(empty, exact=True) == 1
+    assert inverse(empty, exact=True).shape == (0, 0)
+    assert rank(np.zeros((3, 0), dtype=int), exact=True) == 0
+
+
+def test_rank_survives_minors_divisible_by_the_first_primes():
+    # Every 2 x 2 minor is a multiple of the three largest primes below 2**31.
+    p1, p2, p3 = _moduli(3)
+    A = np.zeros((48, 48), dtype=np.int64)
+    A[0, 0], A[1, 1] = p1 * p2, p3
+    assert bareiss_rank(A) == np.linalg.matrix_rank(A) == 2
+    assert modular_rank(A) == exact_rank(A) == rank(A, exact=True) == 2
+    B = A.copy()
+    B[2, 2] = p2 * p3
+    assert modular_rank(B) == bareiss_rank(B) == 3
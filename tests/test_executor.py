@@ -0,0 +1,108 @@
+import os
+import threading
+import time
+
+import pytest
+
+import calculus.executor
+from calculus.cache import clear_caches
+from calculus.differentiation import SIMPLIFY_FULL, differentiate_expression
+from calculus.executor import (SHARED_MEMORY_LIMIT, SymbolicExecutor, TaskTimeout, WorkerCrashed,
+                               get_executor, run_symbolic_cached)
+
+
+def sleep_and_return(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+def exit_worker():
+    os._exit(3)
+
+
+def report_error(expr_str):
+    return f"Error in test: {expr_str}"
+
+
+def test_map_returns_results_in_order():
+    with SymbolicExecutor(max_workers=2) as executor:
+        assert executor.map(differentiate_expression, ["x**2", "sin(x)"]) == \
+            [differentiate_expression("x**2"), differentiate_expression("sin(x)")]
+
+
+def test_timeout_kills_and_replaces_the_worker():
+    with SymbolicExecutor(max_workers=1, timeout=0.3) as executor:
+        with pytest.raises(TaskTimeout):
+            executor.submit(sleep_and_return, 30, None).result()
+        assert executor.submit(sleep_and_return, 0, 5).result() == 5
+        assert executor.stats()["respawns"] == 1
+
+
+def test_crashed_worker_is_reported_and_replaced():
+    with SymbolicExecutor(max_workers=1) as executor:
+        with pytest.raises(WorkerCrashed):
+            executor.submit(exit_worker).result()
+        assert executor.submit(sleep_and_return, 0, "ok").result() == "ok"
+
+
+def test_unpicklable_task_fails_alone():
+    with SymbolicExecutor(max_workers=1) as executor:
+        bad = executor.submit(sleep_and_return, 0, threading.Lock())
+        good = executor.submit(sleep_and_return, 0, 7)
+        with pytest.raises(TypeError):
+            bad.result(timeout=10)
+        assert good.result(timeout=10) == 7
+        assert executor.stats()["respawns"] == 0
+
+
+def test_worker_that_died_while_idle_is_replaced():
+    with SymbolicExecutor(max_workers=1) as executor:
+        assert executor.submit(sleep_and_return, 0, 1).result() == 1
+        worker = executor._workers[0]
+        worker.process.kill()
+        worker.process.join()
+        first = executor.submit(sleep_and_return, 0, 2)
+        try:
+            assert first.result(timeout=10) == 2
+        except WorkerCrashed:
+            pass
+        assert executor.submit(sleep_and_return, 0, 3).result(timeout=10) == 3
+
+
+def test_cancel_running_task():
+    with SymbolicExecutor(max_workers=1) as executor:
+        future = executor.submit(sleep_and_return, 30, None)
+        while not future.running():
+            time.sleep(0.01)
+        assert future.cancel()
+        assert executor.submit(sleep_and_return, 0, 1).result(timeout=10) == 1
+
+
+def test_shared_executor_limits_memory():
+    assert get_executor().memory_limit == SHARED_MEMORY_LIMIT
+
+
+def test_cached_dispatch_checks_the_parent_cache(monkeypatch):
+    import sympy
+
+    clear_caches()
+    calls = []
+    real = calculus.executor.run_symbolic
+
+    def counting(fn, *args, **kwargs):
+        calls.append(args)
+        return real(fn, *args, **kwargs)
+
+    monkeypatch.setattr(calculus.executor, "run_symbolic", counting)
+    key = (sympy.Symbol("x"), SIMPLIFY_FULL)
+    first = run_symbolic_cached("diff", key, differentiate_expression, "x**3")
+    # Whitespace-equivalent input hits the cache without a worker round trip,
+    # as does the in-process function, which uses the same key.
+    assert run_symbolic_cached("diff", key, differentiate_expression, "x ** 3") == first
+    assert differentiate_expression("x**3") == first == 3 * sympy.Symbol("x") ** 2
+    assert len(calls) == 1
+    # Error strings are returned but not cached.
+    for _ in range(2):
+        assert run_symbolic_cached("test", (), report_error, "x**3") == "Error in test: x**3"
+    assert run_symbolic_cached("diff", key, differentiate_expression, "(").startswith("Error")
+    assert len(calls) == 4
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from linear_algebra.expression import evaluate, lazy, matrix_chain_order
+
+rng = np.random.default_rng(0)
+A, B, C = rng.standard_normal((30, 20)), rng.standard_normal((20, 30)), rng.standard_normal((30, 30))
+v, w = rng.standard_normal(20), rng.standard_normal(30)
+
+
+def test_matrix_chain_order():
+    cost, split = matrix_chain_order([10, 100, 5, 50])
+    assert cost == 7500 and split[0][2] == 1
+    assert matrix_chain_order([4, 4])[0] == 0
+
+
+@pytest.mark.parametrize("build, expected", [
+    (lambda: lazy(A) @ B @ C @ w, A @ B @ C @ w),
+    (lambda: (lazy(A) @ v) @ C, (A @ v) @ C),
+    (lambda: w @ (lazy(C) @ A), w @ C @ A),
+    (lambda: lazy(C) @ (lazy(A) @ v), C @ (A @ v)),
+    (lambda: (lazy(B) @ w) @ (lazy(B) @ C), (B @ w) @ (B @ C)),
+    (lambda: (lazy(A) @ v) @ (lazy(C) @ w), (A @ v) @ (C @ w)),
+    (lambda: lazy(v) @ (lazy(B) @ C), v @ B @ C),
+])
+def test_products_with_vectors(build, expected):
+    expression = build()
+    assert expression.shape == np.shape(expected)
+    assert np.allclose(expression.evaluate(), expected)
+
+
+def test_vector_intermediates_are_not_reassociated():
+    expression = (lazy(A) @ v) @ C
+    assert len(expression.args) == 2 and expression.args[0].op == "product"
+    assert expression._chain_dims() == [1, 30, 30]
+    assert len((lazy(v) @ B @ C).args) == 3
+
+
+def test_chain_order_makes_matrix_vector_products():
+    expression = lazy(C) @ C @ C @ w
+    assert expression.cost() == 3 * 30 * 30
+    assert np.allclose(expression.evaluate(), C @ C @ C @ w)
+
+
+def test_transposes_and_sums():
+    assert np.allclose((lazy(A) @ B).T.evaluate(), B.T @ A.T)
+    expression = (lazy(A) @ B).T + lazy(C).T + C
+    assert np.allclose(expression.evaluate(), (A @ B).T + C.T + C)
+    assert expression.cost() == 30 * 20 * 30
+
+
+def test_sparse_leaves_and_shape_errors():
+    S = sp.random(30, 30, density=0.1, random_state=1, format="csr")
+    assert np.allclose((lazy(S) @ C @ w).evaluate(), S @ (C @ w))
+    with pytest.raises(ValueError):
+        lazy(A) @ A
+    with pytest.raises(ValueError):
+        (lazy(v) @ v) @ A
+    assert evaluate(A) is A
+
+
+def test_transposed_sums_with_broadcast_terms():
+    square, u = rng.standard_normal((20, 20)), rng.standard_normal(20)
+    expression = (lazy(square) + u).T
+    assert np.allclose(expression.evaluate(), (square + u).T)
+    assert expression.T.evaluate().shape == (20, 20) and np.allclose(expression.T.evaluate(), square + u)
+    wide, x = rng.standard_normal((3, 4)), rng.standard_normal(4)
+    expression = (lazy(wide) + x).T
+    assert expression.shape == (4, 3)
+    assert np.allclose(expression.evaluate(), (wide + x).T)
+    assert np.allclose((expression @ wide).evaluate(), (wide + x).T @ wide)
+    assert expression.cost() == 0 and (expression @ wide).cost() == 4 * 3 * 4
+    # Same-shape terms are still transposed leaf by leaf.
+    assert (lazy(A) + A).T.op == "sum"
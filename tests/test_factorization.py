@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from linear_algebra.factorization import FactorizedMatrix, factorize
+from linear_algebra.matrix_ops import determinant, inverse, solve
+
+
+def spd(n, seed=0):
+    M = np.random.default_rng(seed).standard_normal((n, n))
+    return M @ M.T + n * np.eye(n)
+
+
+@pytest.mark.parametrize("scale", [1e-9, 1.0, 1e9])
+def test_small_scale_nonsymmetric_matrix_uses_lu(scale):
+    A = scale * np.array([[1.0, 0.0], [5.0, 1.0]])
+    F = FactorizedMatrix(A)
+    assert F.method == "lu"
+    assert np.allclose(inverse(A) @ A, np.eye(2))
+    assert np.isclose(F.det(), scale ** 2)
+
+
+@pytest.mark.parametrize("scale", [1e-9, 1.0, 1e9])
+def test_symmetric_positive_definite_uses_cholesky(scale):
+    A = scale * spd(6)
+    F = FactorizedMatrix(A)
+    assert F.method == "cholesky"
+    assert np.allclose(F.inverse() @ A, np.eye(6))
+    assert np.isclose(F.det(), np.linalg.det(A), rtol=1e-10)
+
+
+def test_rounding_level_asymmetry_still_uses_cholesky():
+    A = spd(5)
+    A[0, 1] += 1e-16 * np.abs(A).max()
+    assert FactorizedMatrix(A).method == "cholesky"
+
+
+def test_hermitian_and_indefinite_matrices():
+    rng = np.random.default_rng(1)
+    M = rng.standard_normal((4, 4)) + 1j * rng.standard_normal((4, 4))
+    H = M @ M.conj().T + 4 * np.eye(4)
+    assert FactorizedMatrix(H).method == "cholesky"
+    assert np.allclose(FactorizedMatrix(H).inverse() @ H, np.eye(4))
+    indefinite = np.array([[1.0, 2.0], [2.0, 1.0]])
+    assert FactorizedMatrix(indefinite).method == "lu"
+    with pytest.raises(ValueError):
+        FactorizedMatrix(indefinite, assume="positive_definite").method
+    with pytest.raises(ValueError):
+        FactorizedMatrix(np.array([[2.0, 1.0], [0.0, 2.0]]), assume="positive_definite").method
+
+
+def test_singularity_rank_and_reuse():
+    S = np.array([[1.0, 2.0], [2.0, 4.0 + 1e-17]])
+    assert FactorizedMatrix(S).is_singular()
+    with pytest.raises(ValueError):
+        inverse(S)
+    F = factorize(spd(4))
+    assert factorize(F) is F
+    B = np.arange(8.0).reshape(4, 2)
+    assert np.allclose(F.A @ solve(F, B), B)
+    assert np.isclose(determinant(F), np.linalg.det(F.A))
+    assert FactorizedMatrix(np.ones((3, 5))).rank() == 1
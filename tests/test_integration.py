@@ -0,0 +1,47 @@
+import math
+
+import sympy
+
+from calculus.executor import SymbolicExecutor, get_executor
+from calculus.integration import IntegralResult, definite_integral, indefinite_integral
+
+
+def test_indefinite_integral():
+    x = sympy.symbols("x")
+    assert sympy.simplify(indefinite_integral("x**2 + cos(x)") - (x ** 3 / 3 + sympy.sin(x))) == 0
+    assert indefinite_integral("(").startswith("Error")
+
+
+def test_closed_form_is_symbolic():
+    result = definite_integral("x**2", 0, 1)
+    assert result == IntegralResult(sympy.Rational(1, 3), 0.0, "symbolic")
+    assert definite_integral("a*x", 0, 1).value == sympy.Symbol("a") / 2
+
+
+def test_unevaluated_integral_falls_back_to_quadrature():
+    result = definite_integral("x**x", 0, 1)
+    assert result.method in ("gauss-kronrod", "tanh-sinh")
+    assert math.isclose(result.value, 0.7834305107121344, rel_tol=1e-10)
+
+
+def test_overrunning_integration_is_killed():
+    executor = get_executor()
+    respawns = executor.stats()["respawns"]
+    result = definite_integral("exp(sin(x)**3)*tan(x)**5", 0, 1, time_budget=0.5)
+    assert result.method != "symbolic" and math.isclose(result.value, 1.4296168895467296, rel_tol=1e-9)
+    # The worker running the abandoned attempt was replaced, not left running.
+    assert executor.stats()["respawns"] == respawns + 1
+    assert executor.stats()["busy"] == 0
+
+
+def test_free_parameters_without_closed_form_report_an_error():
+    assert definite_integral("a*sin(sin(x))", 0, 1).startswith("Error")
+
+
+def test_definite_integral_inside_executor_workers():
+    # Workers are daemonic and cannot start their own; the symbolic attempt runs inline.
+    with SymbolicExecutor(max_workers=2, timeout=60) as executor:
+        results = executor.map(definite_integral, ["x**2", "x**x"], [0, 0], [1, 1])
+    assert results[0] == IntegralResult(sympy.Rational(1, 3), 0.0, "symbolic")
+    assert results[1].method in ("gauss-kronrod", "tanh-sinh")
+    assert math.isclose(results[1].value, 0.7834305107121344, rel_tol=1e-10)
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from utils.lazy import module_names
+
+PACKAGES = ["algebra", "calculus", "linear_algebra", "number_theory", "utils"]
+
+
+def run(code):
+    result = subprocess.run([sys.executable, "-c", textwrap.dedent(code)], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def test_module_names_reads_source_without_importing(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text(textwrap.dedent("""
+        import os
+        from math import pi as PI
+        X, _hidden = 1, 2
+        def f(): pass
+        class C: pass
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if __name__ == "__main__":
+            demo = 1
+    """))
+    assert set(module_names(str(path))) == {"os", "PI", "X", "f", "C", "np"}
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_import_loads_no_submodules(package):
+    loaded = run(f"""
+        import sys, {package}
+        print(sorted(m for m in sys.modules if m.startswith("{package}.") and m != "utils.lazy"))
+    """)
+    assert loaded == "[]"
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_star_import_binds_submodules_and_their_names(package):
+    missing = run(f"""
+        import {package}
+        expected = set({package}.__all__)
+        namespace = {{}}
+        exec("from {package} import *", namespace)
+        print(sorted(expected - set(namespace)))
+    """)
+    assert missing == "[]"
+
+
+def test_star_import_binds_what_eager_imports_did():
+    output = run("""
+        import types
+        from algebra import *
+        from linear_algebra import *
+        print(isinstance(polynomials, types.ModuleType), isinstance(ring_theory, types.ModuleType),
+              isinstance(matrix_ops, types.ModuleType), callable(ntt), Polynomial.__name__)
+    """)
+    assert output == "True True True True Polynomial"
@@ -0,0 +1,48 @@
+import pytest
+from sympy import E, Rational, Symbol, pi
+
+from calculus.limits import compute_limit, limit_tier_counts
+
+
+@pytest.mark.parametrize("args, expected", [
+    (("x % 1", "x", 1, "-"), 1),
+    (("x % 1", "x", 1, "+"), 0),
+    (("atan(1/x)", "x", 0, "+"), pi / 2),
+    (("atan(1/x)", "x", 0, "-"), -pi / 2),
+    (("DiracDelta(x)", "x", 0, "+"), 0),
+    (("floor(x)", "x", 1, "-"), 0),
+    (("sign(x)", "x", 0, "+"), 1),
+    (("Heaviside(x)", "x", 0, "-"), 0),
+    (("exp(-1/x**2)", "x", 0, ""), 0),
+    (("x**x", "x", 0, "+"), 1),
+])
+def test_limits_at_discontinuities(args, expected):
+    assert compute_limit(*args) == expected
+
+
+@pytest.mark.parametrize("args, expected", [
+    (("sin(x)/x", "x", 0, ""), 1),
+    (("(x**2 - 1)/(x - 1)", "x", 1, ""), 2),
+    (("(2*x**2 + 1)/(x**2 - 3)", "x", "oo", ""), 2),
+    (("(1 + 1/x)**x", "x", "oo", ""), E),
+    (("x**2 + 3", "x", 2, ""), 7),
+    (("floor(x)", "x", Rational(3, 2), ""), 1),
+    (("DiracDelta(x - 1)", "x", 0, ""), 0),
+    (("a*x", "x", 2, ""), 2 * Symbol("a")),
+])
+def test_limits(args, expected):
+    assert compute_limit(*args) == expected
+
+
+def test_cheap_tiers_answer_continuous_points():
+    limit_tier_counts.clear()
+    compute_limit("cos(x)*exp(x) + 17", "x", 3, "")
+    compute_limit("sin(x)/x + 5", "x", 0, "")
+    assert limit_tier_counts["substitution"] == 1 and limit_tier_counts["series"] == 1
+    assert limit_tier_counts["gruntz"] == 0
+
+
+def test_step_functions_on_a_jump_skip_substitution():
+    limit_tier_counts.clear()
+    compute_limit("x % 2", "x", 4, "-")
+    assert limit_tier_counts["substitution"] == 0
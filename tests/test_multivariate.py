@@ -0,0 +1,37 @@
+import numpy as np
+import sympy
+
+from calculus.multivariate import (gradient_function, gradient_vector, hessian_function, hessian_matrix,
+                                   jacobian_function, jacobian_matrix)
+
+x, y, z = sympy.symbols("x y z")
+EXPRS = ["x**2*y + sin(z)", "exp(x*y*z)", "x*y + y*z + z*x"]
+
+
+def test_symbolic_jacobian_and_hessian_match_sympy():
+    F = sympy.Matrix([sympy.sympify(e) for e in EXPRS])
+    assert jacobian_matrix(EXPRS, "x, y, z") == F.jacobian([x, y, z])
+    f = sympy.exp(x * y * z)
+    assert hessian_matrix("exp(x*y*z)", "x, y, z") == sympy.hessian(f, [x, y, z])
+    assert gradient_vector("x*y", "x, y") == sympy.Matrix([[y, x]])
+
+
+def test_compiled_functions_match_symbolic_entries():
+    points = np.random.default_rng(0).uniform(-1, 1, (3, 200))
+    J = jacobian_function(EXPRS, "x, y, z")(*points)
+    H = hessian_function("exp(x*y*z)", "x, y, z")(*points)
+    g = gradient_function("exp(x*y*z)", "x, y, z")(*points)
+    assert J.shape == (200, 3, 3) and H.shape == (200, 3, 3) and g.shape == (200, 3)
+    reference_J = sympy.lambdify((x, y, z), jacobian_matrix(EXPRS, "x, y, z"), "numpy")
+    reference_H = sympy.lambdify((x, y, z), hessian_matrix("exp(x*y*z)", "x, y, z"), "numpy")
+    for k in range(0, 200, 37):
+        assert np.allclose(J[k], reference_J(*points[:, k]))
+        assert np.allclose(H[k], reference_H(*points[:, k]))
+    assert np.allclose(H, np.swapaxes(H, -1, -2))
+    assert np.allclose(g, J[:, 1, :])  # row 1 of the Jacobian is the gradient of exp(x*y*z)
+
+
+def test_compiled_functions_broadcast_scalars():
+    H = hessian_function("x**2*y + y**3", "x, y")(np.arange(4.0), 2.0)
+    assert H.shape == (4, 2, 2)
+    assert np.allclose(H[:, 1, 1], 12) and np.allclose(H[:, 0, 1], 2 * np.arange(4.0))
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from algebra.ntt import convolve_mod, crt_convolve, is_ntt_prime, ntt, ntt_convolve
+from algebra.polynomials import ModPolynomial
+
+
+def reference(a, b, modulus):
+    return np.convolve(np.asarray(a, dtype=object), np.asarray(b, dtype=object)) % modulus
+
+
+def test_ntt_round_trip():
+    p = 998244353
+    a = np.random.default_rng(0).integers(0, p, 256)
+    assert np.array_equal(ntt(ntt(a, p), p, inverse=True), a)
+
+
+@pytest.mark.parametrize("modulus", [998244353, 1000000007, 12, 2, 2 ** 61 - 1])
+@pytest.mark.parametrize("sizes", [(3, 5), (100, 70), (600, 900)])
+def test_convolve_mod_is_exact(modulus, sizes):
+    rng = np.random.default_rng(sizes[0])
+    a = rng.integers(0, min(modulus, 2 ** 62), sizes[0])
+    b = rng.integers(0, min(modulus, 2 ** 62), sizes[1])
+    assert np.array_equal(np.asarray(convolve_mod(a, b, modulus), dtype=object), reference(a, b, modulus))
+
+
+def test_ntt_and_crt_paths_agree_with_reference():
+    rng = np.random.default_rng(1)
+    a, b = rng.integers(0, 10 ** 9, 300), rng.integers(0, 10 ** 9, 200)
+    assert np.array_equal(ntt_convolve(a, b, 998244353), reference(a, b, 998244353))
+    assert np.array_equal(crt_convolve(a % (10 ** 9 + 7), b, 10 ** 9 + 7), reference(a, b, 10 ** 9 + 7))
+
+
+def test_is_ntt_prime():
+    assert is_ntt_prime(998244353, 2 ** 23)
+    assert not is_ntt_prime(998244353, 2 ** 24)
+    assert not is_ntt_prime(1000000007, 4)
+    assert not is_ntt_prime(15)
+
+
+def test_mod_polynomial_arithmetic():
+    p = ModPolynomial([3, 0, 5], 7)
+    q = ModPolynomial([1, 6], 7)
+    assert p.multiply(q) == ModPolynomial([3, 18, 5, 30], 7)
+    assert p.power(3) == p.multiply(p).multiply(p)
+    quotient, remainder = p.multiply(q).add(ModPolynomial([2], 7)).divide(q)
+    assert quotient == p and remainder == ModPolynomial([2], 7)
+    assert p.evaluate(2) == (3 * 4 + 5) % 7
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+import sympy
+
+from calculus.differentiation import differentiate_expression
+from calculus.numeric import adaptive_sample, compile_expression, evaluate_expression, sample_expression
+
+
+def test_compiled_expression_matches_numpy():
+    f = compile_expression("sin(x)**2 + sin(x)*cos(x)")
+    grid = np.linspace(-5, 5, 1001)
+    assert np.allclose(f(grid), np.sin(grid) ** 2 + np.sin(grid) * np.cos(grid))
+    assert compile_expression("sin(x)**2 + sin(x)*cos(x)") is f
+
+
+def test_several_variables_and_constants():
+    g = compile_expression("x*y + exp(y)", "x, y")
+    assert np.allclose(g(np.array([1.0, 2.0]), 3.0), [3 + np.exp(3), 6 + np.exp(3)])
+    assert compile_expression("7")(np.zeros(4)).shape == (4,)
+    assert np.allclose(compile_expression(sympy.sympify("2*x"))(np.arange(3)), [0, 2, 4])
+
+
+def test_compiles_differentiation_results():
+    df = compile_expression(differentiate_expression("x**3"))
+    assert np.allclose(df(np.array([1.0, 2.0])), [3, 12])
+    with pytest.raises(ValueError):
+        compile_expression("Error: not an expression")
+
+
+def test_evaluate_expression():
+    assert np.allclose(evaluate_expression("t**2", np.arange(4), "t"), [0, 1, 4, 9])
+
+
+def test_adaptive_sample_refines_where_the_graph_bends():
+    x, y = sample_expression("sin(1/x)", 0.01, 1)
+    assert np.all(np.diff(x) > 0) and np.allclose(y, np.sin(1 / x))
+    assert np.count_nonzero(x < 0.1) > np.count_nonzero(x >= 0.1)
+
+
+def test_adaptive_sample_respects_limits():
+    x, _ = adaptive_sample(lambda t: t, 0, 1)
+    assert len(x) == 65
+    x, _ = adaptive_sample(np.tan, 0, 3, max_points=300)
+    assert len(x) <= 300 and x[0] == 0 and x[-1] == 3
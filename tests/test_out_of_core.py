@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from linear_algebra.matrix_ops import add_matrices, multiply_matrices, transpose_matrix
+from linear_algebra.out_of_core import blocked_add, blocked_multiply, blocked_transpose, open_matrix
+
+rng = np.random.default_rng(0)
+
+
+def saved(directory, name, shape):
+    """A random array saved as directory/name.npy; returns (path, array)."""
+    array = rng.standard_normal(shape)
+    path = str(directory / f"{name}.npy")
+    np.save(path, array)
+    return path, array
+
+
+def test_blocked_kernels_match_numpy(tmp_path):
+    a_path, A = saved(tmp_path, "A", (300, 200))
+    b_path, B = saved(tmp_path, "B", (200, 250))
+    working_set = 2 ** 18  # forces many small tiles
+    assert np.allclose(blocked_multiply(a_path, b_path, working_set=working_set, workers=3), A @ B)
+    T = blocked_transpose(a_path, out=str(tmp_path / "T.npy"), working_set=working_set)
+    assert isinstance(T, np.memmap) and np.array_equal(T, A.T)
+    assert np.array_equal(blocked_add(a_path, A, working_set=working_set), 2 * A)
+
+
+def test_matrix_ops_block_same_shape_sums_and_matrix_products(tmp_path):
+    a_path, A = saved(tmp_path, "A", (64, 64))
+    out = str(tmp_path / "C.npy")
+    assert np.allclose(multiply_matrices(a_path, open_matrix(a_path), out=out), A @ A)
+    assert isinstance(open_matrix(out), np.memmap)
+    assert np.allclose(add_matrices(open_matrix(a_path), a_path), 2 * A)
+    assert np.array_equal(transpose_matrix(a_path), A.T)
+
+
+def test_other_memmap_operands_use_numpy(tmp_path):
+    a_path, A = saved(tmp_path, "A", (40, 30))
+    s_path, S = saved(tmp_path, "S", (5, 40, 40))
+    M = open_matrix(a_path)
+    v = rng.standard_normal(30)
+    assert np.allclose(add_matrices(M, 2.0), A + 2)
+    assert np.allclose(add_matrices(M, v), A + v)
+    assert np.allclose(multiply_matrices(M, v), A @ v)
+    assert np.allclose(multiply_matrices(s_path, A), S @ A)
+
+
+def test_output_shape_and_dtype_checks(tmp_path):
+    a_path, A = saved(tmp_path, "A", (20, 20))
+    with pytest.raises(ValueError):
+        multiply_matrices(a_path, A, out=np.empty((20, 21)))
+    with pytest.raises(TypeError):
+        multiply_matrices(a_path, A, out=np.empty((20, 20), dtype=np.int64))
+    with pytest.raises(TypeError):
+        add_matrices(a_path, A, out=np.empty((20, 20), dtype=np.int32))
+    out = np.empty((20, 20), dtype=np.float32)
+    assert multiply_matrices(a_path, A, out=out) is out and np.allclose(out, A @ A, atol=1e-4)
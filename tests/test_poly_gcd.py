@@ -0,0 +1,83 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy
+
+from algebra.poly_division import poly_divmod
+from algebra.poly_gcd import poly_gcd, poly_xgcd
+from algebra.polynomials import ModPolynomial, Polynomial
+from algebra.ring_theory import IntegerModRing
+
+x = sympy.symbols("x")
+
+
+def sympy_product(a, b):
+    return [int(c) for c in (sympy.Poly(a, x) * sympy.Poly(b, x)).all_coeffs()]
+
+
+@pytest.mark.parametrize("degrees", [(5, 3, 2), (120, 90, 70)])
+def test_mod_xgcd_bezout(degrees):
+    Zp = IntegerModRing(998244353)
+    rng = np.random.default_rng(degrees[0])
+    common = ModPolynomial(rng.integers(1, Zp.modulus, degrees[2] + 1), Zp)
+    a = common.multiply(ModPolynomial(rng.integers(1, Zp.modulus, degrees[0] + 1), Zp))
+    b = common.multiply(ModPolynomial(rng.integers(1, Zp.modulus, degrees[1] + 1), Zp))
+    g, s, t = poly_xgcd(a, b)
+    assert g.degree() == degrees[2]
+    assert s.multiply(a).add(t.multiply(b)) == g
+
+
+def test_float_gcd():
+    g = poly_gcd(Polynomial([1, 0, -1]), Polynomial([1, -3, 2]))
+    assert np.allclose(g.coefficients, [1, -1])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_rational_gcd_matches_sympy(seed):
+    rng = np.random.default_rng(seed)
+    common, a, b = (rng.integers(-20, 21, int(rng.integers(1, 9))).tolist() for _ in range(3))
+    common[0], a[0], b[0] = common[0] or 1, a[0] or 1, b[0] or 1
+    f = [Fraction(c, 3) for c in sympy_product(common, a)]
+    g = [7 * c for c in sympy_product(common, b)]
+    expected = sympy.Poly(sympy_product(common, a), x).gcd(sympy.Poly(sympy_product(common, b), x)).monic()
+    assert poly_gcd(f, g) == [Fraction(int(c.p), int(c.q)) for c in expected.all_coeffs()]
+    assert poly_xgcd(f, g)[0] == poly_gcd(f, g)
+
+
+def test_rational_gcd_with_large_coefficients():
+    rng = np.random.default_rng(0)
+    common = [int(c) for c in rng.integers(1, 10 ** 6, 31)]
+    a = [int(c) for c in rng.integers(-10 ** 6, 10 ** 6, 41)]
+    b = [int(c) for c in rng.integers(-10 ** 6, 10 ** 6, 36)]
+    g = poly_gcd(sympy_product(common, a), sympy_product(common, b))
+    assert g == [Fraction(c, common[0]) for c in common]
+
+
+def test_rational_gcd_edge_cases():
+    assert poly_gcd([1, 2], [1, 3]) == [1]
+    assert poly_gcd([0, 0], [2, 4]) == [1, 2]
+    assert poly_gcd([2, 0, -2], [3, -9, 6]) == [1, -1]
+
+
+@pytest.mark.parametrize("sizes", [(10, 4), (400, 150)])
+def test_float_poly_divmod_recovers_quotient(sizes):
+    rng = np.random.default_rng(sizes[0])
+    # A dominant leading coefficient keeps the division well conditioned.
+    g = np.concatenate([[1.0], rng.uniform(-0.5, 0.5, sizes[1] - 1) / sizes[1]])
+    q = rng.standard_normal(sizes[0] - sizes[1] + 1)
+    r = rng.standard_normal(sizes[1] - 1)
+    quotient, remainder = poly_divmod(np.polyadd(np.convolve(q, g), r), g)
+    assert np.allclose(quotient, q) and np.allclose(remainder, r)
+
+
+@pytest.mark.parametrize("sizes", [(10, 4), (400, 150)])
+def test_mod_poly_divmod_reconstructs_dividend(sizes):
+    modulus = 998244353
+    rng = np.random.default_rng(sizes[0])
+    f = rng.integers(1, modulus, sizes[0])
+    g = rng.integers(1, modulus, sizes[1])
+    q, r = poly_divmod(f, g, modulus)
+    assert len(r) < len(g)
+    product = np.polyadd(np.convolve(q.astype(object), g.astype(object)), r.astype(object)) % modulus
+    assert np.array_equal(product, f)
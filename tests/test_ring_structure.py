@@ -0,0 +1,66 @@
+from math import gcd
+
+import numpy as np
+import pytest
+
+from algebra.ring_theory import IntegerModRing, RingElement, ring_structure
+
+MODULI = list(range(1, 65)) + [97, 100, 360, 1024, 2310]
+
+
+def generated_subgroup(generators, n):
+    group, frontier = {1 % n}, [1 % n]
+    while frontier:
+        x = frontier.pop()
+        for g in generators:
+            y = x * g % n
+            if y not in group:
+                group.add(y)
+                frontier.append(y)
+    return group
+
+
+@pytest.mark.parametrize("n", MODULI)
+def test_structure_matches_brute_force(n):
+    s = IntegerModRing(n).structure
+    units = [a for a in range(n) if gcd(a, n) == 1]
+    assert s.units.tolist() == units
+    assert s.unit_group_order == len(units)
+    assert s.zero_divisors.tolist() == [a for a in range(1, n) if gcd(a, n) != 1]
+    assert s.nilpotents.tolist() == [a for a in range(n) if pow(a, n, n) == 0]
+    assert s.idempotents == [a for a in range(n) if a * a % n == a]
+    assert s.is_field == (n > 1 and len(units) == n - 1)
+    assert generated_subgroup(s.unit_group_generators, n) == set(units)
+    for a in units:
+        assert a * int(s.inverse_table[a]) % n == 1 % n
+        assert s.inverse(a) == int(s.inverse_table[a])
+
+
+def test_cyclic_unit_groups():
+    for n in range(2, 65):
+        s = ring_structure(n)
+        has_primitive_root = any(len(generated_subgroup([g], n)) == s.unit_group_order for g in s.units)
+        assert s.is_unit_group_cyclic == has_primitive_root
+        if has_primitive_root:
+            assert len(s.unit_group_generators) == 1
+
+
+def test_structure_is_shared_and_lazy():
+    assert IntegerModRing(360).structure is IntegerModRing(360).structure
+    s = ring_structure(10 ** 12 + 39)
+    assert s.is_field and s.unit_group_order == 10 ** 12 + 38
+    with pytest.raises(ValueError):
+        s.units
+
+
+def test_element_queries():
+    Z12 = IntegerModRing(12)
+    assert RingElement(5, Z12).inverse() == RingElement(5, Z12)
+    assert RingElement(6, Z12).is_nilpotent() and RingElement(4, Z12).is_idempotent()
+    assert RingElement(8, Z12).is_zero_divisor() and not RingElement(0, Z12).is_zero_divisor()
+    with pytest.raises(ValueError):
+        RingElement(4, Z12).inverse()
+    Z12.structure.inverse_table
+    with pytest.raises(ValueError):
+        Z12.inverse(4)
+    assert np.array_equal(Z12.structure.inverse_table[[1, 5, 7, 11]], [1, 5, 7, 11])
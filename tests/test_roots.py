@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from algebra.polynomials import Polynomial
+from algebra.roots import batch_roots
+
+
+def matches(found, expected, tol=1e-7):
+    """Every expected root has a found root nearby (roots compared as multisets)."""
+    found = list(found)
+    for root in expected:
+        i = int(np.argmin(np.abs(np.asarray(found) - root)))
+        if abs(found[i] - root) > tol * max(1, abs(root)):
+            return False
+        found.pop(i)
+    return True
+
+
+@pytest.mark.parametrize("method", ["aberth", "durand-kerner"])
+@pytest.mark.parametrize("degree", [1, 2, 5, 12])
+def test_batch_roots_match_companion_matrix(method, degree):
+    batch = np.random.default_rng(degree).standard_normal((200, degree + 1))
+    roots, converged, _ = batch_roots(batch, method=method)
+    assert roots.shape == (200, degree)
+    for row, found in zip(batch, roots):
+        assert matches(found, np.roots(row))
+    assert converged.mean() > 0.9
+
+
+def test_repeated_roots_fall_back_or_converge():
+    coefficients = np.poly([1, 1, 1, 2])
+    roots, _, _ = batch_roots(coefficients)
+    assert np.abs(np.polyval(coefficients, roots[0])).max() < 1e-10
+
+
+def test_complex_coefficients():
+    coefficients = np.poly([1j, -2 + 0.5j, 3])
+    roots, converged, _ = batch_roots(coefficients)
+    assert converged[0] and matches(roots[0], [1j, -2 + 0.5j, 3])
+
+
+def test_constant_rows_and_invalid_input():
+    roots, converged, steps = batch_roots([[3.0], [1.0]])
+    assert roots.shape == (2, 0) and converged.all() and steps == 0
+    with pytest.raises(ValueError):
+        batch_roots([[0.0, 1.0]])
+    with pytest.raises(ValueError):
+        batch_roots([[1.0, 1.0]], method="newton")
+
+
+def test_polynomial_roots():
+    assert matches(Polynomial([1, -6, 11, -6]).roots(), [1, 2, 3])
+    assert Polynomial([5]).roots().shape == (0,)
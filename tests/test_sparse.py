@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.sparse.linalg import aslinearoperator
+
+import linear_algebra.sparse as sparse
+from linear_algebra.sparse import (bottom_k_eigenpairs, is_diagonally_dominant, is_symmetric, iterative_solve,
+                                   sparse_rank, sparse_solve, top_k_eigenpairs)
+
+
+def laplacian(n, shift=0.0):
+    return sp.diags([-np.ones(n - 1), (2.0 + shift) * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format="csr")
+
+
+def used_method(monkeypatch, A, b, **options):
+    """Run iterative_solve and report which Krylov method it dispatched to."""
+    chosen = []
+
+    def recording(name, solver):
+        def run(*args, **kwargs):
+            chosen.append(name)
+            return solver(*args, **kwargs)
+        return run
+
+    monkeypatch.setattr(sparse, "_SOLVERS", {name: recording(name, solver)
+                                             for name, solver in sparse._SOLVERS.items()})
+    x, info = iterative_solve(A, b, **options)
+    return chosen[0], x, info
+
+
+def test_symmetric_indefinite_matrix_uses_minres(monkeypatch):
+    A = laplacian(200) - 0.5 * sp.identity(200, format="csr")
+    b = np.ones(200)
+    method, x, info = used_method(monkeypatch, A, b, maxiter=2000)
+    assert method == "minres" and info == 0
+    assert np.linalg.norm(A @ x - b) <= 1e-6 * np.linalg.norm(b)
+
+
+def test_positive_definite_matrix_uses_cg(monkeypatch):
+    A = laplacian(500, shift=1e-3)
+    b = np.ones(500)
+    method, x, info = used_method(monkeypatch, A, b, preconditioner="jacobi", maxiter=5000)
+    assert method == "cg" and info == 0
+    # Definite but not diagonally dominant: CG only when the caller says so.
+    P = laplacian(500)
+    assert used_method(monkeypatch, P, b, maxiter=5000)[0] == "minres"
+    assert used_method(monkeypatch, P, b, maxiter=5000, assume="positive_definite")[0] == "cg"
+
+
+def test_nonsymmetric_and_operator_input_use_gmres(monkeypatch):
+    A = laplacian(100, shift=1.0) + sp.diags([0.3 * np.ones(99)], [1], format="csr")
+    b = np.ones(100)
+    method, x, info = used_method(monkeypatch, A, b)
+    assert method == "gmres" and info == 0 and np.allclose(A @ x, b, atol=1e-6)
+    assert used_method(monkeypatch, aslinearoperator(laplacian(100, 1.0)), b)[0] == "gmres"
+    with pytest.raises(ValueError):
+        iterative_solve(A, b, method="sor")
+
+
+def test_structure_checks():
+    assert is_symmetric(laplacian(10)) and is_symmetric(laplacian(10).toarray())
+    assert is_diagonally_dominant(laplacian(10, shift=0.1))
+    assert not is_diagonally_dominant(laplacian(10))
+    assert not is_diagonally_dominant(-laplacian(10, shift=0.1))
+
+
+def test_direct_solve_rank_and_eigenpairs():
+    L = laplacian(300, shift=1e-3)
+    b = np.arange(300.0)
+    assert np.allclose(L @ sparse_solve(L, b), b)
+    assert sparse_rank(sp.csr_array(np.outer(np.arange(1.0, 6), np.ones(4)))) == 1
+    dense = np.linalg.eigvalsh(L.toarray())
+    assert np.allclose(top_k_eigenpairs(L, 3, return_eigenvectors=False), dense[-3:])
+    assert np.allclose(bottom_k_eigenpairs(L, 3, sigma=0, return_eigenvectors=False), dense[:3])
@@ -0,0 +1,65 @@
+import numpy as np
+
+from algebra.polynomials import Polynomial
+from algebra.sparse_polynomials import SparsePolynomial, auto_polynomial
+
+
+def random_sparse(rng, terms, degree):
+    powers = rng.choice(degree, terms, replace=False)
+    return SparsePolynomial(dict(zip(powers.tolist(), rng.integers(-5, 6, terms).tolist())))
+
+
+def as_dense(poly):
+    return poly.to_dense() if isinstance(poly, SparsePolynomial) else poly
+
+
+def as_sparse(poly):
+    return poly if isinstance(poly, SparsePolynomial) else SparsePolynomial.from_dense(poly)
+
+
+def test_multiply_matches_dense_product():
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        f, g = random_sparse(rng, 6, 60), random_sparse(rng, 4, 40)
+        expected = np.convolve(f.to_dense().coefficients, g.to_dense().coefficients)
+        assert np.array_equal(as_dense(f.multiply(g)).coefficients, np.trim_zeros(expected, 'f'))
+
+
+def test_divide_reconstructs_dividend():
+    rng = np.random.default_rng(1)
+    f, g = random_sparse(rng, 8, 80), SparsePolynomial({20: 1, 3: -2, 0: 1})
+    quotient, remainder = f.divide(g)
+    rebuilt = as_dense(as_sparse(quotient).multiply(g)).add(as_dense(remainder))
+    assert np.allclose(rebuilt.coefficients, f.to_dense().coefficients)
+    assert as_sparse(remainder).degree() < g.degree()
+
+
+def test_high_degree_product_stays_sparse():
+    p = SparsePolynomial({10 ** 6: 1, 0: 1}).multiply(SparsePolynomial({10 ** 6: 1, 0: -1}))
+    assert p == SparsePolynomial({2 * 10 ** 6: 1, 0: -1})
+
+
+def test_evaluate_and_calculus_match_dense():
+    p = SparsePolynomial({7: 2, 3: -1, 0: 4})
+    dense = p.to_dense()
+    x = np.linspace(-1.5, 1.5, 11)
+    assert np.allclose(p.evaluate(x), dense.evaluate(x))
+    assert np.allclose(as_dense(p.derivative()).coefficients, dense.derivative().coefficients)
+
+
+def test_auto_polynomial_picks_representation():
+    assert isinstance(auto_polynomial(Polynomial([1, 0, -2])), Polynomial)
+    assert isinstance(auto_polynomial(Polynomial([1] + [0] * 50 + [1])), SparsePolynomial)
+
+
+def test_mixed_representations_chain():
+    # auto_polynomial may hand back either type; arithmetic must accept both.
+    dense = Polynomial([1, 2, 3, 4])
+    sparse = SparsePolynomial({40: 1, 0: -1})
+    expected = np.polyadd(np.convolve(dense.coefficients, sparse.to_dense().coefficients), dense.coefficients)
+    for left, right in [(dense, sparse), (sparse, dense)]:
+        result = left.multiply(right).add(dense)
+        assert np.array_equal(as_dense(result).coefficients, expected)
+    assert np.array_equal(dense.subtract(sparse).coefficients, np.polysub(dense.coefficients, sparse.to_dense().coefficients))
+    quotient, remainder = Polynomial(expected).divide(sparse)
+    assert np.allclose(quotient.multiply(sparse).add(remainder).coefficients, expected)
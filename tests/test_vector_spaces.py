@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from linear_algebra.vector_spaces import (gram_matrix, orthogonality_report, orthonormalize,
+                                          pairwise_dot, project_onto_basis, row_norms)
+
+rng = np.random.default_rng(0)
+
+
+def _real(*shape):
+    return rng.standard_normal(shape)
+
+
+def _complex(*shape):
+    return rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+
+
+@pytest.mark.parametrize("make", [_real, _complex])
+@pytest.mark.parametrize("method", ["householder", "gram_schmidt"])
+def test_orthonormal_projection_matches_least_squares(make, method):
+    basis = orthonormalize(make(6, 12), method=method, block_size=4)
+    assert np.allclose(basis @ basis.conj().T, np.eye(6))
+    X = make(9, 12)
+    P = project_onto_basis(X, basis, orthonormal=True)
+    assert np.allclose(P, project_onto_basis(X, basis))
+    # The residual is orthogonal to the basis and vectors in the span are fixed.
+    assert np.allclose((X - P) @ basis.conj().T, 0)
+    inside = make(3, 6) @ basis
+    assert np.allclose(project_onto_basis(inside, basis, orthonormal=True), inside)
+
+
+def test_dependent_basis_and_rejections():
+    basis = rng.standard_normal((2, 5))
+    X = rng.standard_normal((4, 5))
+    redundant = np.vstack([basis, basis.sum(axis=0)])
+    assert np.allclose(project_onto_basis(X, redundant), project_onto_basis(X, basis))
+    with pytest.raises(ValueError):
+        orthonormalize(redundant)
+    with pytest.raises(ValueError):
+        orthonormalize(rng.standard_normal((6, 5)))
+    with pytest.raises(ValueError):
+        project_onto_basis(X[0], basis)
+
+
+def test_row_helpers():
+    X, Y = _complex(5, 3), _complex(5, 3)
+    assert np.allclose(pairwise_dot(X, Y), [np.dot(x, y) for x, y in zip(X, Y)])
+    assert np.allclose(gram_matrix(X, Y), X @ Y.T)
+    assert np.allclose(row_norms(X), np.linalg.norm(X, axis=1))
+
+
+def test_orthogonality_report_blocks(monkeypatch):
+    monkeypatch.setattr("linear_algebra.vector_spaces.REPORT_BLOCK_SIZE", 3)
+    Q = orthonormalize(rng.standard_normal((7, 10)))
+    assert orthogonality_report(Q, tol=1e-8)["orthogonal"]
+    Q[5] = Q[1]
+    report = orthogonality_report(Q, tol=1e-8)
+    assert not report["orthogonal"] and report["pairs"].tolist() == [[1, 5]]
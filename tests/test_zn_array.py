@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from algebra.ring_theory import IntegerModRing, RingElement, ZnArray
+
+MODULI = [7, 998244353, 2 ** 31 + 11, 2 ** 61 - 1, 2 ** 62 - 57, 2 ** 89 - 1]
+
+
+def residues(n, size, seed):
+    # Python ints, combined from two draws so residues cover moduli above int64.
+    rng = np.random.default_rng(seed)
+    high, low = rng.integers(0, 2 ** 62, size), rng.integers(0, 2 ** 62, size)
+    return [(int(h) * 2 ** 62 + int(l)) % n for h, l in zip(high, low)]
+
+
+@pytest.mark.parametrize("n", MODULI)
+def test_arithmetic_matches_python_ints(n):
+    ring = IntegerModRing(n)
+    a, b = residues(n, 500, 0), residues(n, 500, 1)
+    A, B = ZnArray(a, ring), ZnArray(b, ring)
+    assert [int(v) for v in (A + B).values] == [(x + y) % n for x, y in zip(a, b)]
+    assert [int(v) for v in (A * B).values] == [x * y % n for x, y in zip(a, b)]
+    assert [int(v) for v in (A - B).values] == [(x - y) % n for x, y in zip(a, b)]
+    assert [int(v) for v in (-A).values] == [-x % n for x in a]
+    assert [int(v) for v in (A ** 5).values] == [pow(x, 5, n) for x in a]
+    assert A.sum().value == sum(a) % n
+    assert A.dot(B).value == sum(x * y for x, y in zip(a, b)) % n
+    product = 1
+    for x in a:
+        product = product * x % n
+    assert A.prod().value == product
+
+
+def test_scalars_elements_and_round_trip():
+    ring = IntegerModRing(12)
+    A = ring.array([1, 5, 11, -1])
+    assert A.values.tolist() == [1, 5, 11, 11]
+    assert (A + 3).values.tolist() == [4, 8, 2, 2]
+    assert (5 - A).values.tolist() == [4, 0, 6, 6]
+    assert (A * RingElement(5, ring)).values.tolist() == [5, 1, 7, 7]
+    assert A[1] == RingElement(5, ring)
+    assert ZnArray.from_elements(A.to_elements()) == A
+    assert ring.array([]).sum() == RingElement(0, ring)
+    assert ring.array([]).prod() == RingElement(1, ring)
+
+
+def test_ring_mismatch_and_negative_power():
+    A = IntegerModRing(7).array([1, 2])
+    with pytest.raises(ValueError):
+        A + IntegerModRing(5).array([1, 2])
+    with pytest.raises(ValueError):
+        A ** -1
@@ -0,0 +1,8 @@
+from utils.lazy import lazy_package
+
+# Submodules are imported on first use of one of their names.
+__getattr__, __dir__, __all__ = lazy_package(__name__, [
+    "display",
+    "helpers",
+    "input_parser",
+])
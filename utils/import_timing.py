@@ -0,0 +1,61 @@
+import subprocess
+import sys
+import os
+
+# Statements timed by default: a cold package import, and first use of one name.
+DEFAULT_STATEMENTS = [
+    "import algebra",
+    "import calculus",
+    "import linear_algebra",
+    "import number_theory",
+    "import utils",
+    "from algebra import Complex",
+    "from calculus import differentiate_expression",
+    "from linear_algebra import determinant",
+    "from number_theory import check_prime",
+    "from algebra import *; from calculus import *; from linear_algebra import *; from number_theory import *",
+]
+
+_TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure_import_time(statement, repeat=3, cwd=None):
+    """
+    Wall-clock seconds to run `statement` in a fresh interpreter.
+
+    Each run starts a new process so nothing is already in sys.modules;
+    the best of `repeat` runs is reported to damp noise.
+
+    Args:
+        statement (str): Python code to time, e.g. "import calculus".
+        repeat (int): Number of fresh processes.
+        cwd (str, optional): Directory to run in (default: the repository root).
+
+    Returns:
+        float: Fastest time in seconds.
+    """
+    cwd = cwd or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", _TIMER.format(statement=statement)],
+                                cwd=cwd, capture_output=True, text=True, check=True).stdout
+        times.append(float(output.split()[-1]))
+    return min(times)
+
+
+def import_time_report(statements=DEFAULT_STATEMENTS, repeat=3):
+    """
+    Time each statement; returns a list of (statement, seconds).
+    """
+    return [(statement, measure_import_time(statement, repeat)) for statement in statements]
+
+
+# Example usage
+if __name__ == "__main__":
+    for statement, seconds in import_time_report():
+        print(f"{seconds * 1000:8.1f} ms  {statement}")
@@ -0,0 +1,96 @@
+import ast
+import importlib
+import os
+import sys
+
+
+def _is_main_guard(node):
+    test = node.test
+    return (isinstance(test, ast.Compare) and isinstance(test.left, ast.Name)
+            and test.left.id == "__name__")
+
+
+def _top_level_names(statements, names):
+    for node in statements:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.append(node.name)
+        elif isinstance(node, ast.Import):
+            names.extend(alias.asname or alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            names.extend(alias.asname or alias.name for alias in node.names if alias.name != "*")
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                names.extend(n.id for n in ast.walk(target) if isinstance(n, ast.Name))
+        elif isinstance(node, ast.If) and not _is_main_guard(node):
+            _top_level_names(node.body, names)
+            _top_level_names(node.orelse, names)
+        elif isinstance(node, ast.Try):
+            for block in [node.body, node.orelse, node.finalbody] + [h.body for h in node.handlers]:
+                _top_level_names(block, names)
+    return names
+
+
+def module_names(path):
+    """
+    Names a star import of the module at `path` would bind, read from its
+    source with `ast` so the module itself is not imported.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    return [name for name in _top_level_names(tree.body, []) if not name.startswith("_")]
+
+
+def lazy_package(package, submodules):
+    """
+    Make a package load its submodules on first attribute access.
+
+    Replaces a list of `from .submodule import *` lines: the names each
+    submodule defines are read from source (later submodules win, as with
+    consecutive star imports), and the submodule is imported only when one
+    of its names is first used. Use it in the package __init__ as
+
+        __getattr__, __dir__, __all__ = lazy_package(__name__, [...])
+
+    `from package import *` still works through __all__, which lists the
+    submodules themselves as well as their names, as eager imports of the
+    submodules would bind them; it loads every submodule, while importing
+    specific names loads only what they need.
+
+    Args:
+        package (str): The package's __name__.
+        submodules (list of str): Submodule names, in the old star-import order.
+
+    Returns:
+        tuple: (__getattr__, __dir__, __all__) for the package namespace.
+    """
+    module = sys.modules[package]
+    directory = os.path.dirname(module.__file__)
+    owners = {}
+    for submodule in submodules:
+        for name in module_names(os.path.join(directory, submodule + ".py")):
+            owners[name] = submodule
+
+    # Names that are also submodule names (e.g. a function `ntt` in `ntt.py`):
+    # a star import rebinds them to the function, so the function wins here too.
+    clashes = [name for name in owners if name in submodules]
+
+    def __getattr__(name):
+        if name in owners:
+            value = getattr(importlib.import_module(f"{package}.{owners[name]}"), name)
+        elif name in submodules:
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(module, name, value)
+        # Importing a submodule binds its name on the package; restore clashing names.
+        for clash in clashes:
+            owner = sys.modules.get(f"{package}.{owners[clash]}")
+            if owner is not None:
+                setattr(module, clash, getattr(owner, clash))
+        return value
+
+    def __dir__():
+        return sorted(set(module.__dict__) | set(owners) | set(submodules))
+
+    return __getattr__, __dir__, sorted(set(owners) | set(submodules))